@@ -0,0 +1,154 @@
+"""End-to-end SDK throughput and latency against a local stub API.
+
+Run from the repository root with ``python -m benchmarks.bench_api``. Each API
+scenario makes ``--calls`` calls from ``--concurrency`` threads sharing one
+client; ``webhook_verify`` runs in-process. Use ``--json`` to write
+machine-readable results and ``--compare old.json`` to print the change in
+throughput and p99 against an earlier run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from tinker import TinkerClient
+from tinker.__version__ import __version__
+from tinker.exceptions import TinkerError
+from tinker.webhook import WebhookVerifier
+
+from .bench_webhook import SECRET, build_body
+from .stub_server import StdlibSession, StubTinkerServer
+
+
+def make_session(transport: str) -> Any:
+    if transport == "stdlib":
+        return StdlibSession()
+    if transport == "requests":
+        from tinker.session import create_session
+
+        return create_session()
+    try:
+        import requests  # noqa: F401
+    except ModuleNotFoundError:
+        return StdlibSession()
+    return make_session("requests")
+
+
+def measure(call: Callable[[], Any], calls: int, concurrency: int) -> dict[str, float]:
+    def timed(_: int) -> tuple[float, bool]:
+        started = time.perf_counter()
+        try:
+            call()
+            ok = True
+        except TinkerError:
+            ok = False
+        return time.perf_counter() - started, ok
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        samples = [timed(index) for index in range(calls)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(timed, range(calls)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(sample[0] for sample in samples)
+    return {
+        "calls": calls,
+        "errors": sum(1 for sample in samples if not sample[1]),
+        "seconds": elapsed,
+        "throughput": calls / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))]
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    with StubTinkerServer(latency=args.latency, error_rate=args.error_rate, list_size=args.list_size) as server:
+        client = TinkerClient("pk_test_bench", "sk_test_bench", base_url=server.base_url, session=make_session(args.transport))
+        transactions = client.transactions()
+        subscriptions = client.subscriptions()
+        auth = client._get_auth_manager()
+        auth.get_token()
+
+        scenarios: dict[str, Callable[[], Any]] = {
+            "initiate": lambda: transactions.initiate(
+                {"amount": 1200, "currency": "KES", "gateway": "mpesa", "merchantReference": "ORDER-1"}
+            ),
+            "query": lambda: transactions.query({"reference": "TP-REF-0", "gateway": "mpesa"}),
+            "token_refresh": auth._fetch_token,
+            "list": subscriptions.list,
+        }
+        for name, call in scenarios.items():
+            measure(call, min(args.calls, 20), args.concurrency)
+            results[name] = measure(call, args.calls, args.concurrency)
+        client.close()
+
+    verifier = WebhookVerifier(SECRET)
+    body = build_body()
+    results["webhook_verify"] = measure(lambda: verifier.verify(body), args.calls * 10, 1)
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        throughput = (result["throughput"] / before["throughput"] - 1) * 100 if before["throughput"] else 0.0
+        p99 = (result["p99_ms"] / before["p99_ms"] - 1) * 100 if before["p99_ms"] else 0.0
+        print(f"{name:<16} throughput {throughput:+7.1f}%   p99 {p99:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="stub server delay per response, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub responses that are 503s")
+    parser.add_argument("--list-size", type=int, default=20, help="items returned by list endpoints")
+    parser.add_argument("--transport", choices=("auto", "requests", "stdlib"), default="auto")
+    parser.add_argument("--json", metavar="PATH", help="write machine-readable results to PATH ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="compare against results written by an earlier --json run")
+    args = parser.parse_args()
+
+    document = {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("json", "compare")},
+        "results": run(args),
+    }
+
+    if args.json == "-":
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    else:
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, indent=2)
+        for name, result in document["results"].items():
+            print(
+                f"{name:<16} {result['throughput']:10.1f} ops/s   p50 {result['p50_ms']:8.3f} ms   "
+                f"p99 {result['p99_ms']:8.3f} ms   errors {result['errors']}"
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            compare(document["results"], json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Cold-start cost of importing the SDK and making the first call.
+
+Run from the repository root with ``python -m benchmarks.bench_import``. Each
+scenario runs in a fresh interpreter; the reported time is the median of
+``--runs`` runs and excludes interpreter startup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import tinker": "import tinker",
+    "import tinker.webhook": "import tinker.webhook",
+    "webhook verify (first call)": (
+        "from tinker.webhook import WebhookHandler\n"
+        "WebhookHandler().verify_raw(b'{\"security\": {\"signature\": \"sha256=00\"}}', 'whsec')"
+    ),
+    "TinkerClient().webhooks()": (
+        "from tinker import TinkerClient\n"
+        "TinkerClient('pk_test_x', 'sk_test_x').webhooks()"
+    ),
+    "import tinker.client": "import tinker.client",
+}
+
+HARNESS = """
+import json, sys, time
+started = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed = time.perf_counter() - started
+heavy = sorted(name for name in ("requests", "asyncio", "sqlite3", "concurrent.futures") if name in sys.modules)
+print(json.dumps({{"elapsed": elapsed, "heavy_modules": heavy}}))
+"""
+
+
+def run(code: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", HARNESS.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        samples = [run(code) for _ in range(args.runs)]
+        results[name] = {
+            "median_ms": statistics.median(sample["elapsed"] for sample in samples) * 1000,
+            "heavy_modules": samples[0]["heavy_modules"],
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        loaded = ", ".join(result["heavy_modules"]) or "-"
+        print(f"{name:<30} {result['median_ms']:8.2f} ms   loads: {loaded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Memory and allocation cost of webhook and transaction models.
+
+Run from the repository root with ``python -m benchmarks.bench_models``. The
+"dict-backed" rows rebuild the previous model layout (regular dataclasses with
+a per-instance ``__dict__`` and eagerly decoded event data) for comparison.
+``--count`` sets how many objects each row builds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from tinker.models import Transaction
+from tinker.webhook import WebhookEvent, WebhookMeta, WebhookSecurity
+
+
+@dataclass(frozen=True)
+class DictPaymentEventData:
+    id: str
+    status: str
+    reference: str
+    amount: float
+    currency: str
+    channel: str
+    created_at: str
+    paid_at: str | None
+
+
+@dataclass(frozen=True)
+class DictWebhookEvent:
+    id: str
+    type: str
+    source: str
+    timestamp: str
+    data: DictPaymentEventData
+    meta: WebhookMeta
+    security: WebhookSecurity
+    raw_data: dict[str, Any]
+    raw_meta: dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "DictWebhookEvent":
+        raw_data = payload["data"]
+        raw_meta = payload["meta"]
+        security = payload["security"]
+        return cls(
+            id=str(payload["id"]),
+            type=str(payload["type"]),
+            source=str(payload["source"]),
+            timestamp=str(payload["timestamp"]),
+            data=DictPaymentEventData(
+                id=str(raw_data["id"]),
+                status=str(raw_data["status"]),
+                reference=str(raw_data["reference"]),
+                amount=float(raw_data["amount"]),
+                currency=str(raw_data["currency"]),
+                channel=str(raw_data["channel"]),
+                created_at=str(raw_data["created_at"]),
+                paid_at=None,
+            ),
+            meta=WebhookMeta(version=str(raw_meta["version"]), app_id=str(raw_meta["app_id"])),
+            security=WebhookSecurity(signature=str(security["signature"]), algorithm=str(security["algorithm"])),
+            raw_data=raw_data,
+            raw_meta=raw_meta,
+        )
+
+
+@dataclass
+class DictTransaction:
+    status: str
+    initiation_data: dict[str, Any] | None = None
+    query_data: dict[str, Any] | None = None
+    callback_data: dict[str, Any] | None = None
+
+
+def payload(index: int) -> dict[str, Any]:
+    return {
+        "id": f"evt_{index}",
+        "type": "payment.completed",
+        "source": "payment",
+        "timestamp": "2026-02-11T22:52:45Z",
+        "data": {
+            "id": f"pay_{index}",
+            "status": "success",
+            "reference": f"REF{index}",
+            "amount": 100 + index,
+            "currency": "KES",
+            "channel": "mpesa",
+            "created_at": "2026-02-11T22:52:45Z",
+        },
+        "meta": {"app_id": "app_123", "version": "1.0"},
+        "security": {"algorithm": "HMAC-SHA256", "signature": "sha256=" + "0" * 64},
+    }
+
+
+def measure(payloads: list[dict[str, Any]], build: Callable[[dict[str, Any]], Any]) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    objects = [build(item) for item in payloads]
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(objects)
+    del objects
+    return {"bytes_per_object": current / count, "us_per_object": elapsed / count * 1e6}
+
+
+def run(count: int) -> dict[str, dict[str, float]]:
+    payloads = [payload(index) for index in range(count)]
+    query_payloads = [item["data"] for item in payloads]
+
+    return {
+        "WebhookEvent (dict-backed, eager)": measure(payloads, DictWebhookEvent.from_dict),
+        "WebhookEvent (slotted, lazy)": measure(payloads, WebhookEvent.from_dict),
+        "WebhookEvent (slotted, data accessed)": measure(
+            payloads, lambda item: _touch(WebhookEvent.from_dict(item))
+        ),
+        "Transaction (dict-backed)": measure(
+            query_payloads,
+            lambda data: DictTransaction(status=str(data["status"]), query_data=data, callback_data=data),
+        ),
+        "Transaction (slotted)": measure(query_payloads, Transaction.from_dict),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000, help="objects built per row")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args.count)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(f"{name:<38} {result['bytes_per_object']:8.1f} B/object {result['us_per_object']:8.2f} us/object")
+
+
+def _touch(event: WebhookEvent) -> WebhookEvent:
+    event.data
+    return event
+
+
+if __name__ == "__main__":
+    main()
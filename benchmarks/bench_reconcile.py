@@ -0,0 +1,113 @@
+"""Compare reconciliation totals over typed events with the streaming aggregator.
+
+Run from the repository root with ``python -m benchmarks.bench_reconcile``.
+Each row is the best of ``--repeat`` runs over ``--count`` events.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+from tinker.reconcile import ReconciliationAggregator
+from tinker.webhook import WebhookEvent
+
+CURRENCIES = ("KES", "USD", "NGN", "GHS")
+STATUSES = ("completed", "pending", "failed")
+
+
+def build_events(count: int, seed: int = 0) -> list[WebhookEvent]:
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        amount = rng.randint(100, 100_000)
+        events.append(
+            WebhookEvent.from_dict(
+                {
+                    "id": f"evt_{index}",
+                    "type": "settlement.completed",
+                    "source": "settlement",
+                    "timestamp": "2026-02-11T22:52:45Z",
+                    "data": {
+                        "id": f"set_{index}",
+                        "status": rng.choice(STATUSES),
+                        "amount": amount,
+                        "net_amount": amount * 0.97,
+                        "currency": rng.choice(CURRENCIES),
+                        "settlement_date": f"2026-01-{rng.randint(1, 31):02d}",
+                        "created_at": "2026-01-01T00:00:00Z",
+                    },
+                }
+            )
+        )
+    return events
+
+
+def typed_loop(events: list[WebhookEvent]) -> dict[tuple[str, str, str], list[float]]:
+    # Baseline: build each typed SettlementEventData and sum into a dict of lists.
+    totals: dict[tuple[str, str, str], list[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    for event in events:
+        data = event.data
+        sums = totals[(data.currency, data.status, data.settlement_date[:10])]
+        sums[0] += 1
+        sums[1] += data.amount
+        sums[2] += data.net_amount or 0.0
+    return totals
+
+
+def aggregator(events: list[WebhookEvent], use_numpy: bool, batch_size: int) -> Any:
+    aggregate = ReconciliationAggregator(batch_size=batch_size, use_numpy=use_numpy)
+    aggregate.add_many(events)
+    return aggregate.groups()
+
+
+def measure(call: Callable[[list[WebhookEvent]], Any], count: int, repeat: int, seed: int) -> float:
+    """Best nanoseconds per event of ``call``."""
+    timings = []
+    for _ in range(repeat):
+        # Fresh events per run: WebhookEvent caches its typed data after first access.
+        events = build_events(count, seed)
+        started = time.perf_counter()
+        call(events)
+        timings.append(time.perf_counter() - started)
+    return min(timings) / count * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200_000, help="events per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per row; the best is reported")
+    parser.add_argument("--batch-size", type=int, default=65536, help="aggregator batch size with NumPy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401
+    except ModuleNotFoundError:
+        has_numpy = False
+    else:
+        has_numpy = True
+
+    rows: dict[str, Callable[[list[WebhookEvent]], Any]] = {
+        "typed events + dict": typed_loop,
+        "aggregator (pure Python)": lambda events: aggregator(events, False, args.batch_size),
+    }
+    if has_numpy:
+        rows["aggregator (numpy)"] = lambda events: aggregator(events, True, args.batch_size)
+    results = {name: measure(call, args.count, args.repeat, args.seed) for name, call in rows.items()}
+
+    if args.json:
+        print(json.dumps({name: {"ns_per_event": value} for name, value in results.items()}, indent=2))
+        return
+
+    for name, value in results.items():
+        print(f"{name:<28} {value:8.1f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare webhook verification paths.
+
+Run from the repository root with ``python -m benchmarks.bench_webhook``. Each
+row is the best of ``--repeat`` runs of ``--number`` operations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import timeit
+
+from tinker.webhook import WebhookHandler, WebhookVerifier
+
+SECRET = "whsec_benchmark"
+
+
+def build_body(signed: bool = True) -> bytes:
+    payload = {
+        "id": "evt_123",
+        "type": "payment.completed",
+        "source": "payment",
+        "timestamp": "2026-02-11T22:52:45Z",
+        "data": {
+            "id": "pay_1",
+            "status": "success",
+            "reference": "REF1",
+            "amount": 100,
+            "currency": "KES",
+            "channel": "mpesa",
+            "created_at": "2026-02-11T22:52:45Z",
+            "paid_at": "2026-02-11T22:53:01Z",
+        },
+        "meta": {"app_id": "app_123", "version": "1.0", "gateway": "mpesa"},
+    }
+    if signed:
+        signing_input = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        signature = hmac.new(SECRET.encode("utf-8"), signing_input, hashlib.sha256).hexdigest()
+        payload["security"] = {"algorithm": "HMAC-SHA256", "signature": f"sha256={signature}"}
+    return json.dumps(payload).encode("utf-8")
+
+
+def legacy_handle_then_verify(handler: WebhookHandler, body: bytes) -> None:
+    # Baseline integration: handle(text) and verify_signature(text) each built a
+    # typed WebhookEvent from the string before hashing.
+    text = body.decode("utf-8")
+    handler.handle(text)
+    handler.verify_signature(handler.handle(text), SECRET)
+
+
+def measure(stmt, number: int, repeat: int) -> float:
+    """Best microseconds per call of ``stmt``."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e6
+
+
+def run(number: int, repeat: int, batch_size: int) -> dict[str, float]:
+    handler = WebhookHandler()
+    body = build_body()
+    forged = body.replace(b"sha256=", b"sha256=00")
+    unsigned = build_body(signed=False)
+
+    assert handler.verify_raw(body, SECRET)
+    assert not handler.verify_raw(forged, SECRET)
+
+    # Secret rotation: the body is signed with the oldest of three accepted secrets.
+    keyring = ["whsec_next", "whsec_current", SECRET]
+    verifier = WebhookVerifier(keyring)
+    batch = [body] * batch_size
+
+    return {
+        "handle(str) + verify_signature(str)": measure(
+            lambda: legacy_handle_then_verify(handler, body), number, repeat
+        ),
+        "handle_verified(bytes)": measure(lambda: handler.handle_verified(body, SECRET), number, repeat),
+        "verify_raw(bytes) valid": measure(lambda: handler.verify_raw(body, SECRET), number, repeat),
+        "verify_raw(bytes) forged": measure(lambda: handler.verify_raw(forged, SECRET), number, repeat),
+        "verify_raw(bytes) unsigned": measure(lambda: handler.verify_raw(unsigned, SECRET), number, repeat),
+        "verify_signature per secret (3)": measure(
+            lambda: any(handler.verify_signature(body, secret) for secret in keyring), number, repeat
+        ),
+        "WebhookVerifier keyring (3)": measure(lambda: verifier.verify(body), number, repeat),
+        f"WebhookVerifier.verify_many x{batch_size}": measure(
+            lambda: verifier.verify_many(batch), max(number // batch_size, 1), repeat
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20000, help="operations per timed run")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per row; the best is reported")
+    parser.add_argument("--batch-size", type=int, default=100, help="bodies per verify_many call")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat, args.batch_size)
+
+    if args.json:
+        print(json.dumps({name: {"us_per_op": value} for name, value in results.items()}, indent=2))
+        return
+
+    for name, value in results.items():
+        print(f"{name:<40} {value:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
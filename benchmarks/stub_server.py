@@ -0,0 +1,233 @@
+"""In-process stub of the Tinker API for benchmarks.
+
+``StubTinkerServer`` serves the auth, payment and subscription endpoints on a
+local port using the standard ``success``/``data``/``meta`` envelope. Each
+response can be delayed by ``latency`` seconds, a fraction ``error_rate`` of
+API responses are 503 errors, and list endpoints return ``list_size`` items.
+``StdlibSession`` is a keep-alive ``http.client`` transport with the session
+interface the SDK expects, for environments without ``requests``.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from tinker import endpoints
+
+
+class StubTinkerServer:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        list_size: int = 20,
+        token_ttl: int = 3600,
+        seed: int | None = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.list_size = list_size
+        self.token_ttl = token_ttl
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> StubTinkerServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-tinker-api", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def respond(self, method: str, path: str) -> tuple[int, dict[str, Any]]:
+        route = path.split("?", 1)[0]
+        if route.startswith(endpoints.API_VERSION_PATH):
+            route = route[len(endpoints.API_VERSION_PATH):]
+        with self._lock:
+            self.requests[f"{method} {route}"] += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return 503, _envelope(None, error={"code": "UNAVAILABLE", "message": "Stub server error"})
+
+        if method == "POST" and route == endpoints.AUTH_TOKEN_PATH:
+            return 200, _envelope({"token": uuid.uuid4().hex, "expires_in": self.token_ttl})
+        if method == "POST" and route == endpoints.PAYMENT_INITIATE_PATH:
+            return 200, _envelope(
+                {
+                    "paymentReference": f"TP-{uuid.uuid4().hex[:12]}",
+                    "status": "pending",
+                    "authorizationUrl": "https://checkout.example/pay",
+                }
+            )
+        if method == "POST" and route == endpoints.PAYMENT_QUERY_PATH:
+            return 200, _envelope(_payment(0))
+        if method == "GET" and route == endpoints.SUBSCRIPTION_PLANS_PATH:
+            return 200, _envelope([_plan(index) for index in range(self.list_size)])
+        if method == "GET" and route == endpoints.SUBSCRIPTION_BASE_PATH:
+            return 200, _envelope([_subscription(index) for index in range(self.list_size)])
+        return 404, _envelope(None, error={"code": "NOT_FOUND", "message": f"No route for {method} {route}"})
+
+
+def _handler_for(stub: StubTinkerServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._serve("GET")
+
+        def do_POST(self) -> None:
+            self._serve("POST")
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _serve(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            status, body = stub.respond(method, self.path)
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    return Handler
+
+
+def _envelope(data: Any, error: dict[str, str] | None = None) -> dict[str, Any]:
+    return {
+        "success": error is None,
+        "data": data,
+        "error": error,
+        "meta": {
+            "request_id": str(uuid.uuid4()),
+            "timestamp": "2026-02-11T22:52:45Z",
+            "environment": "sandbox",
+        },
+    }
+
+
+def _payment(index: int) -> dict[str, Any]:
+    return {
+        "id": f"pay_{index}",
+        "reference": f"TP-REF-{index}",
+        "status": "success",
+        "amount": 1200,
+        "currency": "KES",
+        "channel": "mpesa",
+        "created_at": "2026-02-11T22:52:45Z",
+        "paid_at": "2026-02-11T22:53:01Z",
+    }
+
+
+def _plan(index: int) -> dict[str, Any]:
+    return {"id": f"plan_{index}", "name": f"Plan {index}", "amount": 1000 + index, "currency": "KES", "interval": "month"}
+
+
+def _subscription(index: int) -> dict[str, Any]:
+    return {
+        "id": f"sub_{index}",
+        "plan_id": f"plan_{index % 5}",
+        "external_customer_id": f"cust_{index}",
+        "status": "active",
+        "current_period_start": "2026-02-01T00:00:00Z",
+        "current_period_end": "2026-03-01T00:00:00Z",
+    }
+
+
+class StdlibResponse:
+    def __init__(self, status_code: int, body: bytes, headers: dict[str, str]) -> None:
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode("utf-8")
+        self.headers = headers
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class StdlibSession:
+    """Minimal keep-alive HTTP session (one connection per thread)."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        timeout: Any = None,
+    ) -> StdlibResponse:
+        body = None if json is None else _json_dumps(json)
+        return self._send(method, url, body, headers or {}, timeout)
+
+    def post(self, url: str, data: Any = None, headers: dict[str, str] | None = None, timeout: Any = None) -> StdlibResponse:
+        body = urlencode(data).encode("utf-8") if isinstance(data, dict) else data
+        return self._send("POST", url, body, headers or {}, timeout)
+
+    def _send(self, method: str, url: str, body: bytes | None, headers: dict[str, str], timeout: Any) -> StdlibResponse:
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        for reconnect in (False, True):
+            connection = self._connection(parts.netloc, read_timeout, reconnect)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if reconnect:
+                    raise
+                continue
+            return StdlibResponse(response.status, payload, dict(response.getheaders()))
+        raise AssertionError("unreachable")
+
+    def _connection(self, netloc: str, timeout: float | None, reconnect: bool) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get(netloc)
+        if connection is None or reconnect:
+            if connection is not None:
+                connection.close()
+            connection = connections[netloc] = http.client.HTTPConnection(netloc, timeout=timeout)
+        return connection
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import unittest
+
+from tinker import AsyncTinkerClient, Timeouts, endpoints
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self._body
+
+
+class FakeAsyncSession:
+    def __init__(self):
+        self.calls = []
+
+    async def post(self, url, data=None, headers=None, timeout=None):
+        self.calls.append(("POST", url, data))
+        await asyncio.sleep(0)
+        return FakeResponse(
+            200,
+            {
+                "success": True,
+                "data": {"token": "abc123", "expires_in": 3600},
+                "meta": {"request_id": "auth-request", "environment": "sandbox"},
+            },
+        )
+
+    async def request(self, method, url, headers=None, json=None, timeout=None):
+        self.calls.append((method, url, json))
+        await asyncio.sleep(0)
+        if method == "GET":
+            return FakeResponse(200, {"success": True, "data": [{"id": "plan_1"}], "meta": {}})
+        return FakeResponse(
+            200,
+            {
+                "success": True,
+                "data": {"id": "pay_1", "reference": json["reference"], "status": "success"},
+                "meta": {"request_id": "meta-request"},
+            },
+        )
+
+
+class AsyncClientTests(unittest.TestCase):
+    def test_concurrent_queries_share_one_token_fetch(self):
+        session = FakeAsyncSession()
+        client = AsyncTinkerClient("pk_test_123", "sk_test_123", session=session)
+
+        async def run():
+            return await asyncio.gather(
+                *(client.transactions().query({"reference": f"REF{i}"}) for i in range(20))
+            )
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(result.is_successful() for result in results))
+        self.assertEqual(results[7].query_data["reference"], "REF7")
+        auth_calls = [call for call in session.calls if call[1].endswith("/auth/token")]
+        self.assertEqual(len(auth_calls), 1)
+        self.assertEqual(client.get_last_auth_meta().request_id, "auth-request")
+        self.assertEqual(client.transactions().get_last_meta().request_id, "meta-request")
+
+    def test_requests_use_configured_timeouts(self):
+        class TimeoutRecordingSession(FakeAsyncSession):
+            def __init__(self):
+                super().__init__()
+                self.timeouts = {}
+
+            async def post(self, url, data=None, headers=None, timeout=None):
+                self.timeouts[url] = timeout
+                return await super().post(url, data=data, headers=headers, timeout=timeout)
+
+            async def request(self, method, url, headers=None, json=None, timeout=None):
+                self.timeouts[url] = timeout
+                return await super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+        session = TimeoutRecordingSession()
+        timeouts = Timeouts(connect=2, read=10, endpoints={endpoints.AUTH_TOKEN_PATH: (1, 3)})
+        client = AsyncTinkerClient("pk_test_123", "sk_test_123", session=session, timeouts=timeouts)
+
+        asyncio.run(client.transactions().query({"reference": "REF1"}))
+
+        self.assertEqual(session.timeouts[client.config.auth_url], (1, 3))
+        self.assertEqual(session.timeouts[client.config.base_url + endpoints.PAYMENT_QUERY_PATH.lstrip("/")], (2, 10))
+
+    def test_list_plans(self):
+        client = AsyncTinkerClient("pk_test_123", "sk_test_123", session=FakeAsyncSession())
+        plans = asyncio.run(client.subscriptions().list_plans())
+        self.assertEqual(plans, [{"id": "plan_1"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import copy
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from tinker import TinkerClient
+from tinker.cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+
+from test_sdk import FakeResponse, FakeSession
+
+PLANS = [{"id": "plan_1", "name": "Basic"}]
+
+
+class PlansSession(FakeSession):
+    def __init__(self, etag='"v1"'):
+        super().__init__()
+        self.etag = etag
+        self.conditional = []
+
+    def request(self, method, url, headers=None, json=None, timeout=None):
+        self.calls.append((method, url, json))
+        if method == "POST":
+            return FakeResponse(200, {"success": True, "data": {"id": "plan_2"}})
+        self.conditional.append((headers or {}).get("If-None-Match"))
+        if self.etag is not None and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(304, None)
+        return FakeResponse(200, {"success": True, "data": copy.deepcopy(PLANS)}, headers={"ETag": self.etag} if self.etag else None)
+
+
+def gets(session):
+    return sum(1 for call in session.calls if call[0] == "GET")
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_fresh_entries_are_served_from_cache_as_copies(self):
+        session = PlansSession()
+        cache = ResponseCache()
+        subs = TinkerClient("pk_test_123", "sk_test_123", session=session, cache=cache).subscriptions()
+
+        first = subs.list_plans()
+        first[0]["name"] = "mutated"
+        self.assertEqual(subs.list_plans(), PLANS)
+        self.assertEqual(gets(session), 1)
+        self.assertEqual((cache.stats().hits, cache.stats().misses), (1, 1))
+
+    def test_stale_entries_are_revalidated_with_etag(self):
+        session = PlansSession()
+        cache = ResponseCache()
+        subs = TinkerClient("pk_test_123", "sk_test_123", session=session, cache=cache).subscriptions()
+
+        subs.list_plans()
+        with mock.patch("tinker.cache.time.time", return_value=time.time() + 301):
+            self.assertEqual(subs.list_plans(), PLANS)
+        self.assertEqual(session.conditional, [None, '"v1"'])
+        self.assertEqual(cache.stats().revalidations, 1)
+
+    def test_writes_invalidate_cached_plans(self):
+        session = PlansSession()
+        cache = ResponseCache()
+        subs = TinkerClient("pk_test_123", "sk_test_123", session=session, cache=cache).subscriptions()
+
+        subs.list_plans()
+        subs.create_plan({"name": "Pro"})
+        subs.list_plans()
+        self.assertEqual(gets(session), 2)
+        self.assertEqual(cache.stats().invalidations, 1)
+
+    def test_uncached_endpoints_and_other_credentials_bypass_cache(self):
+        session = PlansSession()
+        cache = ResponseCache(backend=MemoryCacheBackend(max_entries=4))
+        TinkerClient("pk_test_123", "sk_test_123", session=session, cache=cache).subscriptions().list_plans()
+        other = TinkerClient("pk_test_456", "sk_test_456", session=session, cache=cache).subscriptions()
+
+        other.list_plans()
+        other.list()
+        other.list()
+        self.assertEqual(gets(session), 4)
+        self.assertEqual(len(cache.backend), 2)
+
+    def test_sqlite_backend_shares_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.db")
+            session = PlansSession(etag=None)
+            for _ in range(2):
+                cache = ResponseCache(backend=SQLiteCacheBackend(path))
+                subs = TinkerClient("pk_test_123", "sk_test_123", session=session, cache=cache).subscriptions()
+                self.assertEqual(subs.list_plans(), PLANS)
+            self.assertEqual(gets(session), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
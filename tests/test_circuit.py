@@ -0,0 +1,114 @@
+import unittest
+from unittest import mock
+
+from tinker import TinkerClient
+from tinker.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from tinker.exceptions import ApiError, CircuitOpenError, NetworkError
+
+from test_sdk import FakeResponse, FakeSession
+
+
+class FailingSession(FakeSession):
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = list(statuses)
+
+    def request(self, method, url, headers=None, json=None, timeout=None):
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            self.calls.append((method, url, json))
+            return FakeResponse(status, {"success": False, "error": {"message": "down"}})
+        return super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+
+def api_calls(session):
+    return [call for call in session.calls if "/auth/" not in call[1]]
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_after_threshold_and_fails_fast_per_endpoint(self):
+        transitions = []
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60, on_state_change=lambda *t: transitions.append(t))
+        session = FailingSession([503, 503])
+        transactions = TinkerClient("pk_test_123", "sk_test_123", session=session, circuit_breaker=breaker).transactions()
+
+        for _ in range(2):
+            with self.assertRaises(ApiError):
+                transactions.query({"reference": "P1"})
+        with self.assertRaises(CircuitOpenError) as raised:
+            transactions.query({"reference": "P1"})
+
+        self.assertIsInstance(raised.exception, NetworkError)
+        self.assertEqual(raised.exception.key, "query")
+        self.assertEqual(len(api_calls(session)), 2)
+        self.assertEqual(transitions, [("query", CLOSED, OPEN)])
+        self.assertEqual(breaker.stats()["query"].rejected, 1)
+
+        transactions.initiate({"amount": 100})
+        self.assertEqual(breaker.state("initiate"), CLOSED)
+
+    def test_half_open_probe_closes_or_reopens(self):
+        transitions = []
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, on_state_change=lambda *t: transitions.append(t))
+        session = FailingSession([500, 500])
+        transactions = TinkerClient("pk_test_123", "sk_test_123", session=session, circuit_breaker=breaker).transactions()
+
+        with self.assertRaises(ApiError):
+            transactions.query({"reference": "P1"})
+        with mock.patch("tinker.circuit.time.monotonic", return_value=10**9):
+            with self.assertRaises(ApiError):
+                transactions.query({"reference": "P1"})
+        self.assertEqual(breaker.state("query"), OPEN)
+        with mock.patch("tinker.circuit.time.monotonic", return_value=2 * 10**9):
+            transactions.query({"reference": "P1"})
+
+        self.assertEqual(
+            transitions,
+            [
+                ("query", CLOSED, OPEN),
+                ("query", OPEN, HALF_OPEN),
+                ("query", HALF_OPEN, OPEN),
+                ("query", OPEN, HALF_OPEN),
+                ("query", HALF_OPEN, CLOSED),
+            ],
+        )
+
+    def test_half_open_admits_limited_probes(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, probe_timeout=60)
+        breaker.record_failure("query")
+        breaker.before_call("query")
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call("query")
+        breaker.record_status("query", 404)
+        self.assertEqual(breaker.state("query"), CLOSED)
+
+    def test_probe_that_never_reports_is_replaced_after_probe_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        with mock.patch("tinker.circuit.time.monotonic", return_value=1000.0):
+            breaker.record_failure("query")
+        with mock.patch("tinker.circuit.time.monotonic", return_value=1031.0):
+            breaker.before_call("query")
+        with mock.patch("tinker.circuit.time.monotonic", return_value=1050.0):
+            with self.assertRaises(CircuitOpenError) as raised:
+                breaker.before_call("query")
+        self.assertAlmostEqual(raised.exception.retry_after, 11.0)
+
+        with mock.patch("tinker.circuit.time.monotonic", return_value=1062.0):
+            breaker.before_call("query")
+        breaker.record_success("query")
+        self.assertEqual(breaker.state("query"), CLOSED)
+
+    def test_auth_failures_trip_the_auth_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        session = FakeSession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, circuit_breaker=breaker)
+        with mock.patch.object(session, "post", side_effect=OSError("timeout")):
+            with self.assertRaises(NetworkError):
+                client.transactions().query({"reference": "P1"})
+        with self.assertRaises(CircuitOpenError):
+            client.transactions().query({"reference": "P1"})
+        self.assertEqual(breaker.state("auth"), OPEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import random
+import struct
+import unittest
+
+from tinker.codec import JsonCodec, OrjsonCodec, decode_response
+from tinker.webhook import WebhookHandler
+
+from test_webhook import SECRET, signed_body
+
+try:
+    ORJSON = OrjsonCodec()
+except ModuleNotFoundError:  # pragma: no cover
+    ORJSON = None
+
+TRICKY_VALUES = [
+    {"amount": 2**64, "fee": -(2**63) - 1, "count": 2**63, "id": "12345678901234567890"},
+    {"small": 1e-05, "tiny": 5e-324, "big": 1e16, "huge": 1.5e300, "plain": 100.5, "zero": -0.0},
+    {"text": "Café   \x00\x1f\x7f 😀 \"quoted\" \\ /"},
+    {"nested": [{"a": [1.0, 2.5e-7, True, None]}, (1, 2)], 1: "int key"},
+    {"nan": float("nan"), "inf": float("inf")},
+]
+
+
+class Response:
+    def __init__(self, content):
+        self.status_code = 200
+        self.content = content
+
+    @property
+    def text(self):
+        raise AssertionError("text should not be decoded")
+
+    def json(self):
+        raise AssertionError("json() should not be called")
+
+
+@unittest.skipIf(ORJSON is None, "orjson is not installed")
+class OrjsonCodecTests(unittest.TestCase):
+    def test_canonical_output_matches_stdlib(self):
+        stdlib = JsonCodec()
+        for value in TRICKY_VALUES:
+            self.assertEqual(ORJSON.canonical(value), stdlib.canonical(value))
+
+        rng = random.Random(7)
+        for _ in range(2000):
+            number = struct.unpack("d", struct.pack("Q", rng.getrandbits(64)))[0]
+            self.assertEqual(ORJSON.canonical({"v": [number]}), stdlib.canonical({"v": [number]}))
+
+    def test_decoded_values_match_stdlib(self):
+        for raw in (b'{"a": 123456789012345678901234567890}', b'{"a": NaN}', b'[1e400, "\\ud800"]', "[0.1, 1E5]"):
+            self.assertEqual(repr(ORJSON.loads(raw)), repr(json.loads(raw)))
+        with self.assertRaises(ValueError):
+            ORJSON.loads(b"{not json")
+
+    def test_webhooks_with_edge_values_verify(self):
+        body = signed_body(data={"id": "pay_1", "status": "success", "reference": "R", "amount": 2**70, "fee": 1e-05})
+        self.assertTrue(WebhookHandler(codec=ORJSON).verify_raw(body, SECRET))
+        self.assertTrue(WebhookHandler(codec=JsonCodec()).verify_raw(body, SECRET))
+
+
+class DecodeResponseTests(unittest.TestCase):
+    def test_body_is_decoded_once_from_bytes(self):
+        self.assertEqual(decode_response(Response(b'{"success": true}'), JsonCodec()), {"success": True})
+        self.assertEqual(decode_response(Response(b""), JsonCodec()), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from tinker.dedup import MemoryDedupStore, SQLiteDedupStore
+from tinker.exceptions import DuplicateEventError, InvalidPayloadError, InvalidSignatureError
+from tinker.webhook import WebhookEvent, WebhookHandler
+
+from test_webhook import SECRET, signed_body
+
+
+class DedupTests(unittest.TestCase):
+    def test_duplicates_are_dropped_before_typed_parsing(self):
+        handler = WebhookHandler(dedup_store=MemoryDedupStore())
+        body = signed_body()
+
+        self.assertEqual(handler.handle_verified(body, SECRET).id, "evt_123")
+        with mock.patch.object(WebhookEvent, "from_dict") as from_dict:
+            with self.assertRaises(DuplicateEventError):
+                handler.handle_verified(body, SECRET)
+            from_dict.assert_not_called()
+
+        self.assertEqual((handler.dedup_stats().hits, handler.dedup_stats().misses), (1, 1))
+
+        handler.forget("evt_123")
+        handler.handle(body)
+
+    def test_failed_parse_does_not_consume_event_id(self):
+        handler = WebhookHandler(dedup_store=MemoryDedupStore())
+        with self.assertRaises(InvalidPayloadError):
+            handler.handle_verified(signed_body(source="unknown"), SECRET)
+        handler.handle_verified(signed_body(), SECRET)
+
+    def test_unverified_bodies_do_not_claim_event_ids(self):
+        handler = WebhookHandler(dedup_store=MemoryDedupStore())
+        forged = signed_body(secret="whsec_forged")
+
+        handler.handle(forged)
+        handler.on()(lambda event: None)
+        handler.dispatch(forged)
+        with self.assertRaises(InvalidSignatureError):
+            handler.handle_verified(forged, SECRET)
+
+        self.assertEqual(handler.handle_verified(signed_body(), SECRET).id, "evt_123")
+        self.assertEqual(handler.dedup_stats().hits, 0)
+
+    def test_memory_store_bounds_and_expiry(self):
+        store = MemoryDedupStore(max_entries=2, ttl=60)
+        self.assertTrue(store.add("a"))
+        self.assertTrue(store.add("b"))
+        self.assertFalse(store.add("a"))
+        self.assertTrue(store.add("c"))
+        self.assertEqual(len(store), 2)
+        self.assertTrue(store.add("b"))
+
+        with mock.patch("tinker.dedup.time.monotonic", return_value=time.monotonic() + 120):
+            self.assertTrue(store.add("a"))
+            self.assertEqual(len(store), 1)
+
+    def test_sqlite_store_is_shared_between_handlers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.db")
+            first = WebhookHandler(dedup_store=SQLiteDedupStore(path))
+            second = WebhookHandler(dedup_store=SQLiteDedupStore(path))
+
+            first.handle_verified(signed_body(), SECRET)
+            with self.assertRaises(DuplicateEventError):
+                second.handle_verified(signed_body(), SECRET)
+
+            store = SQLiteDedupStore(path, ttl=-1)
+            self.assertTrue(store.add("evt_expired"))
+            self.assertTrue(store.add("evt_expired"))
+
+
+if __name__ == "__main__":
+    unittest.main()
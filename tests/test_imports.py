@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from tinker import TinkerClient
+
+
+class LazyLoadingTests(unittest.TestCase):
+    def test_webhook_import_path_stays_minimal(self):
+        code = (
+            "import sys\n"
+            "from tinker.webhook import WebhookHandler\n"
+            "import tinker\n"
+            "heavy = ('requests', 'asyncio', 'sqlite3', 'concurrent.futures', 'tinker.client', 'tinker.api')\n"
+            "print(','.join(name for name in heavy if name in sys.modules))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, check=True, capture_output=True, text=True)
+        self.assertEqual(output.stdout.strip(), "")
+
+    def test_client_creates_session_on_first_api_use(self):
+        with mock.patch("tinker.client.create_session") as create_session:
+            client = TinkerClient("pk_test_123", "sk_test_123")
+            client.webhooks()
+            self.assertIsNone(client.get_last_auth_meta())
+            create_session.assert_not_called()
+
+            client.transactions()
+            create_session.assert_called_once_with(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
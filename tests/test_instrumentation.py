@@ -0,0 +1,119 @@
+import time
+import unittest
+from unittest import mock
+
+from tinker import RetryPolicy, TinkerClient
+from tinker import endpoints
+from tinker.exceptions import NetworkError
+from tinker.instrumentation import RequestHooks
+from tinker.rate_limit import RateLimit, RateLimiter
+
+from test_sdk import FakeResponse, FakeSession
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, info):
+        self.events.append(("before", info.method, info.endpoint, info.attempt))
+
+    def on_retry(self, info, delay):
+        self.events.append(("retry", info.endpoint, info.status_code))
+
+    def after_response(self, info):
+        self.events.append(("after", info.endpoint, info.status_code, info.request_id))
+
+    def on_error(self, info):
+        self.events.append(("error", info.endpoint, type(info.error).__name__))
+
+
+class FlakySession(FakeSession):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    def request(self, method, url, headers=None, json=None, timeout=None):
+        if self.failures:
+            self.failures -= 1
+            self.calls.append((method, url, json))
+            return FakeResponse(503, {"success": False, "error": {"message": "busy"}})
+        return super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+
+class InstrumentationTests(unittest.TestCase):
+    def test_hooks_see_auth_retries_and_request_id(self):
+        hooks = RecordingHooks()
+        client = TinkerClient(
+            "pk_test_123",
+            "sk_test_123",
+            session=FlakySession(failures=1),
+            hooks=[hooks],
+            retry_policy=RetryPolicy(max_attempts=2, backoff_base=0, jitter=False),
+        )
+        client.transactions().query({"reference": "P123"})
+
+        self.assertEqual(
+            hooks.events,
+            [
+                ("before", "POST", endpoints.AUTH_TOKEN_PATH, 1),
+                ("after", endpoints.AUTH_TOKEN_PATH, 200, "5b5b3526-8dc1-4f7b-9bb8-cdbfc8df4984"),
+                ("before", "POST", endpoints.PAYMENT_QUERY_PATH, 1),
+                ("retry", endpoints.PAYMENT_QUERY_PATH, 503),
+                ("before", "POST", endpoints.PAYMENT_QUERY_PATH, 2),
+                ("after", endpoints.PAYMENT_QUERY_PATH, 200, "meta-request"),
+            ],
+        )
+
+    def test_metrics_are_grouped_by_endpoint(self):
+        client = TinkerClient("pk_test_123", "sk_test_123", session=FlakySession(failures=2), metrics=True)
+        transactions = client.transactions()
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                transactions.query({"reference": "P123"})
+        transactions.query({"reference": "P123"})
+
+        metrics = client.get_metrics()
+        query = metrics[f"POST {endpoints.PAYMENT_QUERY_PATH}"]
+        self.assertEqual((query.count, query.errors, sum(query.buckets)), (3, 2, 3))
+        self.assertGreaterEqual(query.p99, query.p50)
+        self.assertEqual(metrics[f"POST {endpoints.AUTH_TOKEN_PATH}"].count, 1)
+
+    def test_network_errors_reach_on_error(self):
+        hooks = RecordingHooks()
+        session = FakeSession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, hooks=[hooks])
+        with mock.patch.object(session, "request", side_effect=OSError("reset")):
+            with self.assertRaises(NetworkError):
+                client.transactions().query({"reference": "P123"})
+        self.assertEqual(hooks.events[-1], ("error", endpoints.PAYMENT_QUERY_PATH, "NetworkError"))
+
+    def test_no_hooks_means_no_metrics(self):
+        client = TinkerClient("pk_test_123", "sk_test_123", session=FakeSession())
+        client.transactions().query({"reference": "P123"})
+        self.assertEqual(client.get_metrics(), {})
+
+
+    def test_rate_limiter_waits_are_not_network_time(self):
+        class TimingHooks(RequestHooks):
+            def __init__(self):
+                self.network_times = []
+
+            def after_response(self, info):
+                if info.endpoint == endpoints.PAYMENT_QUERY_PATH:
+                    self.network_times.append(info.network_time)
+
+        hooks = TimingHooks()
+        limiter = RateLimiter(default=RateLimit(rate=10))
+        client = TinkerClient("pk_test_123", "sk_test_123", session=FakeSession(), hooks=[hooks], rate_limiter=limiter)
+        transactions = client.transactions()
+
+        started = time.perf_counter()
+        transactions.query({"reference": "P1"})
+        transactions.query({"reference": "P2"})
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.09)
+        self.assertLess(max(hooks.network_times), 0.05)
+
+if __name__ == "__main__":
+    unittest.main()
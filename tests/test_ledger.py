@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from tinker import TinkerClient
+from tinker.exceptions import InvalidSignatureError
+from tinker.ledger import MemoryLedgerBackend, SQLiteLedgerBackend, TransactionLedger
+from tinker.models import Transaction
+from tinker.webhook import WebhookEvent
+
+from test_sdk import FakeSession
+from test_webhook import SECRET, signed_body
+
+
+def payment_payload(reference, status, event_id="evt_1", created_at="2026-02-11T22:52:45Z"):
+    return {
+        "id": event_id,
+        "type": f"payment.{status}",
+        "source": "payment",
+        "timestamp": "2026-02-11T22:53:01Z",
+        "data": {
+            "id": f"pay_{reference}",
+            "status": status,
+            "reference": reference,
+            "amount": 1200,
+            "currency": "KES",
+            "channel": "mpesa",
+            "created_at": created_at,
+        },
+    }
+
+
+def payment_event(reference, status, **kwargs):
+    return WebhookEvent.from_dict(payment_payload(reference, status, **kwargs))
+
+
+def signed_payment(reference, status, secret=SECRET):
+    return signed_body(secret, **payment_payload(reference, status))
+
+
+class LedgerTests(unittest.TestCase):
+    def backends(self):
+        yield MemoryLedgerBackend()
+        yield SQLiteLedgerBackend(os.path.join(tempfile.mkdtemp(), "ledger.db"))
+
+    def test_indexes_by_reference_id_and_status(self):
+        for backend in self.backends():
+            with self.subTest(backend=type(backend).__name__):
+                ledger = TransactionLedger(backend)
+                ledger.record_event(payment_event("R1", "pending"))
+                ledger.record_event(payment_event("R2", "pending"))
+                ledger.record_event(payment_event("R1", "success"))
+
+                self.assertEqual(ledger.status("R1"), "success")
+                self.assertIsNone(ledger.status("missing"))
+                self.assertEqual(ledger.get_by_id("pay_R2").reference, "R2")
+                self.assertEqual([entry.reference for entry in ledger.with_status("pending")], ["R2"])
+                self.assertEqual([entry.reference for entry in ledger.with_status("success")], ["R1"])
+                self.assertEqual(ledger.get("R1").amount, 1200.0)
+                self.assertEqual(len(ledger), 2)
+
+    def test_terminal_status_is_not_reopened_and_fields_merge(self):
+        for backend in self.backends():
+            with self.subTest(backend=type(backend).__name__):
+                ledger = TransactionLedger(backend)
+                ledger.record_transaction(Transaction(status="pending", initiation_data={"paymentReference": "R1"}))
+                ledger.record_event(payment_event("R1", "failed"))
+                entry = ledger.record_transaction(
+                    Transaction.from_dict({"id": "pay_R1", "reference": "R1", "status": "pending"})
+                )
+
+                self.assertEqual(entry.status, "failed")
+                self.assertEqual(entry.currency, "KES")
+                self.assertEqual(ledger.with_status("pending"), [])
+
+    def test_pending_older_than_uses_created_at_or_first_seen(self):
+        for backend in self.backends():
+            with self.subTest(backend=type(backend).__name__):
+                ledger = TransactionLedger(backend)
+                recent = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - 60))
+                ledger.record_event(payment_event("OLD", "pending", created_at="2026-02-11T22:52:45Z"))
+                ledger.record_event(payment_event("NEW", "pending", created_at=recent))
+                ledger.record_event(payment_event("DONE", "success", created_at="2026-02-11T22:00:00Z"))
+                with mock.patch("tinker.ledger.time.time", return_value=time.time() - 3600):
+                    ledger.record_transaction(Transaction(status="pending", initiation_data={"paymentReference": "SEEN"}))
+
+                stale = ledger.pending_older_than(15 * 60)
+                self.assertEqual([entry.reference for entry in stale], ["OLD", "SEEN"])
+
+    def test_client_records_api_results_and_webhooks(self):
+        ledger = TransactionLedger()
+        session = FakeSession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, ledger=ledger)
+
+        client.transactions().initiate({"amount": 100})
+        client.webhooks().handle_verified(signed_payment("P123", "success"), SECRET)
+
+        self.assertEqual(ledger.status("P123"), "success")
+        self.assertEqual(ledger.get("P123").id, "pay_P123")
+
+    def test_unverified_webhooks_are_not_recorded(self):
+        ledger = TransactionLedger()
+        webhooks = TinkerClient("pk_test_123", "sk_test_123", session=FakeSession(), ledger=ledger).webhooks()
+        forged = signed_payment("R1", "success", secret="whsec_forged")
+
+        event = webhooks.handle(forged)
+        self.assertFalse(webhooks.verify_signature(event, SECRET))
+        webhooks.on(source="payment")(lambda event: None)
+        webhooks.dispatch(forged)
+        with self.assertRaises(InvalidSignatureError):
+            webhooks.handle_verified(forged, SECRET)
+
+        self.assertIsNone(ledger.status("R1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import threading
+import time
+import unittest
+
+from tinker.exceptions import ApiError, PollingTimeoutError
+from tinker.models import Transaction
+from tinker.poller import TransactionPoller
+from tinker.webhook import WebhookEvent
+
+
+class FakeTransactions:
+    def __init__(self, statuses=None, delay=0.0, error=None):
+        self.statuses = statuses or {}
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def query(self, payload):
+        reference = payload["reference"]
+        with self._lock:
+            self.calls.append(reference)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            pending = self.statuses.get(reference, [])
+            status = pending.pop(0) if pending else "pending"
+            return Transaction.from_dict({"id": "tx_" + reference, "reference": reference, "status": status})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def fast_poller(transactions, **kwargs):
+    kwargs.setdefault("initial_interval", 0.001)
+    kwargs.setdefault("max_interval", 0.01)
+    return TransactionPoller(transactions, **kwargs)
+
+
+class TransactionPollerTests(unittest.TestCase):
+    def test_resolves_on_terminal_status(self):
+        transactions = FakeTransactions({"R1": ["pending", "pending", "success"]})
+        with fast_poller(transactions) as poller:
+            seen = []
+            future = poller.track({"reference": "R1", "gateway": "mpesa"}, callback=seen.append)
+            self.assertIs(poller.track({"reference": "R1"}), future)
+            self.assertTrue(future.result(timeout=5).is_successful())
+        self.assertEqual(transactions.calls, ["R1", "R1", "R1"])
+        self.assertEqual(seen, [future])
+
+    def test_concurrency_is_bounded(self):
+        transactions = FakeTransactions({f"R{i}": ["success"] for i in range(12)}, delay=0.01)
+        with fast_poller(transactions, max_concurrency=3) as poller:
+            futures = [poller.track({"reference": f"R{i}"}) for i in range(12)]
+            self.assertTrue(all(future.result(timeout=5).is_successful() for future in futures))
+        self.assertLessEqual(transactions.max_active, 3)
+
+    def test_webhook_stops_polling(self):
+        transactions = FakeTransactions()
+        with TransactionPoller(transactions, initial_interval=60) as poller:
+            future = poller.track({"reference": "R1"})
+            event = WebhookEvent.from_dict(
+                {
+                    "id": "evt_1",
+                    "type": "payment.completed",
+                    "source": "payment",
+                    "timestamp": "2026-02-11T22:52:45Z",
+                    "data": {"id": "tx_1", "reference": "R1", "status": "success"},
+                }
+            )
+            self.assertTrue(poller.feed_webhook(event))
+            self.assertFalse(poller.feed_webhook(event))
+            self.assertEqual(future.result(timeout=1).status, "success")
+            self.assertEqual(len(poller), 0)
+        self.assertEqual(transactions.calls, [])
+
+    def test_errors_and_timeouts_fail_the_future(self):
+        with fast_poller(FakeTransactions(error=ApiError("not found")), max_errors=2) as poller:
+            with self.assertRaises(ApiError):
+                poller.track({"reference": "R1"}).result(timeout=5)
+
+        with fast_poller(FakeTransactions(error=KeyError("reference")), max_concurrency=1, max_errors=2) as poller:
+            futures = [poller.track({"reference": f"R{i}"}) for i in range(3)]
+            for future in futures:
+                with self.assertRaises(KeyError):
+                    future.result(timeout=5)
+
+        with fast_poller(FakeTransactions(), timeout=0.05) as poller:
+            with self.assertRaises(PollingTimeoutError):
+                poller.track({"reference": "R2"}).result(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from tinker import TinkerClient
+from tinker.exceptions import NetworkError
+from tinker.models import Transaction
+from tinker.query_cache import QueryCache
+
+from test_sdk import FakeResponse, FakeSession
+
+
+class StatusSession(FakeSession):
+    def __init__(self, status="success", gate=None):
+        super().__init__()
+        self.status = status
+        self.gate = gate
+
+    def request(self, method, url, headers=None, json=None, timeout=None):
+        self.calls.append((method, url, json))
+        if self.gate is not None:
+            self.gate.wait(5)
+        reference = json["reference"]
+        return FakeResponse(
+            200,
+            {"success": True, "data": {"id": f"pay_{reference}", "reference": reference, "status": self.status}},
+        )
+
+
+def query_calls(session):
+    return [call for call in session.calls if call[0] == "POST" and "/auth/" not in call[1]]
+
+
+class QueryCacheTests(unittest.TestCase):
+    def test_concurrent_identical_queries_share_one_request(self):
+        gate = threading.Event()
+        session = StatusSession(status="pending", gate=gate)
+        cache = QueryCache()
+        transactions = TinkerClient("pk_test_123", "sk_test_123", session=session, query_cache=cache).transactions()
+        transactions._auth_manager.get_token()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(transactions.query, {"reference": "P1"}) for _ in range(4)]
+            while cache.stats().coalesced < 3:
+                threading.Event().wait(0.001)
+            gate.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(query_calls(session)), 1)
+        self.assertEqual({result.status for result in results}, {"pending"})
+        self.assertEqual(len(cache), 0)
+
+    def test_terminal_results_are_cached_and_pending_results_are_not(self):
+        session = StatusSession(status="success")
+        cache = QueryCache()
+        transactions = TinkerClient("pk_test_123", "sk_test_123", session=session, query_cache=cache).transactions()
+
+        first = transactions.query({"reference": "P1", "gateway": "mpesa"})
+        first.query_data["status"] = "mutated"
+        second = transactions.query({"gateway": "mpesa", "reference": "P1"})
+
+        self.assertTrue(second.is_successful())
+        self.assertEqual(second.query_data["status"], "success")
+        self.assertEqual(len(query_calls(session)), 1)
+
+        session.status = "pending"
+        transactions.query({"reference": "P2"})
+        transactions.query({"reference": "P2"})
+        self.assertEqual(len(query_calls(session)), 3)
+        self.assertEqual(cache.stats().hits, 1)
+
+    def test_pending_ttl_and_lru_bound(self):
+        cache = QueryCache(max_entries=2, pending_ttl=5)
+        pending = Transaction(status="pending")
+        with mock.patch("tinker.query_cache.time.monotonic", return_value=100.0):
+            cache.fetch("a", lambda: pending)
+            self.assertEqual(cache.fetch("a", self.fail).status, "pending")
+        with mock.patch("tinker.query_cache.time.monotonic", return_value=106.0):
+            self.assertEqual(cache.fetch("a", lambda: Transaction(status="failed")).status, "failed")
+
+        cache.fetch("b", lambda: Transaction(status="success"))
+        cache.fetch("c", lambda: Transaction(status="cancelled"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.fetch("a", lambda: Transaction(status="success")).status, "success")
+
+    def test_errors_reach_every_waiter_and_are_not_cached(self):
+        cache = QueryCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise NetworkError("down")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(cache.fetch, "k", failing)
+            started.wait(5)
+            follower = executor.submit(cache.fetch, "k", self.fail)
+            while cache.stats().coalesced < 1:
+                threading.Event().wait(0.001)
+            release.set()
+            for future in (leader, follower):
+                with self.assertRaises(NetworkError):
+                    future.result()
+
+        self.assertEqual(cache.fetch("k", lambda: Transaction(status="success")).status, "success")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from tinker import TinkerClient
+from tinker.circuit import CLOSED, HALF_OPEN, CircuitBreaker
+from tinker.exceptions import ApiError, RateLimitError
+from tinker.rate_limit import (
+    BATCH,
+    RateLimit,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+    batch_priority,
+)
+
+from test_sdk import FakeResponse, FakeSession
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple(
+            "tinker.rate_limit.time", monotonic=self.clock.time, time=self.clock.time, sleep=self.clock.sleep
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_waits_for_tokens_after_burst(self):
+        limiter = RateLimiter(limits={"query": RateLimit(rate=10, burst=2)})
+
+        self.assertEqual(limiter.acquire("query"), 0.0)
+        self.assertEqual(limiter.acquire("query"), 0.0)
+        self.assertAlmostEqual(limiter.acquire("query"), 0.1)
+        self.assertEqual(limiter.acquire("initiate"), 0.0)
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    def test_batch_lane_leaves_headroom_for_interactive_calls(self):
+        limiter = RateLimiter(default=RateLimit(rate=1, burst=4, batch_reserve=0.5))
+
+        self.assertEqual(limiter.acquire("query", priority=BATCH), 0.0)
+        self.assertEqual(limiter.acquire("query", priority=BATCH), 0.0)
+        # Two tokens left: batch calls need 1 + 2 reserved, interactive calls just 1.
+        with batch_priority():
+            self.assertAlmostEqual(limiter.acquire("query"), 1.0)
+        self.assertEqual(limiter.acquire("query"), 0.0)
+
+    def test_429_pauses_for_retry_after_and_halves_rate(self):
+        limiter = RateLimiter(default=RateLimit(rate=10, burst=1), recovery_time=60)
+        limiter.acquire("query")
+        limiter.observe("query", 429, {"Retry-After": "3"})
+
+        self.assertAlmostEqual(limiter.acquire("query"), 3.0 + 1 / 5)
+        limiter.observe("query", 200, {})
+        self.clock.now += 120
+        limiter.acquire("query")
+        self.assertAlmostEqual(limiter.acquire("query"), 0.1)
+
+    def test_max_wait_raises_instead_of_sleeping(self):
+        limiter = RateLimiter(default=RateLimit(rate=1), max_wait=0.5)
+        limiter.acquire("auth")
+
+        with self.assertRaises(RateLimitError):
+            limiter.acquire("auth")
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_sqlite_backend_shares_budget_between_limiters(self):
+        path = os.path.join(tempfile.mkdtemp(), "limits.db")
+        limit = RateLimit(rate=1, burst=2)
+        first = RateLimiter(default=limit, backend=SQLiteRateLimitBackend(path))
+        second = RateLimiter(default=limit, backend=SQLiteRateLimitBackend(path))
+
+        first.acquire("query")
+        second.acquire("query")
+        self.assertAlmostEqual(first.acquire("query"), 1.0)
+
+
+class ClientRateLimitTests(unittest.TestCase):
+    def test_429_responses_slow_the_endpoint_group(self):
+        class ThrottledSession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.calls.append((method, url, json))
+                return FakeResponse(429, {"success": False, "error": {"message": "slow down"}}, {"Retry-After": "2"})
+
+        limiter = RateLimiter(default=RateLimit(rate=100, burst=10), max_wait=1.0)
+        transactions = TinkerClient("pk_test_123", "sk_test_123", session=ThrottledSession(), rate_limiter=limiter).transactions()
+
+        with self.assertRaises(ApiError):
+            transactions.query({"reference": "P1"})
+        with self.assertRaises(RateLimitError):
+            transactions.query({"reference": "P1"})
+        self.assertEqual(transactions.get_last_retry_stats().attempts, 1)
+
+
+    def test_rate_limited_half_open_probe_releases_its_slot(self):
+        class OutageSession(FakeSession):
+            down = True
+
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                if self.down:
+                    self.down = False
+                    return FakeResponse(503, {"success": False, "error": {"message": "down"}})
+                return super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, probe_timeout=60)
+        limiter = RateLimiter(default=RateLimit(rate=20), max_wait=0.01)
+        client = TinkerClient(
+            "pk_test_123", "sk_test_123", session=OutageSession(), circuit_breaker=breaker, rate_limiter=limiter
+        )
+        transactions = client.transactions()
+
+        with self.assertRaises(ApiError):
+            transactions.query({"reference": "P1"})
+        with self.assertRaises(RateLimitError):
+            transactions.query({"reference": "P1"})
+        self.assertEqual(breaker.state("query"), HALF_OPEN)
+        time.sleep(0.06)
+        transactions.query({"reference": "P1"})
+
+        self.assertEqual(breaker.state("query"), CLOSED)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from tinker.reconcile import ReconciliationAggregator, ReconciliationGroup
+from tinker.webhook import SettlementEventData, WebhookEvent
+
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
+
+
+def settlement(amount, net_amount, status="completed", currency="KES", day="2026-02-11"):
+    return {
+        "id": "set_1",
+        "status": status,
+        "amount": amount,
+        "net_amount": net_amount,
+        "currency": currency,
+        "settlement_date": f"{day}T00:00:00Z",
+    }
+
+
+def settlement_event(amount, net_amount):
+    return WebhookEvent.from_dict(
+        {"id": "evt", "type": "settlement.completed", "source": "settlement", "data": settlement(amount, net_amount)}
+    )
+
+
+def events():
+    yield settlement_event(1000, 970)
+    yield settlement_event(500, 485)
+    yield SettlementEventData.from_dict(settlement(200, 194, day="2026-02-12"))
+    yield WebhookEvent.from_dict(
+        {
+            "id": "e3",
+            "type": "payment.completed",
+            "source": "payment",
+            "data": {"status": "success", "amount": 120, "currency": "USD", "created_at": "2026-02-11T10:00:00Z"},
+        }
+    )
+    yield WebhookEvent.from_dict({"id": "e4", "type": "subscription.created", "source": "subscription", "data": {}})
+
+
+class ReconciliationAggregatorTests(unittest.TestCase):
+    def aggregate(self, **kwargs):
+        aggregator = ReconciliationAggregator(**kwargs)
+        aggregator.add_many(events())
+        invoice = {"status": "paid", "amount": 300, "currency": "KES", "created_at": "2026-02-11"}
+        aggregator.add(invoice, source="invoice")
+        return aggregator
+
+    def test_groups_by_source_currency_status_and_day(self):
+        aggregator = self.aggregate(use_numpy=False)
+
+        self.assertEqual(len(aggregator), 5)
+        self.assertEqual(
+            aggregator.groups(),
+            [
+                ReconciliationGroup("invoice", "KES", "paid", "2026-02-11", 1, 300.0, 0.0, 0, 0.0),
+                ReconciliationGroup("payment", "USD", "success", "2026-02-11", 1, 120.0, 0.0, 0, 0.0),
+                ReconciliationGroup("settlement", "KES", "completed", "2026-02-11", 2, 1500.0, 1455.0, 2, 45.0),
+                ReconciliationGroup("settlement", "KES", "completed", "2026-02-12", 1, 200.0, 194.0, 1, 6.0),
+            ],
+        )
+
+    def test_totals_roll_up_to_requested_fields(self):
+        totals = self.aggregate(use_numpy=False).totals(by=("source", "currency"))
+
+        self.assertEqual(totals[("settlement", "KES")].count, 3)
+        self.assertEqual(totals[("settlement", "KES")].fees, 51.0)
+        self.assertEqual(totals[("settlement", "KES")].day, "")
+        self.assertEqual(set(totals), {("settlement", "KES"), ("payment", "USD"), ("invoice", "KES")})
+        with self.assertRaises(ValueError):
+            self.aggregate(use_numpy=False).totals(by=("reference",))
+
+    def test_typed_and_raw_settlements_without_a_settlement_date_share_a_day(self):
+        data = dict(settlement(100, 97), created_at="2026-02-10T08:00:00Z")
+        del data["settlement_date"]
+        aggregator = ReconciliationAggregator(use_numpy=False)
+        aggregator.add(data, source="settlement")
+        aggregator.add(SettlementEventData.from_dict(data))
+        aggregator.add(
+            WebhookEvent.from_dict({"id": "evt", "type": "settlement.completed", "source": "settlement", "data": data})
+        )
+
+        self.assertEqual([(group.day, group.count) for group in aggregator.groups()], [("2026-02-10", 3)])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_batches_match_pure_python(self):
+        batched = self.aggregate(use_numpy=True, batch_size=2)
+        self.assertEqual(batched.groups(), self.aggregate(use_numpy=False).groups())
+
+    @unittest.skipIf(numpy is not None, "numpy is installed")
+    def test_requiring_numpy_without_it_raises(self):
+        with self.assertRaises(ModuleNotFoundError):
+            ReconciliationAggregator(use_numpy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
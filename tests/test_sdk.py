@@ -1,16 +1,23 @@
 import hashlib
 import hmac
 import json
+import threading
+import time
 import unittest
 
-from tinker import TinkerClient
+from tinker import RetryPolicy, TinkerClient, Timeouts
+from tinker import endpoints
+from tinker.auth import AuthenticationManager
+from tinker.configuration import Configuration
+from tinker.exceptions import ApiError, NetworkError
 
 
 class FakeResponse:
-    def __init__(self, status_code, body):
+    def __init__(self, status_code, body, headers=None):
         self.status_code = status_code
         self._body = body
         self.text = json.dumps(body)
+        self.headers = headers or {}
 
     def json(self):
         return self._body
@@ -105,6 +112,214 @@ class SdkTests(unittest.TestCase):
 
         self.assertTrue(client.webhooks().verify_signature(payload, secret))
 
+    def test_query_many_preserves_order_and_reports_item_errors(self):
+        class QuerySession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.calls.append((method, url, json))
+                if json["reference"] == "BAD":
+                    return FakeResponse(404, {"success": False, "error": {"message": "Not found"}})
+                return FakeResponse(
+                    200,
+                    {"success": True, "data": {"id": "pay", "reference": json["reference"], "status": "success"}},
+                )
+
+        session = QuerySession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session)
+        payloads = [{"reference": ref} for ref in ("R1", "BAD", "R3", "R4")]
+
+        batch = client.transactions().query_many(payloads, max_concurrency=3)
+
+        self.assertEqual([item.payload for item in batch], payloads)
+        self.assertEqual(batch.items[0].transaction.query_data["reference"], "R1")
+        self.assertEqual(batch.items[3].transaction.query_data["reference"], "R4")
+        self.assertIsNone(batch.items[1].transaction)
+        self.assertEqual(str(batch.items[1].error), "Not found")
+        self.assertEqual((batch.stats.total, batch.stats.succeeded, batch.stats.failed), (4, 3, 1))
+        self.assertEqual(len([call for call in session.calls if call[0] == "POST" and "auth" in call[1]]), 1)
+
+    def test_retry_stats_are_kept_per_call_in_concurrent_batches(self):
+        class FlakyQuerySession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.calls.append((method, url, json))
+                if json["reference"] == "FLAKY" and len([call for call in self.calls if call[2] == json]) < 3:
+                    return FakeResponse(503, {"success": False, "error": {"message": "Unavailable"}})
+                return super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.001)
+        client = TinkerClient("pk_test_123", "sk_test_123", session=FlakyQuerySession(), retry_policy=policy)
+        payloads = [{"reference": ref} for ref in ("R1", "FLAKY", "R3")]
+
+        batch = client.transactions().query_many(payloads, max_concurrency=3)
+
+        self.assertEqual([item.retry_stats.attempts for item in batch], [1, 3, 1])
+        self.assertIsNone(client.transactions().get_last_retry_stats())
+
+    def test_concurrent_token_refresh_is_single_flight(self):
+        class SlowAuthSession(FakeSession):
+            def post(self, url, data=None, headers=None, timeout=None):
+                time.sleep(0.05)
+                return super().post(url, data=data, headers=headers, timeout=timeout)
+
+        session = SlowAuthSession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session)
+        threads = [threading.Thread(target=client.transactions().initiate, args=({"amount": 1},)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len([call for call in session.calls if "auth" in call[1]]), 1)
+
+    def test_background_refresh_fetches_token_off_request_path(self):
+        session = FakeSession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, background_token_refresh=True)
+        try:
+            deadline = time.time() + 2
+            while client.get_last_auth_meta() is None and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertIsNotNone(client.get_last_auth_meta())
+            client.transactions().initiate({"amount": 1})
+        finally:
+            client.close()
+
+        self.assertEqual([call[0] for call in session.calls], ["POST", "POST"])
+        self.assertIn("auth", session.calls[0][1])
+
+    def test_background_refresh_of_short_lived_tokens_waits_half_their_lifetime(self):
+        class ShortLivedTokenSession(FakeSession):
+            def post(self, url, data=None, headers=None, timeout=None):
+                response = super().post(url, data=data, headers=headers, timeout=timeout)
+                response._body["data"]["expires_in"] = 90
+                return response
+
+        auth = AuthenticationManager(Configuration.create("pk_test_123", "sk_test_123"), ShortLivedTokenSession())
+        auth.get_token()
+
+        self.assertAlmostEqual(auth._seconds_until_refresh(120), 45, delta=2)
+        self.assertAlmostEqual(auth._seconds_until_refresh(30), 60, delta=2)
+
+    def test_retries_transient_failures_with_stable_idempotency_key(self):
+        class FlakySession(FakeSession):
+            def __init__(self):
+                super().__init__()
+                self.outcomes = [
+                    ConnectionError("reset"),
+                    FakeResponse(503, {"success": False}, headers={"Retry-After": "0"}),
+                ]
+                self.idempotency_keys = []
+
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.idempotency_keys.append(headers.get("Idempotency-Key"))
+                if self.outcomes:
+                    outcome = self.outcomes.pop(0)
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    return outcome
+                return super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+        session = FlakySession()
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.001)
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, retry_policy=policy)
+
+        transaction = client.transactions().initiate({"amount": 100})
+
+        self.assertTrue(transaction.is_pending())
+        self.assertEqual(len(session.idempotency_keys), 3)
+        self.assertEqual(len(set(session.idempotency_keys)), 1)
+        self.assertIsNotNone(session.idempotency_keys[0])
+        stats = client.transactions().get_last_retry_stats()
+        self.assertEqual((stats.attempts, stats.retries), (3, 2))
+        self.assertGreater(stats.retry_time, 0)
+
+    def test_non_idempotent_calls_and_exhausted_retries_raise(self):
+        class DownSession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.calls.append((method, url, json))
+                return FakeResponse(503, {"success": False, "error": {"message": "Unavailable"}})
+
+        session = DownSession()
+        policy = RetryPolicy(max_attempts=2, backoff_base=0)
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, retry_policy=policy)
+
+        with self.assertRaises(ApiError):
+            client.subscriptions().create({"plan_id": "plan_1"})
+        self.assertEqual(client.subscriptions().get_last_retry_stats().attempts, 1)
+
+        with self.assertRaises(ApiError):
+            client.transactions().query({"reference": "R1"})
+        self.assertEqual(client.transactions().get_last_retry_stats().attempts, 2)
+
+        class BrokenSession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                raise ValueError("not retryable")
+
+        client = TinkerClient("pk_test_123", "sk_test_123", session=BrokenSession(), retry_policy=policy)
+        with self.assertRaises(NetworkError):
+            client.transactions().query({"reference": "R1"})
+        self.assertEqual(client.transactions().get_last_retry_stats().attempts, 1)
+
+    def test_per_endpoint_timeouts(self):
+        class TimeoutRecordingSession(FakeSession):
+            def __init__(self):
+                super().__init__()
+                self.timeouts = []
+
+            def post(self, url, data=None, headers=None, timeout=None):
+                self.timeouts.append(("auth", timeout))
+                return super().post(url, data=data, headers=headers, timeout=timeout)
+
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.timeouts.append((url.rsplit("/", 1)[-1], timeout))
+                return super().request(method, url, headers=headers, json=json, timeout=timeout)
+
+        session = TimeoutRecordingSession()
+        timeouts = Timeouts(
+            connect=3.05,
+            read=20,
+            endpoints={endpoints.PAYMENT_QUERY_PATH: (1.0, 5.0), endpoints.AUTH_TOKEN_PATH: (2.0, 10.0)},
+        )
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, timeouts=timeouts)
+        client.transactions().query({"reference": "R1"})
+        client.transactions().initiate({"amount": 1})
+
+        self.assertEqual(session.timeouts, [("auth", (2.0, 10.0)), ("query", (1.0, 5.0)), ("initiate", (3.05, 20))])
+
+    def test_iter_list_pages_with_offset_and_prefetch(self):
+        class PagedSession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.calls.append((method, url, json))
+                query = dict(part.split("=") for part in url.split("?", 1)[1].split("&"))
+                offset, limit = int(query["offset"]), int(query["limit"])
+                items = [{"id": f"sub_{index}"} for index in range(offset, min(offset + limit, 7))]
+                return FakeResponse(200, {"success": True, "data": items})
+
+        for prefetch in (False, True):
+            session = PagedSession()
+            client = TinkerClient("pk_test_123", "sk_test_123", session=session)
+
+            items = list(client.subscriptions().iter_list(plan_id="plan_1", page_size=3, prefetch=prefetch))
+
+            self.assertEqual([item["id"] for item in items], [f"sub_{index}" for index in range(7)])
+            urls = [call[1] for call in session.calls if call[0] == "GET"]
+            self.assertEqual(len(urls), 3)
+            self.assertTrue(urls[0].endswith("/merchant/subscriptions?plan_id=plan_1&limit=3&offset=0"))
+
+    def test_iter_plans_follows_cursor(self):
+        pages = {
+            None: {"items": [{"id": "plan_1"}, {"id": "plan_2"}], "next_cursor": "c2"},
+            "c2": {"items": [{"id": "plan_3"}], "next_cursor": None},
+        }
+
+        class CursorSession(FakeSession):
+            def request(self, method, url, headers=None, json=None, timeout=None):
+                self.calls.append((method, url, json))
+                cursor = url.split("cursor=")[1].split("&")[0] if "cursor=" in url else None
+                return FakeResponse(200, {"success": True, "data": pages[cursor]})
+
+        client = TinkerClient("pk_test_123", "sk_test_123", session=CursorSession())
+        plans = client.subscriptions().iter_plans(page_size=2, prefetch=True)
+        self.assertEqual([plan["id"] for plan in plans], ["plan_1", "plan_2", "plan_3"])
+
 
 if __name__ == "__main__":
     unittest.main()
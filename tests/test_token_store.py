@@ -0,0 +1,54 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from tinker import FileTokenStore, MemoryTokenStore, SQLiteTokenStore, TinkerClient
+
+from test_sdk import FakeSession
+
+
+class TokenStoreTests(unittest.TestCase):
+    def assert_workers_share_one_token(self, store):
+        session = FakeSession()
+        workers = [TinkerClient("pk_test_123", "sk_test_123", session=session, token_store=store) for _ in range(6)]
+        threads = [
+            threading.Thread(target=worker.transactions().initiate, args=({"amount": 1},)) for worker in workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len([call for call in session.calls if "auth" in call[1]]), 1)
+        self.assertEqual(len([call for call in session.calls if "auth" not in call[1]]), 6)
+
+    def test_memory_store(self):
+        self.assert_workers_share_one_token(MemoryTokenStore())
+
+    def test_file_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "token.json")
+            self.assert_workers_share_one_token(FileTokenStore(path))
+            with open(path, encoding="utf-8") as handle:
+                self.assertIn('"token": "abc123"', handle.read())
+
+    def test_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tokens.db")
+            self.assert_workers_share_one_token(SQLiteTokenStore(path))
+
+    def test_expired_stored_token_is_refetched(self):
+        store = MemoryTokenStore()
+        session = FakeSession()
+        client = TinkerClient("pk_test_123", "sk_test_123", session=session, token_store=store)
+        store.set(client._get_auth_manager()._store_key, "stale", 0)
+
+        client.transactions().initiate({"amount": 1})
+
+        self.assertEqual(store.get(client._get_auth_manager()._store_key)[0], "abc123")
+        self.assertEqual(len([call for call in session.calls if "auth" in call[1]]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import hashlib
+import hmac
+import json
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError, asdict, fields, replace
+from unittest import mock
+
+from tinker.exceptions import InvalidPayloadError, InvalidSignatureError
+from tinker.models import Transaction
+from tinker.webhook import PaymentEventData, WebhookEvent, WebhookHandler, WebhookVerifier
+
+SECRET = "whsec_123"
+
+
+def signed_body(secret=SECRET, **overrides):
+    payload = {
+        "id": "evt_123",
+        "type": "payment.completed",
+        "source": "payment",
+        "timestamp": "2026-02-11T22:52:45Z",
+        "data": {
+            "id": "pay_1",
+            "status": "success",
+            "reference": "REF1",
+            "amount": 100,
+            "currency": "KES",
+            "channel": "card",
+            "created_at": "2026-02-11T22:52:45Z",
+        },
+        "meta": {"app_id": "app_123", "version": "1.0"},
+    }
+    payload.update(overrides)
+    signing_input = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    signature = hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).hexdigest()
+    payload["security"] = {"algorithm": "HMAC-SHA256", "signature": f"sha256={signature}"}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class RawVerificationTests(unittest.TestCase):
+    def test_verify_raw_accepts_signed_bytes_and_rejects_tampering(self):
+        handler = WebhookHandler()
+        body = signed_body(data={"id": "pay_1", "status": "success", "reference": "Café", "amount": 1})
+
+        self.assertTrue(handler.verify_raw(body, SECRET))
+        self.assertTrue(handler.verify_raw(body.decode("utf-8"), SECRET))
+        self.assertFalse(handler.verify_raw(body, "whsec_other"))
+        self.assertFalse(handler.verify_raw(body.replace(b'"amount": 1', b'"amount": 2'), SECRET))
+        self.assertFalse(handler.verify_raw(b'{"id": "evt"}', SECRET))
+
+    def test_raw_path_matches_event_path(self):
+        handler = WebhookHandler()
+        body = signed_body()
+        event = handler.handle(body)
+
+        self.assertTrue(handler.verify_signature(event, SECRET))
+        self.assertTrue(handler.verify_signature(body, SECRET))
+
+    def test_handle_verified_parses_only_after_signature_passes(self):
+        handler = WebhookHandler()
+
+        event = handler.handle_verified(signed_body(), SECRET)
+        self.assertEqual(event.data.reference, "REF1")
+
+        forged = signed_body(secret="whsec_attacker", source="unknown")
+        with self.assertRaises(InvalidSignatureError):
+            handler.handle_verified(forged, SECRET)
+        with self.assertRaises(InvalidPayloadError):
+            handler.handle_verified(b"not json", SECRET)
+
+
+class WebhookVerifierTests(unittest.TestCase):
+    def test_keyring_reports_matching_secret(self):
+        verifier = WebhookVerifier(["whsec_new", SECRET])
+
+        self.assertEqual(verifier.match(signed_body(secret="whsec_new")), 0)
+        self.assertEqual(verifier.match(signed_body()), 1)
+        self.assertIsNone(verifier.match(signed_body(secret="whsec_retired")))
+        self.assertEqual(verifier.handle(signed_body()).id, "evt_123")
+
+    def test_verify_many_isolates_bad_items(self):
+        verifier = WebhookVerifier(SECRET)
+        event = WebhookHandler().handle(signed_body())
+
+        surrogate = b'{"id": "\\ud800", "security": {"signature": "sha256=00"}}'
+        payloads = [signed_body(), b"[]", signed_body(secret="x"), event, b'{"security": {}}', surrogate]
+
+        results = verifier.verify_many(payloads)
+
+        self.assertEqual(results, [True, False, False, True, False, False])
+        with self.assertRaises(InvalidPayloadError):
+            verifier.verify(surrogate)
+
+    def test_handler_accepts_verifier(self):
+        handler = WebhookHandler()
+        verifier = WebhookVerifier(["whsec_new", SECRET])
+
+        self.assertTrue(handler.verify_signature(signed_body(), verifier))
+        self.assertTrue(handler.verify_raw(signed_body(), verifier))
+        self.assertFalse(handler.verify_signature(signed_body(), WebhookVerifier([])))
+
+
+class CompactModelTests(unittest.TestCase):
+    def test_event_data_decodes_lazily_and_once(self):
+        event = WebhookHandler().handle(signed_body())
+        self.assertFalse(hasattr(event, "__dict__"))
+
+        with mock.patch.object(PaymentEventData, "from_dict", wraps=PaymentEventData.from_dict) as from_dict:
+            self.assertEqual(event.data.reference, "REF1")
+            self.assertEqual(event.data.amount, 100.0)
+            self.assertEqual(from_dict.call_count, 1)
+
+        self.assertEqual(event.meta.app_id, "app_123")
+        self.assertTrue(event.security.signature.startswith("sha256="))
+        with self.assertRaises(FrozenInstanceError):
+            event.id = "evt_other"
+
+    def test_event_pickles_and_compares(self):
+        event = WebhookHandler().handle(signed_body())
+        restored = pickle.loads(pickle.dumps(event))
+
+        self.assertEqual(restored, event)
+        self.assertEqual(restored.data, event.data)
+        self.assertEqual(restored.to_transaction(), event.to_transaction())
+        with self.assertRaises(InvalidPayloadError):
+            WebhookEvent.from_dict({"source": "unknown"})
+
+    def test_transaction_stores_query_and_callback_data_once(self):
+        data = {"id": "pay_1", "reference": "REF1", "status": "success"}
+        transaction = Transaction.from_dict(data)
+
+        self.assertIs(transaction.query_data, data)
+        self.assertIs(transaction.callback_data, data)
+        self.assertEqual(transaction, Transaction("success", query_data=data, callback_data=dict(data)))
+        self.assertEqual(pickle.loads(pickle.dumps(transaction)), transaction)
+
+        transaction.callback_data = {"status": "failed"}
+        self.assertEqual(transaction.callback_data, {"status": "failed"})
+
+
+    def test_models_still_work_with_dataclass_helpers(self):
+        event = WebhookHandler().handle(signed_body())
+        transaction = event.to_transaction()
+
+        self.assertEqual(asdict(event)["data"]["reference"], "REF1")
+        self.assertEqual(asdict(event)["security"]["algorithm"], "HMAC-SHA256")
+        self.assertEqual(replace(event, id="evt_other").id, "evt_other")
+        self.assertEqual(replace(event, id="evt_other").data, event.data)
+        self.assertEqual(asdict(transaction)["callback_data"]["reference"], "REF1")
+        self.assertTrue(replace(transaction, status="failed").is_failed())
+        self.assertEqual([field.name for field in fields(Transaction)][-1], "callback_data")
+
+if __name__ == "__main__":
+    unittest.main()
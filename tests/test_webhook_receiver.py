@@ -0,0 +1,195 @@
+import asyncio
+import io
+import threading
+import time
+import unittest
+
+from tinker.dedup import MemoryDedupStore
+from tinker.webhook import WebhookHandler
+from tinker.webhook_receiver import AsyncWebhookReceiver, WebhookReceiver
+
+from test_webhook import SECRET, signed_body
+
+
+def call_wsgi(app, body, method="POST"):
+    captured = {}
+
+    def start_response(status, headers):
+        captured["status"] = status
+        captured["headers"] = dict(headers)
+
+    environ = {"REQUEST_METHOD": method, "CONTENT_LENGTH": str(len(body)), "wsgi.input": io.BytesIO(body)}
+    payload = b"".join(app(environ, start_response))
+    return captured["status"], captured["headers"], payload
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met")
+        time.sleep(0.001)
+
+
+class WebhookReceiverTests(unittest.TestCase):
+    def test_acks_verified_events_and_processes_them_on_workers(self):
+        handled = []
+        receiver = WebhookReceiver(handled.append, SECRET, workers=2)
+
+        status, headers, payload = call_wsgi(receiver, signed_body())
+        self.assertEqual(status, "200 OK")
+        self.assertEqual(payload, b'{"received": true}')
+        self.assertEqual(call_wsgi(receiver, signed_body(secret="whsec_wrong"))[0], "401 Unauthorized")
+        self.assertEqual(call_wsgi(receiver, b"", method="GET")[0], "405 Method Not Allowed")
+        surrogate = b'{"id": "\\ud800", "source": "payment", "security": {"signature": "sha256=00"}}'
+        self.assertEqual(call_wsgi(receiver, surrogate)[0], "400 Bad Request")
+        receiver.close()
+
+        self.assertEqual([event.id for event in handled], ["evt_123"])
+        stats = receiver.stats()
+        self.assertEqual((stats.accepted, stats.rejected, stats.processed, stats.queue_depth), (1, 2, 1, 0))
+
+    def test_full_queue_answers_503_and_releases_the_event_id(self):
+        release = threading.Event()
+        receiver = WebhookReceiver(
+            lambda event: release.wait(5),
+            SECRET,
+            webhook_handler=WebhookHandler(dedup_store=MemoryDedupStore()),
+            workers=1,
+            max_queue=1,
+            retry_after=7,
+        )
+
+        self.assertEqual(receiver.receive(signed_body(id="evt_1"))[0], 200)
+        wait_for(lambda: receiver.stats().queue_depth == 0)
+        self.assertEqual(receiver.receive(signed_body(id="evt_2"))[0], 200)
+        status, headers, _ = receiver.receive(signed_body(id="evt_3"))
+        self.assertEqual(status, 503)
+        self.assertIn(("Retry-After", "7"), headers)
+        self.assertEqual(receiver.receive(signed_body(id="evt_2"))[0], 200)
+        self.assertEqual(receiver.stats().duplicates, 1)
+
+        release.set()
+        wait_for(lambda: receiver.stats().queue_depth == 0)
+        self.assertEqual(receiver.receive(signed_body(id="evt_3"))[0], 200)
+        receiver.close()
+
+        stats = receiver.stats()
+        self.assertEqual((stats.accepted, stats.shed, stats.processed, stats.max_queue_depth), (3, 1, 3, 1))
+        self.assertGreater(stats.p99, 0.0)
+
+    def test_signed_but_malformed_event_data_is_rejected_before_the_ack(self):
+        handled = []
+        receiver = WebhookReceiver(
+            handled.append, SECRET, webhook_handler=WebhookHandler(dedup_store=MemoryDedupStore())
+        )
+        malformed = signed_body(data={"id": "pay_1", "status": "success", "reference": "REF1", "amount": "ten"})
+
+        self.assertEqual(receiver.receive(malformed)[0], 400)
+        self.assertEqual(receiver.receive(signed_body())[0], 200)
+        receiver.close()
+
+        self.assertEqual([event.id for event in handled], ["evt_123"])
+        self.assertEqual(receiver.stats().rejected, 1)
+
+    def test_handler_failures_are_counted_and_reported(self):
+        errors = []
+
+        def fail(event):
+            raise RuntimeError("db down")
+
+        with WebhookReceiver(fail, SECRET, on_error=lambda event, exc: errors.append((event.id, str(exc)))) as receiver:
+            receiver.receive(signed_body())
+
+        self.assertEqual(errors, [("evt_123", "db down")])
+        self.assertEqual(receiver.stats().failed, 1)
+
+
+class AsyncWebhookReceiverTests(unittest.TestCase):
+    def test_asgi_app_acks_and_drains_on_shutdown(self):
+        handled = []
+        release = None
+
+        async def handler(event):
+            await release.wait()
+            handled.append(event.id)
+
+        receiver = AsyncWebhookReceiver(handler, SECRET, workers=1, max_queue=1)
+
+        async def scenario():
+            nonlocal release
+            release = asyncio.Event()
+            body = signed_body()
+            messages = [
+                {"type": "http.request", "body": body[:10], "more_body": True},
+                {"type": "http.request", "body": body[10:]},
+            ]
+            sent = []
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            await receiver({"type": "http", "method": "POST"}, receive, send)
+            await asyncio.sleep(0.01)
+            queued = await receiver.receive(signed_body(id="evt_2"))
+            shed = await receiver.receive(signed_body(id="evt_3"))
+            release.set()
+            lifespan = [{"type": "lifespan.shutdown"}]
+
+            async def receive_lifespan():
+                return lifespan.pop(0)
+
+            await receiver({"type": "lifespan"}, receive_lifespan, send)
+            return sent, queued, shed
+
+        sent, queued, shed = asyncio.run(scenario())
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(sent[1]["body"], b'{"received": true}')
+        self.assertEqual(sent[2], {"type": "lifespan.shutdown.complete"})
+        self.assertEqual(queued[0], 200)
+        self.assertEqual(shed[0], 503)
+        self.assertEqual(handled, ["evt_123", "evt_2"])
+        self.assertEqual(receiver.stats().processed, 2)
+
+    def test_verification_and_dedup_run_off_the_event_loop(self):
+        threads = []
+
+        class RecordingDedupStore(MemoryDedupStore):
+            def add(self, key):
+                threads.append(threading.current_thread())
+                return super().add(key)
+
+            def discard(self, key):
+                threads.append(threading.current_thread())
+                super().discard(key)
+
+        release = None
+
+        async def handler(event):
+            await release.wait()
+
+        receiver = AsyncWebhookReceiver(
+            handler, SECRET, webhook_handler=WebhookHandler(dedup_store=RecordingDedupStore()), workers=1, max_queue=1
+        )
+
+        async def scenario():
+            nonlocal release
+            release = asyncio.Event()
+            statuses = [(await receiver.receive(signed_body(id=f"evt_{index}")))[0] for index in range(3)]
+            release.set()
+            await receiver.close()
+            return statuses, threading.current_thread()
+
+        statuses, loop_thread = asyncio.run(scenario())
+
+        self.assertEqual(statuses, [200, 200, 503])
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(loop_thread, threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import unittest
+from unittest import mock
+
+from tinker.dedup import MemoryDedupStore
+from tinker.exceptions import InvalidSignatureError
+from tinker.webhook import WebhookEvent, WebhookHandler
+
+from test_webhook import SECRET, signed_body
+
+
+class WebhookRouterTests(unittest.TestCase):
+    def test_routes_by_type_then_source_then_catch_all(self):
+        handler = WebhookHandler()
+        calls = []
+
+        @handler.on()
+        def everything(event):
+            calls.append("all")
+
+        @handler.on(source="payment")
+        def payments(event):
+            calls.append("payment")
+
+        @handler.on("payment.completed")
+        def completed(event):
+            calls.append(("completed", event.data.reference))
+
+        handler.on("payment.failed")(lambda event: calls.append("failed"))
+        handler.on("payment.completed", source="invoice")(lambda event: calls.append("wrong source"))
+
+        event = handler.dispatch(signed_body(), webhook_secret=SECRET)
+
+        self.assertIsInstance(event, WebhookEvent)
+        self.assertEqual(calls, [("completed", "REF1"), "payment", "all"])
+        self.assertEqual(handler.route(event), 3)
+
+    def test_unsubscribed_events_are_skipped_before_verification_or_parsing(self):
+        handler = WebhookHandler(dedup_store=MemoryDedupStore())
+        handler.on("payment.completed")(lambda event: None)
+
+        with mock.patch("tinker.webhook.WebhookEvent.from_dict") as from_dict:
+            self.assertIsNone(handler.dispatch(signed_body(type="subscription.created", source="subscription")))
+            from_dict.assert_not_called()
+        self.assertIsNone(handler.dispatch(signed_body(type="payment.refunded", secret="whsec_wrong"), SECRET))
+        self.assertEqual(handler.dedup_stats().misses, 0)
+        with self.assertRaises(InvalidSignatureError):
+            handler.dispatch(signed_body(secret="whsec_wrong"), SECRET)
+
+    def test_parallel_callbacks_run_concurrently_and_failures_release_the_event(self):
+        store = MemoryDedupStore()
+        handler = WebhookHandler(dedup_store=store, max_parallel_handlers=2)
+        barrier = threading.Barrier(3, timeout=5)
+
+        for _ in range(3):
+            handler.on("payment.completed")(lambda event: barrier.wait())
+
+        @handler.on(source="payment")
+        def failing(event):
+            raise RuntimeError("downstream failed")
+
+        with self.assertRaises(RuntimeError):
+            handler.dispatch(signed_body(), SECRET, parallel=True)
+        handler.close()
+
+        # The failure forgot the event id, so the redelivery is not a duplicate.
+        handler = WebhookHandler(dedup_store=store)
+        handler.on(source="payment")(lambda event: None)
+        self.assertIsNotNone(handler.dispatch(signed_body(), SECRET))
+
+
+if __name__ == "__main__":
+    unittest.main()
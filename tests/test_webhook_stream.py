@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from tinker.exceptions import InvalidSignatureError
+from tinker.webhook_stream import stream_webhooks
+
+from test_webhook import SECRET, signed_body
+
+
+class StreamWebhooksTests(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            signed_body(id="evt_1"),
+            b"",
+            b"{not json",
+            signed_body(secret="whsec_forged", id="evt_3"),
+            signed_body(id="evt_4", source="unknown"),
+        ] + [signed_body(id=f"evt_bulk_{index}") for index in range(40)]
+
+    def assert_records(self, records, verified):
+        self.assertEqual([record.line for record in records[:4]], [1, 3, 4, 5])
+        self.assertEqual(records[0].event.id, "evt_1")
+        self.assertIn("Invalid JSON", str(records[1].error))
+        if verified:
+            self.assertIsInstance(records[2].error, InvalidSignatureError)
+        else:
+            self.assertEqual(records[2].event.id, "evt_3")
+        self.assertIn("Unknown webhook source", str(records[3].error))
+        self.assertEqual([record.event.id for record in records[4:]], [f"evt_bulk_{index}" for index in range(40)])
+
+    def test_streams_iterable_in_process(self):
+        self.assert_records(list(stream_webhooks(iter(self.lines))), verified=False)
+        self.assert_records(list(stream_webhooks(self.lines, webhook_secret=SECRET)), verified=True)
+
+    def test_streams_file_across_processes_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "webhooks.ndjson")
+            with open(path, "wb") as handle:
+                handle.write(b"\n".join(self.lines) + b"\n")
+
+            records = list(stream_webhooks(path, webhook_secret=["whsec_new", SECRET], processes=2, chunk_size=4))
+
+        self.assert_records(records, verified=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
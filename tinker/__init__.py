@@ -1,3 +1,48 @@
-from .client import TinkerClient, TinkerPayments
+"""Tinker Payments SDK.
 
-__all__ = ["TinkerClient", "TinkerPayments"]
+Public names are imported on first access so that, for example, a process that
+only verifies webhooks never loads the HTTP client stack.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncTinkerClient, AsyncTinkerPayments
+    from .client import TinkerClient, TinkerPayments
+    from .configuration import PoolConfig, Timeouts
+    from .retry import RetryPolicy, RetryStats
+    from .token_store import FileTokenStore, MemoryTokenStore, SQLiteTokenStore, TokenStore
+
+_EXPORTS = {
+    "AsyncTinkerClient": ".async_client",
+    "AsyncTinkerPayments": ".async_client",
+    "FileTokenStore": ".token_store",
+    "MemoryTokenStore": ".token_store",
+    "PoolConfig": ".configuration",
+    "RetryPolicy": ".retry",
+    "RetryStats": ".retry",
+    "SQLiteTokenStore": ".token_store",
+    "Timeouts": ".configuration",
+    "TinkerClient": ".client",
+    "TinkerPayments": ".client",
+    "TokenStore": ".token_store",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
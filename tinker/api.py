@@ -2,78 +2,73 @@
 
 from __future__ import annotations
 
-from typing import Any
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator
+from urllib.parse import urlencode
 
 from . import endpoints
 from .auth import AuthenticationManager
-from .configuration import Configuration
-from .exceptions import ApiError, NetworkError
-from .models import ApiMeta, Transaction
+from .cache import ResponseCache
+from .circuit import CircuitBreaker
+from .codec import JsonCodec, decode_response, default_codec
+from .configuration import Configuration, Timeouts
+from .exceptions import ApiError, NetworkError, RateLimitError, TinkerError
+from .instrumentation import RequestHooks, RequestInfo
+from .ledger import TransactionLedger
+from .models import ApiMeta, BatchItem, BatchResult, BatchStats, Transaction
+from .query_cache import QueryCache
+from .rate_limit import RateLimiter, batch_priority
+from .retry import NO_RETRY, RetryPolicy, RetryStats
+from .session import create_session
 
-try:
-    import requests
-except ModuleNotFoundError:  # pragma: no cover
-    requests = None
 
+class _ManagerBase:
+    """URL, header and envelope handling shared by the sync and async managers."""
 
-class BaseManager:
-    def __init__(
-        self,
-        config: Configuration,
-        auth_manager: AuthenticationManager,
-        session: Any | None = None,
-    ) -> None:
+    def __init__(self, config: Configuration, auth_manager: Any, codec: JsonCodec | None = None) -> None:
         self._config = config
         self._auth_manager = auth_manager
-        if session is not None:
-            self._session = session
-        elif requests is not None:
-            self._session = requests.Session()
-        else:
-            raise NetworkError("requests is required unless a custom session is provided")
+        self._codec = codec or default_codec()
         self._last_meta: ApiMeta | None = None
 
     def get_last_meta(self) -> ApiMeta | None:
         return self._last_meta
 
-    def _request(self, method: str, endpoint: str, data: dict[str, Any] | None = None) -> Any:
+    def _build_url(self, endpoint: str) -> str:
         base_url = self._config.base_url.rstrip("/")
-        url = f"{base_url}/{endpoint.lstrip('/')}"
-        token = self._auth_manager.get_token()
+        return f"{base_url}/{endpoint.lstrip('/')}"
 
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/json",
-                    "Content-Type": "application/json",
-                },
-                json=data if data else None,
-                timeout=30,
-            )
-            result = response.json() if response.text else {}
+    @staticmethod
+    def _build_headers(token: str) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
 
-            if response.status_code >= 400:
-                raise ApiError(self._extract_error_message(result))
+    def _handle_response(self, response: Any, info: RequestInfo | None = None) -> Any:
+        result = decode_response(response, self._codec)
 
-            if isinstance(result, dict) and "success" in result:
-                self._last_meta = ApiMeta.from_dict(result.get("meta") if isinstance(result.get("meta"), dict) else {})
+        if response.status_code >= 400:
+            raise ApiError(self._extract_error_message(result))
 
-                if result.get("success") is False:
-                    raise ApiError(self._extract_error_message(result))
+        if isinstance(result, dict) and "success" in result:
+            self._last_meta = ApiMeta.from_dict(result.get("meta") if isinstance(result.get("meta"), dict) else {})
+            if info is not None:
+                info.meta = self._last_meta
 
-                payload = result.get("data")
-                if isinstance(payload, (dict, list)):
-                    return payload
-                return {"value": payload}
+            if result.get("success") is False:
+                raise ApiError(self._extract_error_message(result))
 
-            return result if isinstance(result, (dict, list)) else {}
-        except ApiError:
-            raise
-        except Exception as exc:  # noqa: BLE001
-            raise NetworkError(f"Failed to communicate with Tinker API: {exc}") from exc
+            payload = result.get("data")
+            if isinstance(payload, (dict, list)):
+                return payload
+            return {"value": payload}
+
+        return result if isinstance(result, (dict, list)) else {}
 
     @staticmethod
     def _extract_error_message(result: Any) -> str:
@@ -86,24 +81,270 @@ class BaseManager:
 
         return "Unknown error"
 
+    @staticmethod
+    def _subscription_list_endpoint(plan_id: str | None, external_customer_id: str | None) -> str:
+        params = []
+        if plan_id and plan_id.strip():
+            params.append(f"plan_id={plan_id}")
+        if external_customer_id and external_customer_id.strip():
+            params.append(f"external_customer_id={external_customer_id}")
+
+        endpoint = endpoints.SUBSCRIPTION_BASE_PATH
+        if params:
+            endpoint = f"{endpoint}?{'&'.join(params)}"
+        return endpoint
+
+
+class BaseManager(_ManagerBase):
+    def __init__(
+        self,
+        config: Configuration,
+        auth_manager: AuthenticationManager,
+        session: Any | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeouts: Timeouts | None = None,
+        cache: ResponseCache | None = None,
+        hooks: Iterable[RequestHooks] | None = None,
+        codec: JsonCodec | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        query_cache: QueryCache | None = None,
+        ledger: TransactionLedger | None = None,
+    ) -> None:
+        super().__init__(config, auth_manager, codec)
+        self._session = session if session is not None else create_session()
+        self._retry_policy = retry_policy or NO_RETRY
+        self._timeouts = timeouts or Timeouts()
+        self._cache = cache
+        self._hooks = tuple(hooks or ())
+        self._circuit_breaker = circuit_breaker
+        self._rate_limiter = rate_limiter
+        self._query_cache = query_cache
+        self._ledger = ledger
+        # Per thread, so concurrent callers sharing a manager see their own call's stats.
+        self._retry_stats = threading.local()
+
+    def get_last_retry_stats(self) -> RetryStats | None:
+        """Retry stats for the most recent call made by the calling thread."""
+        return getattr(self._retry_stats, "last", None)
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        retryable: bool | None = None,
+    ) -> Any:
+        if not self._hooks:
+            return self._call(method, endpoint, data, headers, retryable, None)
+
+        info = RequestInfo(method, endpoint, self._build_url(endpoint))
+        try:
+            result = self._call(method, endpoint, data, headers, retryable, info)
+        except TinkerError as exc:
+            info.error = exc
+            for hook in self._hooks:
+                hook.on_error(info)
+            raise
+        # A fresh cache hit makes no HTTP attempt and is not reported.
+        if info.attempt:
+            for hook in self._hooks:
+                hook.after_response(info)
+        return result
+
+    def _call(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        retryable: bool | None,
+        info: RequestInfo | None,
+    ) -> Any:
+        if method == "GET" and self._cache is not None:
+            ttl = self._cache.ttl_for(endpoint)
+            if ttl is not None:
+                return self._cache.fetch(
+                    self._cache_key(endpoint),
+                    ttl,
+                    lambda conditional: self._send("GET", endpoint, headers=conditional, info=info),
+                    lambda response: self._parse_response(response, info),
+                )
+
+        return self._parse_response(self._send(method, endpoint, data, headers, retryable, info), info)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        retryable: bool | None = None,
+        info: RequestInfo | None = None,
+    ) -> Any:
+        url = self._build_url(endpoint)
+        timeout = self._timeouts.for_endpoint(endpoint)
+        policy = self._retry_policy
+        breaker = self._circuit_breaker
+        limiter = self._rate_limiter
+        group = endpoints.endpoint_group(endpoint) if breaker is not None or limiter is not None else ""
+        if retryable is None:
+            retryable = method == "GET"
+
+        attempt = 0
+        started = time.perf_counter()
+        while True:
+            attempt += 1
+            retry_time = time.perf_counter() - started if attempt > 1 else 0.0
+            token = self._auth_manager.get_token()
+            request_headers = self._build_headers(token)
+            if headers:
+                request_headers.update(headers)
+
+            if info is not None:
+                info.attempt = attempt
+                for hook in self._hooks:
+                    hook.before_request(info)
+
+            if breaker is not None or limiter is not None:
+                try:
+                    probe = breaker.before_call(group) if breaker is not None else False
+                    if limiter is not None:
+                        try:
+                            limiter.acquire(group)
+                        except BaseException:
+                            # The call is never sent, so it must not hold a half-open probe slot.
+                            if probe:
+                                breaker.release(group)
+                            raise
+                except (NetworkError, RateLimitError):
+                    self._retry_stats.last = RetryStats(attempt, retry_time)
+                    raise
+
+            # Taken after the breaker and limiter, so limiter waits aren't reported as network time.
+            sent = time.perf_counter()
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    json=data if data else None,
+                    timeout=timeout,
+                )
+            except Exception as exc:  # noqa: BLE001
+                if info is not None:
+                    info.network_time += time.perf_counter() - sent
+                if breaker is not None:
+                    breaker.record_failure(group)
+                if retryable and policy.should_retry_exception(exc, attempt):
+                    self._sleep_before_retry(policy.compute_delay(attempt), info)
+                    continue
+                self._retry_stats.last = RetryStats(attempt, retry_time)
+                raise NetworkError(f"Failed to communicate with Tinker API: {exc}") from exc
+
+            if info is not None:
+                info.network_time += time.perf_counter() - sent
+                info.status_code = response.status_code
+            if breaker is not None:
+                breaker.record_status(group, response.status_code)
+            if limiter is not None:
+                limiter.observe(group, response.status_code, getattr(response, "headers", None))
+
+            if retryable and policy.should_retry_status(response.status_code, attempt):
+                self._sleep_before_retry(policy.compute_delay(attempt, response), info)
+                continue
+
+            self._retry_stats.last = RetryStats(attempt, retry_time)
+            return response
+
+    def _sleep_before_retry(self, delay: float, info: RequestInfo | None) -> None:
+        if info is not None:
+            for hook in self._hooks:
+                hook.on_retry(info, delay)
+        time.sleep(delay)
+
+    def _parse_response(self, response: Any, info: RequestInfo | None = None) -> Any:
+        if info is not None:
+            decode_started = time.perf_counter()
+        try:
+            return self._handle_response(response, info)
+        except ApiError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise NetworkError(f"Failed to communicate with Tinker API: {exc}") from exc
+        finally:
+            if info is not None:
+                info.decode_time += time.perf_counter() - decode_started
+
+    def _cache_key(self, endpoint: str) -> str:
+        return f"{self._config.api_public_key}|{self._build_url(endpoint)}"
+
+    def _invalidate_cache(self, endpoint: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(self._cache_key(endpoint))
+
 
 class TransactionManager(BaseManager):
-    def initiate(self, payload: dict[str, Any]) -> Transaction:
-        response = self._request("POST", endpoints.PAYMENT_INITIATE_PATH, payload)
-        if not isinstance(response, dict):
-            response = {"value": response}
-        return Transaction.from_dict(response)
+    def initiate(self, payload: dict[str, Any], idempotency_key: str | None = None) -> Transaction:
+        response = self._request(
+            "POST",
+            endpoints.PAYMENT_INITIATE_PATH,
+            payload,
+            headers={"Idempotency-Key": idempotency_key or str(uuid.uuid4())},
+            retryable=True,
+        )
+        return self._transaction(response)
 
     def query(self, payload: dict[str, Any]) -> Transaction:
-        response = self._request("POST", endpoints.PAYMENT_QUERY_PATH, payload)
+        if self._query_cache is not None:
+            key = self._query_cache.key_for(self._config.api_public_key, payload)
+            return self._query_cache.fetch(key, lambda: self._query(payload))
+        return self._query(payload)
+
+    def _query(self, payload: dict[str, Any]) -> Transaction:
+        response = self._request("POST", endpoints.PAYMENT_QUERY_PATH, payload, retryable=True)
+        return self._transaction(response)
+
+    def _transaction(self, response: Any) -> Transaction:
         if not isinstance(response, dict):
             response = {"value": response}
-        return Transaction.from_dict(response)
+        transaction = Transaction.from_dict(response)
+        if self._ledger is not None:
+            self._ledger.record_transaction(transaction)
+        return transaction
+
+    def query_many(self, payloads: Iterable[dict[str, Any]], max_concurrency: int = 8) -> BatchResult:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        items = [BatchItem(payload=payload) for payload in payloads]
+        started = time.perf_counter()
+        if items:
+            # Warm the token once so workers don't race to authenticate.
+            self._auth_manager.get_token()
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+                list(executor.map(self._query_item, items))
+
+        return BatchResult(items=items, stats=BatchStats.from_items(items, time.perf_counter() - started))
+
+    def _query_item(self, item: BatchItem) -> None:
+        started = time.perf_counter()
+        self._retry_stats.last = None
+        try:
+            with batch_priority():
+                item.transaction = self.query(item.payload)
+        except TinkerError as exc:
+            item.error = exc
+        finally:
+            item.elapsed = time.perf_counter() - started
+            item.retry_stats = self.get_last_retry_stats()
 
 
 class SubscriptionManager(BaseManager):
     def create_plan(self, payload: dict[str, Any]) -> dict[str, Any]:
         response = self._request("POST", endpoints.SUBSCRIPTION_PLANS_PATH, payload)
+        self._invalidate_cache(endpoints.SUBSCRIPTION_PLANS_PATH)
         return response if isinstance(response, dict) else {"value": response}
 
     def list_plans(self) -> list[dict[str, Any]]:
@@ -112,6 +353,7 @@ class SubscriptionManager(BaseManager):
 
     def create(self, payload: dict[str, Any]) -> dict[str, Any]:
         response = self._request("POST", endpoints.SUBSCRIPTION_BASE_PATH, payload)
+        self._invalidate_cache(endpoints.SUBSCRIPTION_BASE_PATH)
         return response if isinstance(response, dict) else {"value": response}
 
     def list(
@@ -119,20 +361,97 @@ class SubscriptionManager(BaseManager):
         plan_id: str | None = None,
         external_customer_id: str | None = None,
     ) -> list[dict[str, Any]]:
-        params = []
-        if plan_id and plan_id.strip():
-            params.append(f"plan_id={plan_id}")
-        if external_customer_id and external_customer_id.strip():
-            params.append(f"external_customer_id={external_customer_id}")
-
-        endpoint = endpoints.SUBSCRIPTION_BASE_PATH
-        if params:
-            endpoint = f"{endpoint}?{'&'.join(params)}"
-
+        endpoint = self._subscription_list_endpoint(plan_id, external_customer_id)
         response = self._request("GET", endpoint)
         return response if isinstance(response, list) else []
 
+    def iter_plans(self, page_size: int = 100, prefetch: bool = False) -> Iterator[dict[str, Any]]:
+        return self._paginate(endpoints.SUBSCRIPTION_PLANS_PATH, page_size, prefetch)
+
+    def iter_list(
+        self,
+        plan_id: str | None = None,
+        external_customer_id: str | None = None,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        endpoint = self._subscription_list_endpoint(plan_id, external_customer_id)
+        return self._paginate(endpoint, page_size, prefetch)
+
     def cancel(self, subscription_id: str) -> dict[str, Any]:
         endpoint = f"{endpoints.SUBSCRIPTION_BASE_PATH}/{subscription_id}/cancel"
         response = self._request("POST", endpoint)
+        self._invalidate_cache(endpoints.SUBSCRIPTION_BASE_PATH)
         return response if isinstance(response, dict) else {"value": response}
+
+    def _paginate(self, endpoint: str, page_size: int, prefetch: bool) -> Iterator[dict[str, Any]]:
+        """Yield items page by page, holding at most two pages in memory.
+
+        Pages are requested with ``limit`` plus either ``offset`` or, when the API
+        returns one, the ``next_cursor`` of the previous page. A page of bare
+        items shorter than ``limit`` ends the iteration, as does an object page
+        without a cursor or with ``has_more`` false. With ``prefetch``, the next
+        page is fetched on a background thread while the current one is consumed.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            offset = 0
+            items, cursor, has_more = self._fetch_page(endpoint, page_size, None, offset)
+            while True:
+                offset += len(items)
+                pending = None
+                if has_more and executor is not None:
+                    pending = executor.submit(self._fetch_page, endpoint, page_size, cursor, offset)
+
+                yield from items
+                if not has_more:
+                    return
+
+                if pending is not None:
+                    next_items, cursor, has_more = pending.result()
+                else:
+                    next_items, cursor, has_more = self._fetch_page(endpoint, page_size, cursor, offset)
+
+                # Stop if the server ignored the paging parameters and repeated a page.
+                if next_items and next_items[0] == items[0]:
+                    return
+                items = next_items
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _fetch_page(
+        self,
+        endpoint: str,
+        page_size: int,
+        cursor: str | None,
+        offset: int,
+    ) -> tuple[list[dict[str, Any]], str | None, bool]:
+        params: dict[str, Any] = {"limit": page_size}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
+        separator = "&" if "?" in endpoint else "?"
+        with batch_priority():
+            response = self._request("GET", f"{endpoint}{separator}{urlencode(params)}")
+
+        if isinstance(response, list):
+            return response, None, len(response) == page_size
+
+        if isinstance(response, dict):
+            items = next(
+                (response[key] for key in ("items", "data", "results") if isinstance(response.get(key), list)),
+                [],
+            )
+            next_cursor = response.get("next_cursor")
+            next_cursor = str(next_cursor) if next_cursor else None
+            has_more = response.get("has_more")
+            if has_more is None:
+                has_more = next_cursor is not None or len(items) == page_size
+            return items, next_cursor, bool(has_more) and bool(items)
+
+        return [], None, False
@@ -0,0 +1,108 @@
+"""Asyncio API managers for transactions and subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Iterable
+
+from . import endpoints
+from .api import _ManagerBase
+from .async_auth import AsyncAuthenticationManager
+from .configuration import Configuration, Timeouts
+from .exceptions import ApiError, NetworkError, TinkerError
+from .models import BatchItem, BatchResult, BatchStats, Transaction
+
+
+class AsyncBaseManager(_ManagerBase):
+    def __init__(
+        self,
+        config: Configuration,
+        auth_manager: AsyncAuthenticationManager,
+        session: Any,
+        timeouts: Timeouts | None = None,
+    ) -> None:
+        super().__init__(config, auth_manager)
+        self._session = session
+        self._timeouts = timeouts or Timeouts()
+
+    async def _request(self, method: str, endpoint: str, data: dict[str, Any] | None = None) -> Any:
+        url = self._build_url(endpoint)
+        token = await self._auth_manager.get_token()
+
+        try:
+            response = await self._session.request(
+                method=method,
+                url=url,
+                headers=self._build_headers(token),
+                json=data if data else None,
+                timeout=self._timeouts.for_endpoint(endpoint),
+            )
+            return self._handle_response(response)
+        except ApiError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise NetworkError(f"Failed to communicate with Tinker API: {exc}") from exc
+
+
+class AsyncTransactionManager(AsyncBaseManager):
+    async def initiate(self, payload: dict[str, Any]) -> Transaction:
+        response = await self._request("POST", endpoints.PAYMENT_INITIATE_PATH, payload)
+        if not isinstance(response, dict):
+            response = {"value": response}
+        return Transaction.from_dict(response)
+
+    async def query(self, payload: dict[str, Any]) -> Transaction:
+        response = await self._request("POST", endpoints.PAYMENT_QUERY_PATH, payload)
+        if not isinstance(response, dict):
+            response = {"value": response}
+        return Transaction.from_dict(response)
+
+    async def query_many(self, payloads: Iterable[dict[str, Any]], max_concurrency: int = 64) -> BatchResult:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        items = [BatchItem(payload=payload) for payload in payloads]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(item: BatchItem) -> None:
+            async with semaphore:
+                item_started = time.perf_counter()
+                try:
+                    item.transaction = await self.query(item.payload)
+                except TinkerError as exc:
+                    item.error = exc
+                finally:
+                    item.elapsed = time.perf_counter() - item_started
+
+        started = time.perf_counter()
+        await asyncio.gather(*(run(item) for item in items))
+        return BatchResult(items=items, stats=BatchStats.from_items(items, time.perf_counter() - started))
+
+
+class AsyncSubscriptionManager(AsyncBaseManager):
+    async def create_plan(self, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self._request("POST", endpoints.SUBSCRIPTION_PLANS_PATH, payload)
+        return response if isinstance(response, dict) else {"value": response}
+
+    async def list_plans(self) -> list[dict[str, Any]]:
+        response = await self._request("GET", endpoints.SUBSCRIPTION_PLANS_PATH)
+        return response if isinstance(response, list) else []
+
+    async def create(self, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self._request("POST", endpoints.SUBSCRIPTION_BASE_PATH, payload)
+        return response if isinstance(response, dict) else {"value": response}
+
+    async def list(
+        self,
+        plan_id: str | None = None,
+        external_customer_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        endpoint = self._subscription_list_endpoint(plan_id, external_customer_id)
+        response = await self._request("GET", endpoint)
+        return response if isinstance(response, list) else []
+
+    async def cancel(self, subscription_id: str) -> dict[str, Any]:
+        endpoint = f"{endpoints.SUBSCRIPTION_BASE_PATH}/{subscription_id}/cancel"
+        response = await self._request("POST", endpoint)
+        return response if isinstance(response, dict) else {"value": response}
@@ -0,0 +1,45 @@
+"""Asyncio authentication manager for token fetching/caching."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from . import endpoints
+from .auth import _BaseAuthenticationManager
+from .configuration import Configuration, Timeouts
+from .exceptions import ApiError, NetworkError
+
+
+class AsyncAuthenticationManager(_BaseAuthenticationManager):
+    def __init__(self, config: Configuration, session: Any, timeouts: Timeouts | None = None) -> None:
+        super().__init__(config)
+        self._session = session
+        self._timeout = (timeouts or Timeouts()).for_endpoint(endpoints.AUTH_TOKEN_PATH)
+        self._lock: asyncio.Lock | None = None
+
+    async def get_token(self) -> str:
+        if self._is_token_valid():
+            return self._token or ""
+
+        # Coroutines that miss the cache together wait on one fetch instead of
+        # each issuing their own token request.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._is_token_valid():
+                return self._token or ""
+            return await self._fetch_token()
+
+    async def _fetch_token(self) -> str:
+        try:
+            response = await self._session.post(
+                self._config.auth_url,
+                timeout=self._timeout,
+                **self._token_request_kwargs(),
+            )
+            return self._handle_token_response(response)
+        except ApiError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise NetworkError(f"Failed to authenticate: {exc}") from exc
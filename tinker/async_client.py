@@ -0,0 +1,86 @@
+"""Public asyncio SDK client."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .async_api import AsyncSubscriptionManager, AsyncTransactionManager
+from .async_auth import AsyncAuthenticationManager
+from .configuration import Configuration, PoolConfig, Timeouts
+from .models import ApiMeta
+from .session import create_async_session
+from .webhook import WebhookHandler
+
+
+class AsyncTinkerClient:
+    """Asyncio counterpart of ``TinkerClient``.
+
+    ``session`` is the async transport shared by every manager. Any object whose
+    ``request(method, url, headers=, json=, timeout=)`` and
+    ``post(url, data=, headers=, timeout=)`` coroutines return a response with
+    ``status_code``, ``text`` and ``json()`` works; ``httpx.AsyncClient`` is used
+    when none is given. ``pool`` sizes that client's connection pool, and
+    ``timeouts`` sets the ``(connect, read)`` timeout of every request, as for
+    ``TinkerClient``.
+    """
+
+    def __init__(
+        self,
+        api_public_key: str,
+        api_secret_key: str,
+        base_url: str | None = None,
+        session: Any | None = None,
+        pool: PoolConfig | None = None,
+        timeouts: Timeouts | None = None,
+    ) -> None:
+        self._config = Configuration.create(api_public_key, api_secret_key, base_url)
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+        else:
+            self._session = create_async_session(pool, timeouts)
+            self._owns_session = True
+        self._timeouts = timeouts
+        self._auth_manager = AsyncAuthenticationManager(self._config, self._session, timeouts)
+        self._transactions: AsyncTransactionManager | None = None
+        self._subscriptions: AsyncSubscriptionManager | None = None
+        self._webhooks: WebhookHandler | None = None
+
+    @property
+    def config(self) -> Configuration:
+        return self._config
+
+    def transactions(self) -> AsyncTransactionManager:
+        if self._transactions is None:
+            self._transactions = AsyncTransactionManager(
+                self._config, self._auth_manager, self._session, self._timeouts
+            )
+        return self._transactions
+
+    def subscriptions(self) -> AsyncSubscriptionManager:
+        if self._subscriptions is None:
+            self._subscriptions = AsyncSubscriptionManager(
+                self._config, self._auth_manager, self._session, self._timeouts
+            )
+        return self._subscriptions
+
+    def webhooks(self) -> WebhookHandler:
+        if self._webhooks is None:
+            self._webhooks = WebhookHandler()
+        return self._webhooks
+
+    def get_last_auth_meta(self) -> ApiMeta | None:
+        return self._auth_manager.get_last_meta()
+
+    async def aclose(self) -> None:
+        if self._owns_session:
+            await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncTinkerClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+AsyncTinkerPayments = AsyncTinkerClient
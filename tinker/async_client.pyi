@@ -0,0 +1,19 @@
+from typing import Any
+
+from .async_api import AsyncSubscriptionManager, AsyncTransactionManager
+from .configuration import Configuration, PoolConfig, Timeouts
+from .models import ApiMeta
+from .webhook import WebhookHandler
+
+class AsyncTinkerClient:
+    config: Configuration
+    def __init__(self, api_public_key: str, api_secret_key: str, base_url: str | None = None, session: Any | None = None, pool: PoolConfig | None = None, timeouts: Timeouts | None = None) -> None: ...
+    def transactions(self) -> AsyncTransactionManager: ...
+    def subscriptions(self) -> AsyncSubscriptionManager: ...
+    def webhooks(self) -> WebhookHandler: ...
+    def get_last_auth_meta(self) -> ApiMeta | None: ...
+    async def aclose(self) -> None: ...
+    async def __aenter__(self) -> AsyncTinkerClient: ...
+    async def __aexit__(self, *exc_info: Any) -> None: ...
+
+AsyncTinkerPayments = AsyncTinkerClient
@@ -3,37 +3,36 @@
 from __future__ import annotations
 
 import base64
+import hashlib
+import threading
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
-from .configuration import Configuration
-from .exceptions import ApiError, NetworkError
+from . import endpoints
+from .circuit import CircuitBreaker
+from .codec import JsonCodec, decode_response, default_codec
+from .configuration import Configuration, Timeouts
+from .exceptions import ApiError, NetworkError, TinkerError
+from .instrumentation import RequestHooks, RequestInfo
 from .models import ApiMeta
+from .rate_limit import RateLimiter
+from .session import create_session
 
-try:
-    import requests
-except ModuleNotFoundError:  # pragma: no cover
-    requests = None
+if TYPE_CHECKING:
+    from .token_store import TokenStore
 
 
-class AuthenticationManager:
-    def __init__(self, config: Configuration, session: Any | None = None) -> None:
+class _BaseAuthenticationManager:
+    """Token state and response handling shared by the sync and async managers."""
+
+    def __init__(self, config: Configuration, codec: JsonCodec | None = None) -> None:
         self._config = config
-        if session is not None:
-            self._session = session
-        elif requests is not None:
-            self._session = requests.Session()
-        else:
-            raise NetworkError("requests is required unless a custom session is provided")
+        self._codec = codec or default_codec()
         self._token: str | None = None
         self._expires_at: int | None = None
+        self._lifetime: int | None = None
         self._last_meta: ApiMeta | None = None
 
-    def get_token(self) -> str:
-        if self._is_token_valid():
-            return self._token or ""
-        return self._fetch_token()
-
     def get_last_meta(self) -> ApiMeta | None:
         return self._last_meta
 
@@ -42,39 +41,35 @@ class AuthenticationManager:
             return False
         return int(time.time()) < self._expires_at - 60
 
-    def _fetch_token(self) -> str:
+    def _token_request_kwargs(self) -> dict[str, Any]:
         credentials = base64.b64encode(
             f"{self._config.api_public_key}:{self._config.api_secret_key}".encode("utf-8")
         ).decode("utf-8")
 
-        try:
-            response = self._session.post(
-                self._config.auth_url,
-                data={"credentials": credentials},
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Accept": "application/json",
-                },
-                timeout=30,
-            )
-            result = response.json() if response.text else {}
-            auth_data = self._extract_auth_data(result)
-
-            if response.status_code >= 400:
-                raise ApiError(self._extract_error_message(result))
+        return {
+            "data": {"credentials": credentials},
+            "headers": {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Accept": "application/json",
+            },
+        }
 
-            token = auth_data.get("token")
-            if not token:
-                raise ApiError("Invalid authentication response: token missing")
+    def _handle_token_response(self, response: Any) -> str:
+        result = decode_response(response, self._codec)
+        auth_data = self._extract_auth_data(result)
 
-            self._token = str(token)
-            expires_in = int(auth_data.get("expires_in", 3600))
-            self._expires_at = int(time.time()) + expires_in
-            return self._token
-        except ApiError:
-            raise
-        except Exception as exc:  # noqa: BLE001
-            raise NetworkError(f"Failed to authenticate: {exc}") from exc
+        if response.status_code >= 400:
+            raise ApiError(self._extract_error_message(result))
+
+        token = auth_data.get("token")
+        if not token:
+            raise ApiError("Invalid authentication response: token missing")
+
+        self._token = str(token)
+        expires_in = int(auth_data.get("expires_in", 3600))
+        self._lifetime = expires_in
+        self._expires_at = int(time.time()) + expires_in
+        return self._token
 
     def _extract_auth_data(self, result: Any) -> dict[str, Any]:
         if isinstance(result, dict) and "success" in result:
@@ -98,3 +93,168 @@ class AuthenticationManager:
                 return str(result["message"])
 
         return "Authentication failed"
+
+
+class AuthenticationManager(_BaseAuthenticationManager):
+    def __init__(
+        self,
+        config: Configuration,
+        session: Any | None = None,
+        token_store: TokenStore | None = None,
+        timeouts: Timeouts | None = None,
+        hooks: Iterable[RequestHooks] | None = None,
+        codec: JsonCodec | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        super().__init__(config, codec)
+        self._session = session if session is not None else create_session()
+        self._refresh_lock = threading.Lock()
+        self._refresher: threading.Thread | None = None
+        self._refresher_stop = threading.Event()
+        self._token_store = token_store
+        self._timeout = (timeouts or Timeouts()).for_endpoint(endpoints.AUTH_TOKEN_PATH)
+        self._hooks = tuple(hooks or ())
+        self._circuit_breaker = circuit_breaker
+        self._rate_limiter = rate_limiter
+        self._store_key = hashlib.sha256(f"{config.auth_url}:{config.api_public_key}".encode("utf-8")).hexdigest()
+
+    def get_token(self) -> str:
+        if self._is_token_valid():
+            return self._token or ""
+
+        # Single-flight: one thread fetches while the rest wait and reuse its token.
+        with self._refresh_lock:
+            if self._is_token_valid() or self._load_stored_token():
+                return self._token or ""
+            return self._refresh_token()
+
+    def start_background_refresh(self, refresh_ahead: int = 120, retry_interval: float = 5.0) -> None:
+        """Renew the token ``refresh_ahead`` seconds before expiry on a daemon thread.
+
+        ``refresh_ahead`` should exceed the 60s validity margin used by ``get_token``
+        so requests never block on a refresh. It is capped at half the token's
+        lifetime, so short-lived tokens are renewed halfway through instead of
+        continuously.
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._refresher_stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            args=(refresh_ahead, retry_interval),
+            name="tinker-token-refresh",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self, timeout: float | None = None) -> None:
+        self._refresher_stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout)
+            self._refresher = None
+
+    def _refresh_loop(self, refresh_ahead: int, retry_interval: float) -> None:
+        delay = self._seconds_until_refresh(refresh_ahead)
+        while not self._refresher_stop.wait(delay):
+            try:
+                with self._refresh_lock:
+                    self._refresh_token(self._refresh_margin(refresh_ahead))
+                delay = self._seconds_until_refresh(refresh_ahead)
+            except TinkerError:
+                delay = retry_interval
+
+    def _seconds_until_refresh(self, refresh_ahead: int) -> float:
+        if self._token is None or self._expires_at is None:
+            return 0.0
+        return max(self._expires_at - self._refresh_margin(refresh_ahead) - time.time(), 1.0)
+
+    def _refresh_margin(self, refresh_ahead: int) -> float:
+        # Tokens loaded from a store have no known lifetime; use what remains of them.
+        lifetime = self._lifetime if self._lifetime is not None else (self._expires_at or 0) - time.time()
+        return max(min(refresh_ahead, lifetime / 2), 0.0)
+
+    def _refresh_token(self, margin: float = 60) -> str:
+        if self._token_store is None:
+            return self._fetch_token()
+
+        with self._token_store.lock(self._store_key):
+            # Another worker may have refreshed while we waited for the lock.
+            if self._load_stored_token(margin):
+                return self._token or ""
+            token = self._fetch_token()
+            self._token_store.set(self._store_key, token, self._expires_at or 0)
+            return token
+
+    def _load_stored_token(self, margin: float = 60) -> bool:
+        if self._token_store is None:
+            return False
+
+        entry = self._token_store.get(self._store_key)
+        if entry is None or int(time.time()) >= entry[1] - margin:
+            return False
+        self._token, self._expires_at = entry
+        return True
+
+    def _fetch_token(self) -> str:
+        if not self._hooks:
+            return self._post_token(None)
+
+        info = RequestInfo("POST", endpoints.AUTH_TOKEN_PATH, self._config.auth_url)
+        info.attempt = 1
+        for hook in self._hooks:
+            hook.before_request(info)
+        try:
+            token = self._post_token(info)
+        except TinkerError as exc:
+            info.error = exc
+            for hook in self._hooks:
+                hook.on_error(info)
+            raise
+        for hook in self._hooks:
+            hook.after_response(info)
+        return token
+
+    def _post_token(self, info: RequestInfo | None) -> str:
+        breaker = self._circuit_breaker
+        limiter = self._rate_limiter
+        probe = breaker.before_call("auth") if breaker is not None else False
+        if limiter is not None:
+            try:
+                limiter.acquire("auth")
+            except BaseException:
+                if probe:
+                    breaker.release("auth")
+                raise
+        try:
+            sent = time.perf_counter() if info is not None else 0.0
+            try:
+                response = self._session.post(
+                    self._config.auth_url,
+                    timeout=self._timeout,
+                    **self._token_request_kwargs(),
+                )
+            except Exception:
+                if breaker is not None:
+                    breaker.record_failure("auth")
+                raise
+            if breaker is not None:
+                breaker.record_status("auth", response.status_code)
+            if limiter is not None:
+                limiter.observe("auth", response.status_code, getattr(response, "headers", None))
+            if info is None:
+                return self._handle_token_response(response)
+
+            decode_started = time.perf_counter()
+            info.network_time = decode_started - sent
+            info.status_code = response.status_code
+            try:
+                return self._handle_token_response(response)
+            finally:
+                info.decode_time = time.perf_counter() - decode_started
+                info.meta = self._last_meta
+        except ApiError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise NetworkError(f"Failed to authenticate: {exc}") from exc
@@ -0,0 +1,227 @@
+"""Response cache for read-mostly GET endpoints."""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from . import endpoints
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    expires_at: float
+    etag: str | None = None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    invalidations: int = 0
+
+
+class CacheBackend:
+    """Base class for response cache storage."""
+
+    def get(self, key: str) -> CacheEntry | None:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU holding at most ``max_entries`` responses."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Responses in a SQLite database shared by processes on one host.
+
+    Holds at most ``max_entries`` responses, evicting the least recently stored.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1024, timeout: float = 30.0) -> None:
+        self._path = path
+        self._max_entries = max_entries
+        self._timeout = timeout
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tinker_response_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, etag TEXT, expires_at REAL NOT NULL, stored_at REAL NOT NULL)"
+            )
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> CacheEntry | None:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT value, etag, expires_at FROM tinker_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        return CacheEntry(value=json.loads(row[0]), etag=row[1], expires_at=float(row[2]))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO tinker_response_cache (key, value, etag, expires_at, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(entry.value), entry.etag, entry.expires_at, time.time()),
+            )
+            connection.execute(
+                "DELETE FROM tinker_response_cache WHERE key NOT IN "
+                "(SELECT key FROM tinker_response_cache ORDER BY stored_at DESC LIMIT ?)",
+                (self._max_entries,),
+            )
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def delete_prefix(self, prefix: str) -> None:
+        connection = self._connect()
+        try:
+            connection.execute(
+                "DELETE FROM tinker_response_cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+
+
+class ResponseCache:
+    """Opt-in cache for GET responses, keyed by credential and URL.
+
+    ``ttls`` maps endpoint paths to freshness lifetimes in seconds; GET
+    endpoints not listed are never cached. Once an entry is stale, it is
+    revalidated with ``If-None-Match`` when the API supplied an ``ETag``, so an
+    unchanged resource costs a 304 instead of a full body. A TTL of ``0``
+    revalidates on every call. Responses handed to callers are copies, so
+    mutating them does not affect the cache.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        self._ttls = dict(ttls) if ttls is not None else {endpoints.SUBSCRIPTION_PLANS_PATH: 300.0}
+        self._backend = backend if backend is not None else MemoryCacheBackend()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._invalidations = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        return self._ttls.get("/" + endpoint.split("?", 1)[0].strip("/"))
+
+    def fetch(
+        self,
+        key: str,
+        ttl: float,
+        send: Callable[[dict[str, str] | None], Any],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        """Return the cached value for ``key`` or fetch it with ``send``.
+
+        ``send`` performs the request with optional conditional headers and
+        returns the raw response; ``parse`` turns a non-304 response into the
+        value to cache.
+        """
+        entry = self._backend.get(key)
+        if entry is not None and entry.is_fresh():
+            self._count("_hits")
+            return copy.deepcopy(entry.value)
+
+        conditional = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = send(conditional)
+        if conditional is not None and response.status_code == 304:
+            self._count("_revalidations")
+            self._backend.set(key, CacheEntry(value=entry.value, expires_at=time.time() + ttl, etag=entry.etag))
+            return copy.deepcopy(entry.value)
+
+        self._count("_misses")
+        value = parse(response)
+        headers = getattr(response, "headers", None) or {}
+        etag = headers.get("ETag")
+        self._backend.set(
+            key,
+            CacheEntry(value=copy.deepcopy(value), expires_at=time.time() + ttl, etag=str(etag) if etag else None),
+        )
+        return value
+
+    def invalidate(self, prefix: str) -> None:
+        self._backend.delete_prefix(prefix)
+        self._count("_invalidations")
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            revalidations=self._revalidations,
+            invalidations=self._invalidations,
+        )
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
@@ -0,0 +1,197 @@
+"""Per-endpoint circuit breaker.
+
+A ``CircuitBreaker`` shared by the managers tracks one circuit per endpoint
+group (``initiate``, ``query``, ``subscriptions``, ``auth``). A circuit opens
+after ``failure_threshold`` consecutive failures; while open, calls fail at
+once with ``CircuitOpenError`` instead of waiting on a degraded API. After
+``recovery_timeout`` seconds the circuit goes half-open and lets up to
+``half_open_max_calls`` probe calls through: a successful probe closes it, a
+failed one opens it again. A probe that never reports back frees its slot
+after ``probe_timeout`` seconds.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateListener = Callable[[str, str, str], None]
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    state: str
+    failures: int
+    opened_at: float | None
+    total_failures: int
+    rejected: int
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "probe_started", "total_failures", "rejected")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probes = 0
+        self.probe_started = 0.0
+        self.total_failures = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Opt-in fast-fail for endpoints that keep failing.
+
+    Transport errors and responses with a status in ``failure_statuses`` count
+    as failures; other responses, including 4xx API errors, count as
+    successes. ``on_state_change(key, old_state, new_state)`` is called on
+    every transition, outside the breaker's lock. ``probe_timeout`` defaults
+    to ``recovery_timeout``; a half-open probe with no result by then, e.g.
+    one interrupted before it could report, is assumed lost and another probe
+    is admitted.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_statuses: frozenset[int] = frozenset({500, 502, 503, 504}),
+        on_state_change: StateListener | None = None,
+        probe_timeout: float | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.probe_timeout = recovery_timeout if probe_timeout is None else probe_timeout
+        self.failure_statuses = failure_statuses
+        self._listeners: list[StateListener] = [on_state_change] if on_state_change is not None else []
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: StateListener) -> None:
+        self._listeners.append(listener)
+
+    def state(self, key: str) -> str:
+        circuit = self._circuits.get(key)
+        return circuit.state if circuit is not None else CLOSED
+
+    def stats(self) -> dict[str, CircuitStats]:
+        with self._lock:
+            return {
+                key: CircuitStats(
+                    state=circuit.state,
+                    failures=circuit.failures,
+                    opened_at=circuit.opened_at,
+                    total_failures=circuit.total_failures,
+                    rejected=circuit.rejected,
+                )
+                for key, circuit in self._circuits.items()
+            }
+
+    def reset(self, key: str | None = None) -> None:
+        """Close ``key``'s circuit, or every circuit when ``key`` is None."""
+        with self._lock:
+            keys = [key] if key is not None else list(self._circuits)
+            transitions = [self._transition(name, self._circuit(name), CLOSED) for name in keys]
+        self._notify(transitions)
+
+    def before_call(self, key: str) -> bool:
+        """Raise ``CircuitOpenError`` unless a call to ``key`` may proceed now.
+
+        Returns ``True`` when the call was admitted as a half-open probe.
+        """
+        transition = None
+        probe = False
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == OPEN:
+                remaining = (circuit.opened_at or 0.0) + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(key, remaining)
+                transition = self._transition(key, circuit, HALF_OPEN)
+            if circuit.state == HALF_OPEN:
+                now = time.monotonic()
+                if circuit.probes >= self.half_open_max_calls:
+                    remaining = circuit.probe_started + self.probe_timeout - now
+                    if remaining > 0:
+                        circuit.rejected += 1
+                        raise CircuitOpenError(key, remaining)
+                    circuit.probes = 0
+                circuit.probes += 1
+                circuit.probe_started = now
+                probe = True
+        self._notify([transition])
+        return probe
+
+    def release(self, key: str) -> None:
+        """Give back the probe slot of a call admitted by ``before_call`` but never sent."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def record_success(self, key: str) -> None:
+        # Calls that started before the circuit opened don't close it; only probes do.
+        with self._lock:
+            circuit = self._circuit(key)
+            transition = None
+            if circuit.state == HALF_OPEN:
+                transition = self._transition(key, circuit, CLOSED)
+            elif circuit.state == CLOSED:
+                circuit.failures = 0
+        self._notify([transition])
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuit(key)
+            circuit.failures += 1
+            circuit.total_failures += 1
+            transition = None
+            if circuit.state == HALF_OPEN or (circuit.state == CLOSED and circuit.failures >= self.failure_threshold):
+                transition = self._transition(key, circuit, OPEN)
+        self._notify([transition])
+
+    def record_status(self, key: str, status_code: int) -> None:
+        if status_code in self.failure_statuses:
+            self.record_failure(key)
+        else:
+            self.record_success(key)
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def _transition(self, key: str, circuit: _Circuit, state: str) -> tuple[str, str, str] | None:
+        old_state = circuit.state
+        circuit.state = state
+        circuit.probes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == CLOSED:
+            circuit.failures = 0
+            circuit.opened_at = None
+        return (key, old_state, state) if old_state != state else None
+
+    def _notify(self, transitions: list[tuple[str, str, str] | None]) -> None:
+        for transition in transitions:
+            if transition is not None:
+                for listener in self._listeners:
+                    listener(*transition)
+
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 from .api import SubscriptionManager, TransactionManager
 from .auth import AuthenticationManager
-from .configuration import Configuration
+from .configuration import Configuration, PoolConfig, Timeouts
+from .instrumentation import EndpointMetrics, LatencyRecorder, RequestHooks
 from .models import ApiMeta
+from .retry import RetryPolicy
+from .session import create_session
 from .webhook import WebhookHandler
 
-try:
-    import requests
-except ModuleNotFoundError:  # pragma: no cover
-    requests = None
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .circuit import CircuitBreaker
+    from .codec import JsonCodec
+    from .ledger import TransactionLedger
+    from .query_cache import QueryCache
+    from .rate_limit import RateLimiter
+    from .token_store import TokenStore
 
 
 class TinkerClient:
@@ -23,15 +30,42 @@ class TinkerClient:
         api_secret_key: str,
         base_url: str | None = None,
         session: Any | None = None,
+        background_token_refresh: bool = False,
+        token_store: TokenStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        pool: PoolConfig | None = None,
+        timeouts: Timeouts | None = None,
+        cache: ResponseCache | None = None,
+        hooks: Iterable[RequestHooks] | None = None,
+        metrics: bool = False,
+        codec: JsonCodec | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        query_cache: QueryCache | None = None,
+        ledger: TransactionLedger | None = None,
     ) -> None:
         self._config = Configuration.create(api_public_key, api_secret_key, base_url)
-        if session is not None:
-            self._session = session
-        elif requests is not None:
-            self._session = requests.Session()
-        else:
-            raise RuntimeError("requests is required unless a custom session is provided")
-        self._auth_manager = AuthenticationManager(self._config, self._session)
+        # The session and auth manager are built on first API use, so clients that
+        # only handle webhooks never create an HTTP session.
+        self._session = session
+        self._pool = pool
+        self._token_store = token_store
+        self._retry_policy = retry_policy
+        self._timeouts = timeouts
+        self._cache = cache
+        self._codec = codec
+        self._circuit_breaker = circuit_breaker
+        self._rate_limiter = rate_limiter
+        self._query_cache = query_cache
+        self._ledger = ledger
+        self._hooks = list(hooks or ())
+        self._metrics: LatencyRecorder | None = None
+        if metrics:
+            self._metrics = LatencyRecorder()
+            self._hooks.append(self._metrics)
+        self._auth_manager: AuthenticationManager | None = None
+        if background_token_refresh:
+            self._get_auth_manager().start_background_refresh()
         self._transactions: TransactionManager | None = None
         self._subscriptions: SubscriptionManager | None = None
         self._webhooks: WebhookHandler | None = None
@@ -42,21 +76,76 @@ class TinkerClient:
 
     def transactions(self) -> TransactionManager:
         if self._transactions is None:
-            self._transactions = TransactionManager(self._config, self._auth_manager, self._session)
+            self._transactions = TransactionManager(
+                self._config,
+                self._get_auth_manager(),
+                self._get_session(),
+                retry_policy=self._retry_policy,
+                timeouts=self._timeouts,
+                cache=self._cache,
+                hooks=self._hooks,
+                codec=self._codec,
+                circuit_breaker=self._circuit_breaker,
+                rate_limiter=self._rate_limiter,
+                query_cache=self._query_cache,
+                ledger=self._ledger,
+            )
         return self._transactions
 
     def subscriptions(self) -> SubscriptionManager:
         if self._subscriptions is None:
-            self._subscriptions = SubscriptionManager(self._config, self._auth_manager, self._session)
+            self._subscriptions = SubscriptionManager(
+                self._config,
+                self._get_auth_manager(),
+                self._get_session(),
+                retry_policy=self._retry_policy,
+                timeouts=self._timeouts,
+                cache=self._cache,
+                hooks=self._hooks,
+                codec=self._codec,
+                circuit_breaker=self._circuit_breaker,
+                rate_limiter=self._rate_limiter,
+            )
         return self._subscriptions
 
     def webhooks(self) -> WebhookHandler:
         if self._webhooks is None:
-            self._webhooks = WebhookHandler()
+            self._webhooks = WebhookHandler(codec=self._codec, ledger=self._ledger)
         return self._webhooks
 
     def get_last_auth_meta(self) -> ApiMeta | None:
+        if self._auth_manager is None:
+            return None
         return self._auth_manager.get_last_meta()
 
+    def get_metrics(self) -> dict[str, EndpointMetrics]:
+        """Per-endpoint call metrics, keyed by ``"<METHOD> <path>"``; empty unless ``metrics=True``."""
+        if self._metrics is None:
+            return {}
+        return self._metrics.snapshot()
+
+    def close(self) -> None:
+        if self._auth_manager is not None:
+            self._auth_manager.stop_background_refresh()
+
+    def _get_session(self) -> Any:
+        if self._session is None:
+            self._session = create_session(self._pool)
+        return self._session
+
+    def _get_auth_manager(self) -> AuthenticationManager:
+        if self._auth_manager is None:
+            self._auth_manager = AuthenticationManager(
+                self._config,
+                self._get_session(),
+                self._token_store,
+                self._timeouts,
+                hooks=self._hooks,
+                codec=self._codec,
+                circuit_breaker=self._circuit_breaker,
+                rate_limiter=self._rate_limiter,
+            )
+        return self._auth_manager
+
 
 TinkerPayments = TinkerClient
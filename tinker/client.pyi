@@ -1,16 +1,27 @@
-from typing import Any
+from typing import Any, Iterable
 
 from .api import SubscriptionManager, TransactionManager
-from .configuration import Configuration
+from .cache import ResponseCache
+from .circuit import CircuitBreaker
+from .codec import JsonCodec
+from .configuration import Configuration, PoolConfig, Timeouts
+from .instrumentation import EndpointMetrics, RequestHooks
+from .ledger import TransactionLedger
 from .models import ApiMeta
+from .query_cache import QueryCache
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .token_store import TokenStore
 from .webhook import WebhookHandler
 
 class TinkerClient:
     config: Configuration
-    def __init__(self, api_public_key: str, api_secret_key: str, base_url: str | None = None, session: Any | None = None) -> None: ...
+    def __init__(self, api_public_key: str, api_secret_key: str, base_url: str | None = None, session: Any | None = None, background_token_refresh: bool = False, token_store: TokenStore | None = None, retry_policy: RetryPolicy | None = None, pool: PoolConfig | None = None, timeouts: Timeouts | None = None, cache: ResponseCache | None = None, hooks: Iterable[RequestHooks] | None = None, metrics: bool = False, codec: JsonCodec | None = None, circuit_breaker: CircuitBreaker | None = None, rate_limiter: RateLimiter | None = None, query_cache: QueryCache | None = None, ledger: TransactionLedger | None = None) -> None: ...
     def transactions(self) -> TransactionManager: ...
     def subscriptions(self) -> SubscriptionManager: ...
     def webhooks(self) -> WebhookHandler: ...
     def get_last_auth_meta(self) -> ApiMeta | None: ...
+    def get_metrics(self) -> dict[str, EndpointMetrics]: ...
+    def close(self) -> None: ...
 
 TinkerPayments = TinkerClient
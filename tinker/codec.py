@@ -0,0 +1,102 @@
+"""JSON codecs for API responses and webhook signing input.
+
+``JsonCodec`` uses the standard library and defines the canonical form that
+webhook signatures are computed over. ``OrjsonCodec`` is a faster drop-in used
+by default when ``orjson`` is installed. It decodes to the same Python values
+and produces byte-identical canonical output, deferring to the standard
+library for the inputs where orjson would differ: integers beyond 64 bits,
+floats that print in exponent form, NaN/Infinity and non-string keys.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any
+
+# orjson decodes integer literals beyond 64 bits as floats, so any decoded float
+# this large may have been an integer and is re-decoded with json.
+_INT64_LIMIT = float(2**63)
+
+
+class JsonCodec:
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def canonical(self, value: Any) -> bytes:
+        """Compact UTF-8 JSON, as used for webhook signatures."""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            value = self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # NaN, Infinity and lone surrogates are accepted by json; let it
+            # decide, and raise its usual errors for invalid input.
+            return json.loads(data)
+        return value if _floats_within(value, 0.0, _INT64_LIMIT) else json.loads(data)
+
+    def canonical(self, value: Any) -> bytes:
+        if _orjson_identical(value):
+            try:
+                return self._orjson.dumps(value)
+            except TypeError:
+                pass
+        return super().canonical(value)
+
+
+def _orjson_identical(value: Any) -> bool:
+    """Whether orjson serialises ``value`` exactly like ``JsonCodec.canonical``.
+
+    Floats are the only JSON values the two print differently: Python's
+    ``repr`` switches to exponent form below 1e-4 and from 1e16 up.
+    """
+    return _floats_within(value, 1e-4, 1e16)
+
+
+def _floats_within(value: Any, low: float, high: float) -> bool:
+    """Whether every float nested in ``value`` is zero or has ``low <= abs(x) < high``."""
+    stack = [value]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        cls = type(item)
+        if cls is str or cls is int:
+            continue
+        if cls is dict or (cls is not list and isinstance(item, dict)):
+            extend(item.values())
+        elif cls is list or isinstance(item, (list, tuple)):
+            extend(item)
+        elif isinstance(item, float):
+            magnitude = abs(item)
+            if not (magnitude == 0.0 or low <= magnitude < high):
+                return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def default_codec() -> JsonCodec:
+    try:
+        return OrjsonCodec()
+    except ModuleNotFoundError:
+        return JsonCodec()
+
+
+def decode_response(response: Any, codec: JsonCodec) -> Any:
+    """Decode a response body once, from its raw bytes when available."""
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return codec.loads(content) if content else {}
+    return response.json() if response.text else {}
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Mapping
 
 from . import endpoints
 
@@ -43,3 +44,35 @@ class Configuration:
             base_url=normalized_base_url,
             auth_url=auth_url,
         )
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """Connect/read timeouts in seconds, optionally overridden per endpoint path.
+
+    ``endpoints`` maps an endpoint path such as ``endpoints.PAYMENT_QUERY_PATH``
+    to a ``(connect, read)`` pair; paths not listed use ``connect``/``read``.
+    """
+
+    connect: float = 30.0
+    read: float = 30.0
+    endpoints: Mapping[str, tuple[float, float]] = field(default_factory=dict)
+
+    def for_endpoint(self, endpoint: str) -> tuple[float, float]:
+        path = "/" + endpoint.split("?", 1)[0].strip("/")
+        return self.endpoints.get(path, (self.connect, self.read))
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool sizing for the session ``TinkerClient`` creates.
+
+    ``maxsize`` is the number of connections kept per host; with ``block`` set,
+    callers wait for a free connection instead of opening (and then discarding)
+    extra ones once the pool is exhausted.
+    """
+
+    connections: int = 10
+    maxsize: int = 10
+    block: bool = False
+    keep_alive: bool = True
@@ -0,0 +1,131 @@
+"""Webhook deduplication stores.
+
+A ``WebhookHandler`` given a dedup store records each event id it accepts and
+rejects later deliveries of the same id, so retried or fanned-out webhooks run
+their side effects once.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+@dataclass(frozen=True)
+class DedupStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class DedupStore:
+    """Base class for event-id dedup stores."""
+
+    def add(self, key: str) -> bool:
+        """Record ``key``; return ``False`` if it was already present."""
+        raise NotImplementedError
+
+    def discard(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryDedupStore(DedupStore):
+    """In-process LRU of event ids with a TTL.
+
+    Lookups and inserts are O(1); at most ``max_entries`` ids are kept, evicting
+    the least recently seen first.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl: float = 24 * 60 * 60) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is not None and expires_at > now:
+                self._entries.move_to_end(key)
+                return False
+
+            self._entries[key] = now + self._ttl
+            self._entries.move_to_end(key)
+            self._evict(now)
+            return True
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _evict(self, now: float) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        while self._entries:
+            oldest_key, expires_at = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[oldest_key]
+
+
+class SQLiteDedupStore(DedupStore):
+    """Event ids in a SQLite database shared by processes on one host."""
+
+    def __init__(self, path: str, ttl: float = 24 * 60 * 60, timeout: float = 30.0, purge_every: int = 1000) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._timeout = timeout
+        self._purge_every = purge_every
+        self._adds = 0
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tinker_webhook_events (key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+        finally:
+            connection.close()
+
+    def add(self, key: str) -> bool:
+        now = time.time()
+        self._adds += 1
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            if self._adds % self._purge_every == 0:
+                connection.execute("DELETE FROM tinker_webhook_events WHERE expires_at <= ?", (now,))
+            else:
+                connection.execute(
+                    "DELETE FROM tinker_webhook_events WHERE key = ? AND expires_at <= ?", (key, now)
+                )
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO tinker_webhook_events (key, expires_at) VALUES (?, ?)",
+                (key, now + self._ttl),
+            )
+            connection.execute("COMMIT")
+            return cursor.rowcount == 1
+        finally:
+            connection.close()
+
+    def discard(self, key: str) -> None:
+        connection = self._connect()
+        try:
+            connection.execute("DELETE FROM tinker_webhook_events WHERE key = ?", (key,))
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Imported here so webhook-only deployments don't pay for sqlite3 at import time.
+        import sqlite3
+
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
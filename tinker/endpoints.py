@@ -8,3 +8,17 @@ PAYMENT_INITIATE_PATH = "/merchant/payment/initiate"
 PAYMENT_QUERY_PATH = "/merchant/payment/query"
 SUBSCRIPTION_BASE_PATH = "/merchant/subscriptions"
 SUBSCRIPTION_PLANS_PATH = "/merchant/subscriptions/plans"
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Group name for an API path, used to key circuit breakers and rate limits."""
+    path = "/" + endpoint.split("?", 1)[0].strip("/")
+    if path == PAYMENT_INITIATE_PATH:
+        return "initiate"
+    if path == PAYMENT_QUERY_PATH:
+        return "query"
+    if path == AUTH_TOKEN_PATH:
+        return "auth"
+    if path.startswith(SUBSCRIPTION_BASE_PATH):
+        return "subscriptions"
+    return path
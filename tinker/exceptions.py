@@ -13,5 +13,30 @@ class NetworkError(TinkerError):
     """Raised when request transport fails."""
 
 
+class CircuitOpenError(NetworkError):
+    """Raised without calling the API while an endpoint's circuit breaker is open."""
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        super().__init__(f"Circuit for {key} is open; retry in {retry_after:.1f}s")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class RateLimitError(TinkerError):
+    """Raised when the client-side rate limiter would delay a call beyond its max wait."""
+
+
 class InvalidPayloadError(TinkerError):
     """Raised when payload parsing or shape validation fails."""
+
+
+class InvalidSignatureError(InvalidPayloadError):
+    """Raised when a webhook signature does not match its payload."""
+
+
+class DuplicateEventError(TinkerError):
+    """Raised when a webhook event id has already been handled."""
+
+
+class PollingTimeoutError(TinkerError):
+    """Raised when a polled transaction does not reach a terminal status in time."""
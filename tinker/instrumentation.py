@@ -0,0 +1,193 @@
+"""Request lifecycle hooks and latency metrics.
+
+Managers given ``hooks`` call each hook's ``before_request`` before every HTTP
+attempt, ``on_retry`` before sleeping for a retry, and exactly one of
+``after_response`` or ``on_error`` when the call finishes. All four receive the
+call's ``RequestInfo``. Hooks run inline on the calling thread, so keep them
+fast. Without hooks, managers skip all of this work.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exceptions import TinkerError
+    from .models import ApiMeta
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class RequestInfo:
+    """State of one SDK call, filled in as it progresses.
+
+    ``endpoint`` is the API path without its query string. ``network_time``
+    sums the HTTP call of each attempt, excluding retry backoff sleeps and
+    rate-limiter waits; ``decode_time`` covers envelope parsing. ``meta`` holds the response ``ApiMeta`` (and so the
+    ``request_id``) once decoded.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "attempt",
+        "status_code",
+        "network_time",
+        "decode_time",
+        "meta",
+        "error",
+    )
+
+    def __init__(self, method: str, endpoint: str, url: str) -> None:
+        self.method = method
+        self.endpoint = "/" + endpoint.split("?", 1)[0].strip("/")
+        self.url = url
+        self.attempt = 0
+        self.status_code: int | None = None
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.meta: ApiMeta | None = None
+        self.error: TinkerError | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return self.network_time + self.decode_time
+
+    @property
+    def request_id(self) -> str | None:
+        return self.meta.request_id if self.meta is not None else None
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestInfo(method={self.method!r}, endpoint={self.endpoint!r}, attempt={self.attempt}, "
+            f"status_code={self.status_code!r}, elapsed={self.elapsed:.6f}, request_id={self.request_id!r})"
+        )
+
+
+class RequestHooks:
+    """Base class for lifecycle hooks; override the methods you need."""
+
+    def before_request(self, info: RequestInfo) -> None:
+        pass
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        pass
+
+    def after_response(self, info: RequestInfo) -> None:
+        pass
+
+    def on_error(self, info: RequestInfo) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class EndpointMetrics:
+    count: int
+    errors: int
+    retries: int
+    total_time: float
+    network_time: float
+    decode_time: float
+    max_time: float
+    buckets: tuple[int, ...]
+
+    @property
+    def mean(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the ``fraction`` quantile."""
+        return bucket_percentile(self.buckets, self.count, self.max_time, fraction)
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(0.50)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(0.99)
+
+
+def bucket_percentile(buckets: tuple[int, ...], count: int, max_time: float, fraction: float) -> float:
+    """Upper bound of the ``LATENCY_BUCKETS`` bucket holding the ``fraction`` quantile."""
+    if not count:
+        return 0.0
+    rank = max(1, round(fraction * count))
+    seen = 0
+    for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+        seen += bucket
+        if seen >= rank:
+            return min(bound, max_time)
+    return max_time
+
+
+class _EndpointCounters:
+    __slots__ = ("count", "errors", "retries", "total_time", "network_time", "decode_time", "max_time", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_time = 0.0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.max_time = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+class LatencyRecorder(RequestHooks):
+    """Per-endpoint call counts, error and retry counters and latency histograms.
+
+    Buckets are fixed (``LATENCY_BUCKETS`` plus an overflow bucket), so memory
+    stays constant however many calls are recorded.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: dict[tuple[str, str], _EndpointCounters] = {}
+        self._lock = threading.Lock()
+
+    def after_response(self, info: RequestInfo) -> None:
+        self._record(info, error=False)
+
+    def on_error(self, info: RequestInfo) -> None:
+        self._record(info, error=True)
+
+    def snapshot(self) -> dict[str, EndpointMetrics]:
+        """Metrics keyed by ``"<METHOD> <endpoint>"``."""
+        with self._lock:
+            return {
+                f"{method} {endpoint}": EndpointMetrics(
+                    count=counters.count,
+                    errors=counters.errors,
+                    retries=counters.retries,
+                    total_time=counters.total_time,
+                    network_time=counters.network_time,
+                    decode_time=counters.decode_time,
+                    max_time=counters.max_time,
+                    buckets=tuple(counters.buckets),
+                )
+                for (method, endpoint), counters in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def _record(self, info: RequestInfo, error: bool) -> None:
+        elapsed = info.elapsed
+        with self._lock:
+            counters = self._endpoints.get((info.method, info.endpoint))
+            if counters is None:
+                counters = self._endpoints[(info.method, info.endpoint)] = _EndpointCounters()
+            counters.count += 1
+            counters.errors += error
+            counters.retries += max(0, info.attempt - 1)
+            counters.total_time += elapsed
+            counters.network_time += info.network_time
+            counters.decode_time += info.decode_time
+            counters.max_time = max(counters.max_time, elapsed)
+            counters.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
@@ -0,0 +1,289 @@
+"""Local ledger of payment statuses.
+
+A ``TransactionLedger`` records the payments an application has seen, from
+webhooks and from ``TransactionManager`` results, so questions such as "what
+is the status of reference X" or "which payments have been pending for more
+than 15 minutes" are answered locally instead of through the API. Entries are
+indexed by reference, payment id and status.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .models import TERMINAL_STATUSES, Transaction
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from .webhook import WebhookEvent
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    """The latest known state of one payment.
+
+    ``started_at`` is the payment's ``created_at`` as a Unix timestamp, or the
+    time the ledger first saw it when the API did not say.
+    """
+
+    reference: str
+    status: str
+    id: str | None = None
+    amount: float | None = None
+    currency: str | None = None
+    channel: str | None = None
+    created_at: str | None = None
+    paid_at: str | None = None
+    started_at: float = 0.0
+    updated_at: float = 0.0
+
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+class LedgerBackend:
+    """Base class for ledger storage."""
+
+    def upsert(self, entry: LedgerEntry) -> LedgerEntry:
+        """Merge ``entry`` into the stored entry for its reference and return the result."""
+        raise NotImplementedError
+
+    def get(self, reference: str) -> LedgerEntry | None:
+        raise NotImplementedError
+
+    def get_by_id(self, payment_id: str) -> LedgerEntry | None:
+        raise NotImplementedError
+
+    def with_status(self, status: str, started_before: float | None = None) -> list[LedgerEntry]:
+        """Entries in ``status``, oldest first, optionally only those started before a timestamp."""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryLedgerBackend(LedgerBackend):
+    """Entries held in dicts for the life of the process."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, LedgerEntry] = {}
+        self._by_id: dict[str, str] = {}
+        self._by_status: dict[str, dict[str, None]] = {}
+        self._lock = threading.Lock()
+
+    def upsert(self, entry: LedgerEntry) -> LedgerEntry:
+        with self._lock:
+            old = self._entries.get(entry.reference)
+            merged = _merge(old, entry)
+            self._entries[entry.reference] = merged
+            if merged.id:
+                self._by_id[merged.id] = merged.reference
+            if old is not None and old.status != merged.status:
+                self._by_status[old.status].pop(old.reference, None)
+            self._by_status.setdefault(merged.status, {})[merged.reference] = None
+            return merged
+
+    def get(self, reference: str) -> LedgerEntry | None:
+        return self._entries.get(reference)
+
+    def get_by_id(self, payment_id: str) -> LedgerEntry | None:
+        reference = self._by_id.get(payment_id)
+        return self._entries.get(reference) if reference is not None else None
+
+    def with_status(self, status: str, started_before: float | None = None) -> list[LedgerEntry]:
+        with self._lock:
+            entries = [self._entries[reference] for reference in self._by_status.get(status, ())]
+        if started_before is not None:
+            entries = [entry for entry in entries if entry.started_at < started_before]
+        entries.sort(key=lambda entry: entry.started_at)
+        return entries
+
+    def count(self) -> int:
+        return len(self._entries)
+
+
+_COLUMNS = tuple(LedgerEntry.__dataclass_fields__)
+
+
+class SQLiteLedgerBackend(LedgerBackend):
+    """Entries in a SQLite database, shared by processes on one host and kept across restarts."""
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tinker_ledger ("
+                "reference TEXT PRIMARY KEY, status TEXT NOT NULL, id TEXT, amount REAL, currency TEXT, "
+                "channel TEXT, created_at TEXT, paid_at TEXT, started_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS tinker_ledger_id ON tinker_ledger (id)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS tinker_ledger_status ON tinker_ledger (status, started_at)"
+            )
+        finally:
+            connection.close()
+
+    def upsert(self, entry: LedgerEntry) -> LedgerEntry:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._select(connection, "WHERE reference = ?", (entry.reference,))
+                merged = _merge(rows[0] if rows else None, entry)
+                connection.execute(
+                    f"INSERT OR REPLACE INTO tinker_ledger ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                    tuple(asdict(merged).values()),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return merged
+        finally:
+            connection.close()
+
+    def get(self, reference: str) -> LedgerEntry | None:
+        rows = self._query("WHERE reference = ?", (reference,))
+        return rows[0] if rows else None
+
+    def get_by_id(self, payment_id: str) -> LedgerEntry | None:
+        rows = self._query("WHERE id = ? LIMIT 1", (payment_id,))
+        return rows[0] if rows else None
+
+    def with_status(self, status: str, started_before: float | None = None) -> list[LedgerEntry]:
+        if started_before is None:
+            return self._query("WHERE status = ? ORDER BY started_at", (status,))
+        return self._query("WHERE status = ? AND started_at < ? ORDER BY started_at", (status, started_before))
+
+    def count(self) -> int:
+        connection = self._connect()
+        try:
+            return int(connection.execute("SELECT COUNT(*) FROM tinker_ledger").fetchone()[0])
+        finally:
+            connection.close()
+
+    def _query(self, clause: str, params: tuple[Any, ...]) -> list[LedgerEntry]:
+        connection = self._connect()
+        try:
+            return self._select(connection, clause, params)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _select(connection: sqlite3.Connection, clause: str, params: tuple[Any, ...]) -> list[LedgerEntry]:
+        cursor = connection.execute(f"SELECT {', '.join(_COLUMNS)} FROM tinker_ledger {clause}", params)
+        return [LedgerEntry(*row) for row in cursor.fetchall()]
+
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+
+
+class TransactionLedger:
+    """Payment statuses recorded from webhooks and API results.
+
+    Pass one to ``TinkerClient(ledger=...)`` to record every ``initiate`` and
+    ``query`` result and every payment webhook the client's handler accepts,
+    or feed it directly with ``record_event`` and ``record_transaction``. A
+    terminal status is never replaced by a non-terminal one, so late or
+    reordered deliveries don't reopen a settled payment.
+    """
+
+    def __init__(self, backend: LedgerBackend | None = None) -> None:
+        self._backend = backend if backend is not None else MemoryLedgerBackend()
+
+    @property
+    def backend(self) -> LedgerBackend:
+        return self._backend
+
+    def __len__(self) -> int:
+        return self._backend.count()
+
+    def record_event(self, event: WebhookEvent) -> LedgerEntry | None:
+        """Record a payment webhook; other sources are ignored."""
+        if event.source != "payment":
+            return None
+        return self._record(event.raw_data)
+
+    def record_transaction(self, transaction: Transaction) -> LedgerEntry | None:
+        data = transaction.query_data or transaction.initiation_data or {}
+        return self._record({**data, "status": transaction.status})
+
+    def get(self, reference: str) -> LedgerEntry | None:
+        return self._backend.get(reference)
+
+    def get_by_id(self, payment_id: str) -> LedgerEntry | None:
+        return self._backend.get_by_id(payment_id)
+
+    def status(self, reference: str) -> str | None:
+        entry = self._backend.get(reference)
+        return entry.status if entry is not None else None
+
+    def with_status(self, status: str) -> list[LedgerEntry]:
+        return self._backend.with_status(status)
+
+    def pending_older_than(self, seconds: float) -> list[LedgerEntry]:
+        """Payments still pending that started more than ``seconds`` ago, oldest first."""
+        return self._backend.with_status("pending", started_before=time.time() - seconds)
+
+    def _record(self, data: dict[str, Any]) -> LedgerEntry | None:
+        reference = data.get("reference") or data.get("paymentReference") or data.get("payment_reference")
+        if not reference:
+            return None
+
+        now = time.time()
+        created_at = _optional_str(data.get("created_at"))
+        amount = data.get("amount")
+        return self._backend.upsert(
+            LedgerEntry(
+                reference=str(reference),
+                status=str(data.get("status") or "pending"),
+                id=_optional_str(data.get("id")),
+                amount=float(amount) if isinstance(amount, (int, float)) else None,
+                currency=_optional_str(data.get("currency")),
+                channel=_optional_str(data.get("channel")),
+                created_at=created_at,
+                paid_at=_optional_str(data.get("paid_at")),
+                started_at=_timestamp(created_at) or now,
+                updated_at=now,
+            )
+        )
+
+
+def _merge(old: LedgerEntry | None, new: LedgerEntry) -> LedgerEntry:
+    if old is None:
+        return new
+    status = old.status if old.is_terminal() and not new.is_terminal() else new.status
+    return replace(
+        new,
+        status=status,
+        id=new.id or old.id,
+        amount=new.amount if new.amount is not None else old.amount,
+        currency=new.currency or old.currency,
+        channel=new.channel or old.channel,
+        created_at=new.created_at or old.created_at,
+        paid_at=new.paid_at or old.paid_at,
+        started_at=new.started_at if new.created_at else old.started_at,
+    )
+
+
+def _optional_str(value: Any) -> str | None:
+    return str(value) if value not in (None, "") else None
+
+
+def _timestamp(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
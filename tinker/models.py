@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from .retry import RetryStats
 
 
 @dataclass(frozen=True)
@@ -22,12 +26,99 @@ class ApiMeta:
         )
 
 
-@dataclass
-class Transaction:
+class _Slotted:
+    """Pickling, equality and repr for hand-written ``__slots__`` models.
+
+    Frozen slotted classes reject ``setattr``, so state is restored with
+    ``object.__setattr__``.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in _slot_names(type(self))}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
+# Payment statuses that never change again.
+TERMINAL_STATUSES = frozenset({"success", "failed", "cancelled"})
+
+# Marks a callback_data that is the same dict as query_data, so it is stored once.
+_SAME_AS_QUERY: Any = object()
+
+
+# A dataclass only for ``fields``, ``asdict`` and ``replace``: __init__, __eq__ and
+# __repr__ are hand-written around the slots.
+@dataclass(init=False, repr=False, eq=False)
+class Transaction(_Slotted):
+    __slots__ = ("status", "initiation_data", "query_data", "_callback_data")
+
     status: str
-    initiation_data: dict[str, Any] | None = None
-    query_data: dict[str, Any] | None = None
-    callback_data: dict[str, Any] | None = None
+    initiation_data: dict[str, Any] | None
+    query_data: dict[str, Any] | None
+    callback_data: dict[str, Any] | None
+
+    def __init__(
+        self,
+        status: str,
+        initiation_data: dict[str, Any] | None = None,
+        query_data: dict[str, Any] | None = None,
+        callback_data: dict[str, Any] | None = None,
+    ) -> None:
+        self.status = status
+        self.initiation_data = initiation_data
+        self.query_data = query_data
+        self.callback_data = callback_data
+
+    @property
+    def callback_data(self) -> dict[str, Any] | None:
+        if self._callback_data is _SAME_AS_QUERY:
+            return self.query_data
+        return self._callback_data
+
+    @callback_data.setter
+    def callback_data(self, value: dict[str, Any] | None) -> None:
+        self._callback_data = _SAME_AS_QUERY if value is not None and value is self.query_data else value
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.status, self.initiation_data, self.query_data, self.callback_data) == (
+            other.status,
+            other.initiation_data,
+            other.query_data,
+            other.callback_data,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "initiation_data": self.initiation_data,
+            "query_data": self.query_data,
+            "callback_data": self.callback_data,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return (
+            f"Transaction(status={self.status!r}, initiation_data={self.initiation_data!r}, "
+            f"query_data={self.query_data!r}, callback_data={self.callback_data!r})"
+        )
 
     @classmethod
     def from_dict(cls, data: dict[str, Any] | None) -> "Transaction":
@@ -60,3 +151,69 @@ class Transaction:
 
     def is_failed(self) -> bool:
         return self.status == "failed"
+
+
+@dataclass
+class BatchItem:
+    payload: dict[str, Any]
+    transaction: Transaction | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+    # None when the result came from a query cache without an HTTP call.
+    retry_stats: RetryStats | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    throughput: float = 0.0
+    latency_p50: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+
+    @classmethod
+    def from_items(cls, items: list[BatchItem], elapsed: float) -> "BatchStats":
+        latencies = sorted(item.elapsed for item in items)
+        failed = sum(1 for item in items if item.error is not None)
+        return cls(
+            total=len(items),
+            succeeded=len(items) - failed,
+            failed=failed,
+            elapsed=elapsed,
+            throughput=len(items) / elapsed if elapsed > 0 else 0.0,
+            latency_p50=_percentile(latencies, 0.50),
+            latency_p99=_percentile(latencies, 0.99),
+            latency_max=latencies[-1] if latencies else 0.0,
+        )
+
+
+@dataclass
+class BatchResult:
+    items: list[BatchItem]
+    stats: BatchStats
+
+    def __iter__(self) -> Iterator[BatchItem]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def transactions(self) -> list[Transaction | None]:
+        return [item.transaction for item in self.items]
+
+    def errors(self) -> list[BatchItem]:
+        return [item for item in self.items if item.error is not None]
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[rank]
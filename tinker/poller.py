@@ -0,0 +1,273 @@
+"""Shared status polling for pending transactions.
+
+A ``TransactionPoller`` tracks many pending payment references on one
+scheduler thread. Each reference is queried on its own backoff schedule, at
+most ``max_concurrency`` queries run at a time, and each reference resolves a
+``Future`` once it reaches a terminal status. Payment webhooks fed to the
+poller resolve their reference immediately and stop its polling.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from .exceptions import PollingTimeoutError
+from .models import TERMINAL_STATUSES
+from .rate_limit import batch_priority
+
+if TYPE_CHECKING:
+    from .api import TransactionManager
+    from .models import Transaction
+    from .webhook import WebhookEvent
+
+
+@dataclass
+class _Tracked:
+    payload: dict[str, Any]
+    future: Future
+    interval: float
+    deadline: float | None
+    generation: int = 0
+    attempts: int = 0
+    errors: int = 0
+
+
+class TransactionPoller:
+    """Polls ``TransactionManager.query`` for many references at once.
+
+    The first query for a reference runs ``initial_interval`` seconds after
+    ``track``; every non-terminal answer multiplies its interval by ``backoff``
+    up to ``max_interval``, with +/- ``jitter`` spread so references tracked
+    together drift apart. A reference fails with the query error after
+    ``max_errors`` consecutive failed queries, and with ``PollingTimeoutError``
+    once ``timeout`` seconds pass without a terminal status.
+    """
+
+    def __init__(
+        self,
+        transactions: TransactionManager,
+        max_concurrency: int = 8,
+        initial_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        jitter: float = 0.1,
+        timeout: float | None = None,
+        max_errors: int = 5,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        self._transactions = transactions
+        self._max_concurrency = max_concurrency
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._jitter = jitter
+        self._timeout = timeout
+        self._max_errors = max_errors
+        self._tracked: dict[str, _Tracked] = {}
+        self._schedule: list[tuple[float, int, str]] = []
+        self._generations = itertools.count(1)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def __enter__(self) -> TransactionPoller:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def track(
+        self,
+        payload: dict[str, Any],
+        callback: Callable[[Future], Any] | None = None,
+    ) -> Future:
+        """Poll the query ``payload`` until its transaction reaches a terminal status.
+
+        Tracking a reference that is already tracked returns the existing
+        future instead of polling it twice. ``callback`` is added to the future
+        with ``add_done_callback``.
+        """
+        reference = str(payload.get("reference") or "")
+        if not reference:
+            raise ValueError("payload must include a reference")
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("poller is closed")
+            tracked = self._tracked.get(reference)
+            if tracked is None:
+                deadline = time.monotonic() + self._timeout if self._timeout is not None else None
+                tracked = _Tracked(
+                    payload=dict(payload),
+                    future=Future(),
+                    interval=self._initial_interval,
+                    deadline=deadline,
+                )
+                self._tracked[reference] = tracked
+                self._schedule_locked(reference, tracked, self._initial_interval)
+                self._ensure_started()
+                self._condition.notify()
+
+        if callback is not None:
+            tracked.future.add_done_callback(callback)
+        return tracked.future
+
+    def feed_webhook(self, event: WebhookEvent) -> bool:
+        """Resolve a tracked reference from a payment webhook.
+
+        Returns ``True`` when the event carried a terminal status for a tracked
+        reference. Only the raw event data is inspected until a match is found.
+        The event must already be verified, e.g. built by ``handle_verified``:
+        its status completes the future as-is.
+        """
+        if event.source != "payment":
+            return False
+        reference = str(event.raw_data.get("reference") or "")
+        if str(event.raw_data.get("status") or "") not in TERMINAL_STATUSES:
+            return False
+
+        with self._condition:
+            tracked = self._tracked.pop(reference, None)
+            self._condition.notify()
+        if tracked is None:
+            return False
+        _resolve(tracked.future, result=event.to_transaction())
+        return True
+
+    def cancel(self, reference: str) -> bool:
+        with self._condition:
+            tracked = self._tracked.pop(reference, None)
+            self._condition.notify()
+        return tracked is not None and tracked.future.cancel()
+
+    def close(self, wait: bool = True) -> None:
+        """Stop polling and cancel the futures of references still pending."""
+        with self._condition:
+            self._closed = True
+            remaining = list(self._tracked.values())
+            self._tracked.clear()
+            self._condition.notify()
+        for tracked in remaining:
+            tracked.future.cancel()
+        if self._thread is not None and wait:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="tinker-poller"
+            )
+            self._thread = threading.Thread(target=self._run, name="tinker-poller-scheduler", daemon=True)
+            self._thread.start()
+
+    def _schedule_locked(self, reference: str, tracked: _Tracked, delay: float) -> None:
+        due = time.monotonic() + delay
+        if tracked.deadline is not None:
+            due = min(due, tracked.deadline)
+        tracked.generation = next(self._generations)
+        heapq.heappush(self._schedule, (due, tracked.generation, reference))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                expired = self._dispatch_locked()
+                if not expired:
+                    self._condition.wait(self._next_wait_locked())
+            for tracked in expired:
+                reference = tracked.payload.get("reference")
+                _resolve(
+                    tracked.future,
+                    error=PollingTimeoutError(f"Transaction {reference} still pending after {tracked.attempts} queries"),
+                )
+
+    def _dispatch_locked(self) -> list[_Tracked]:
+        """Submit due queries while slots are free; return references past their deadline."""
+        expired = []
+        now = time.monotonic()
+        while self._schedule and self._in_flight < self._max_concurrency:
+            due, generation, reference = self._schedule[0]
+            tracked = self._tracked.get(reference)
+            if tracked is None or tracked.generation != generation:
+                heapq.heappop(self._schedule)
+                continue
+            if due > now:
+                break
+            heapq.heappop(self._schedule)
+            if tracked.deadline is not None and now >= tracked.deadline:
+                del self._tracked[reference]
+                expired.append(tracked)
+                continue
+            self._in_flight += 1
+            self._executor.submit(self._poll, reference, tracked, generation)
+        return expired
+
+    def _next_wait_locked(self) -> float | None:
+        if not self._schedule or self._in_flight >= self._max_concurrency:
+            return None
+        return max(0.0, self._schedule[0][0] - time.monotonic())
+
+    def _poll(self, reference: str, tracked: _Tracked, generation: int) -> None:
+        transaction: Transaction | None = None
+        error: Exception | None = None
+        try:
+            with batch_priority():
+                transaction = self._transactions.query(tracked.payload)
+        except Exception as exc:  # noqa: BLE001
+            # Any failure, not just TinkerError, must release the slot and count
+            # toward max_errors; otherwise the future would never resolve.
+            error = exc
+
+        done = False
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+            if self._tracked.get(reference) is not tracked or tracked.generation != generation:
+                return
+
+            tracked.attempts += 1
+            if error is not None:
+                tracked.errors += 1
+                done = tracked.errors >= self._max_errors
+            else:
+                tracked.errors = 0
+                done = transaction.status in TERMINAL_STATUSES
+
+            if done:
+                del self._tracked[reference]
+            else:
+                tracked.interval = min(self._max_interval, tracked.interval * self._backoff)
+                spread = 1 + random.uniform(-self._jitter, self._jitter)
+                self._schedule_locked(reference, tracked, tracked.interval * spread)
+
+        if done:
+            _resolve(tracked.future, result=transaction, error=error)
+
+
+def _resolve(future: Future, result: Any = None, error: BaseException | None = None) -> None:
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        # The caller cancelled the future while its last query was in flight.
+        pass
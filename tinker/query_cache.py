@@ -0,0 +1,109 @@
+"""Coalescing cache for payment status queries."""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .models import Transaction
+
+
+@dataclass(frozen=True)
+class QueryCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+class QueryCache:
+    """Single-flight query coalescing with an LRU of settled results.
+
+    Concurrent ``TransactionManager.query`` calls for the same payload share
+    one request. Transactions that reached a terminal status (success, failed
+    or cancelled) are kept in an LRU of ``max_entries`` and served without a
+    network call. Pending results are cached for ``pending_ttl`` seconds,
+    which defaults to 0 so status polling always sees fresh data. Callers
+    receive copies, so mutating a result does not affect the cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, pending_ttl: float = 0.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._pending_ttl = pending_ttl
+        # key -> (transaction, expires_at); expires_at is None for terminal results.
+        self._entries: OrderedDict[str, tuple[Transaction, float | None]] = OrderedDict()
+        self._in_flight: dict[str, Future[Transaction]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(namespace: str, payload: dict[str, Any]) -> str:
+        return f"{namespace}|{json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)}"
+
+    def fetch(self, key: str, query: Callable[[], Transaction]) -> Transaction:
+        """Return the cached transaction for ``key``, or run ``query`` once for all concurrent callers."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                transaction, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return copy.deepcopy(transaction)
+                del self._entries[key]
+
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self._misses += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            transaction = query()
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._store(key, transaction)
+            del self._in_flight[key]
+        future.set_result(transaction)
+        return transaction
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> QueryCacheStats:
+        return QueryCacheStats(hits=self._hits, misses=self._misses, coalesced=self._coalesced)
+
+    def _store(self, key: str, transaction: Transaction) -> None:
+        if transaction.is_successful() or transaction.is_failed() or transaction.is_cancelled():
+            expires_at = None
+        elif self._pending_ttl > 0:
+            expires_at = time.monotonic() + self._pending_ttl
+        else:
+            return
+        self._entries[key] = (copy.deepcopy(transaction), expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,245 @@
+"""Client-side token-bucket rate limiting.
+
+A ``RateLimiter`` shared by the managers of a ``TinkerClient`` holds one token
+bucket per endpoint group (``initiate``, ``query``, ``subscriptions``,
+``auth``). Every HTTP attempt takes a token, waiting for one if the bucket is
+empty.
+
+Calls made in the batch lane (``query_many``, paginated iterators, the
+transaction poller, or anything inside ``with batch_priority():``) only take a
+token while the bucket holds more than ``RateLimit.batch_reserve`` of its
+burst, so interactive calls keep headroom during bulk sweeps.
+
+A 429 response halves the bucket's rate and pauses it for the response's
+``Retry-After``; the rate then climbs back to full over ``recovery_time``.
+Bucket state lives in a backend: ``MemoryRateLimitBackend`` for one process,
+``SQLiteRateLimitBackend`` to share one budget between processes on a host.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping
+
+from .exceptions import RateLimitError
+from .retry import _parse_retry_after
+
+if TYPE_CHECKING:
+    import sqlite3
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("tinker_rate_limit_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def batch_priority() -> Iterator[None]:
+    """Run the enclosed calls in the batch lane."""
+    token = _priority.set(BATCH)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``rate`` requests per second with bursts of up to ``burst`` requests."""
+
+    rate: float
+    burst: float = 1.0
+    batch_reserve: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+@dataclass
+class BucketState:
+    tokens: float
+    updated_at: float
+    paused_until: float = 0.0
+    factor: float = 1.0
+
+    def take(self, limit: RateLimit, reserve: float, recovery: float, now: float) -> float:
+        """Take a token if one is available; otherwise return the seconds to wait.
+
+        ``recovery`` is how much ``factor`` regains per second after a pause.
+        """
+        if now < self.paused_until:
+            return self.paused_until - now
+        elapsed = max(0.0, now - max(self.updated_at, self.paused_until))
+        if self.factor < 1.0:
+            self.factor = min(1.0, self.factor + elapsed * recovery)
+        rate = limit.rate * self.factor
+        self.tokens = min(limit.burst, self.tokens + elapsed * rate)
+        self.updated_at = now
+        needed = min(limit.burst, 1.0 + reserve)
+        # Tolerate float error so a refill that is due doesn't yield a zero-length wait.
+        if self.tokens >= needed - 1e-9:
+            self.tokens = max(0.0, self.tokens - 1.0)
+            return 0.0
+        return (needed - self.tokens) / rate
+
+    def slow_down(self, pause: float, min_factor: float, now: float) -> None:
+        self.factor = max(min_factor, self.factor / 2)
+        self.tokens = 0.0
+        self.updated_at = now
+        self.paused_until = max(self.paused_until, now + pause)
+
+
+class RateLimitBackend:
+    """Base class for bucket state storage.
+
+    Implementations run the ``BucketState`` operation for a key atomically.
+    """
+
+    def take(self, key: str, limit: RateLimit, reserve: float, recovery: float) -> float:
+        raise NotImplementedError
+
+    def slow_down(self, key: str, limit: RateLimit, pause: float, min_factor: float) -> None:
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets shared by the clients of one process."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, BucketState] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, limit: RateLimit, reserve: float, recovery: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            return self._bucket(key, limit, now).take(limit, reserve, recovery, now)
+
+    def slow_down(self, key: str, limit: RateLimit, pause: float, min_factor: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._bucket(key, limit, now).slow_down(pause, min_factor, now)
+
+    def _bucket(self, key: str, limit: RateLimit, now: float) -> BucketState:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = BucketState(tokens=limit.burst, updated_at=now)
+        return bucket
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Buckets in a SQLite database, shared by every process on the host.
+
+    Each operation is one ``BEGIN IMMEDIATE`` transaction, so processes see a
+    consistent bucket. Times are wall-clock seconds.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tinker_rate_limits (key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+        finally:
+            connection.close()
+
+    def take(self, key: str, limit: RateLimit, reserve: float, recovery: float) -> float:
+        return self._update(key, limit, lambda bucket, now: bucket.take(limit, reserve, recovery, now))
+
+    def slow_down(self, key: str, limit: RateLimit, pause: float, min_factor: float) -> None:
+        self._update(key, limit, lambda bucket, now: bucket.slow_down(pause, min_factor, now))
+
+    def _update(self, key: str, limit: RateLimit, operation: Callable[[BucketState, float], Any]) -> Any:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = connection.execute("SELECT state FROM tinker_rate_limits WHERE key = ?", (key,)).fetchone()
+                bucket = BucketState(**json.loads(row[0])) if row else BucketState(tokens=limit.burst, updated_at=now)
+                result = operation(bucket, now)
+                connection.execute(
+                    "INSERT OR REPLACE INTO tinker_rate_limits (key, state) VALUES (?, ?)",
+                    (key, json.dumps(bucket.__dict__)),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+
+
+class RateLimiter:
+    """Token buckets per endpoint group, shared by a client's managers.
+
+    ``limits`` maps group names to a ``RateLimit``; groups not listed use
+    ``default``, or are unlimited when ``default`` is None. A call that would
+    wait longer than ``max_wait`` seconds raises ``RateLimitError`` instead.
+    After a 429 the rate drops to as little as ``min_factor`` of the limit
+    and climbs back to full over ``recovery_time`` seconds.
+    """
+
+    def __init__(
+        self,
+        default: RateLimit | None = None,
+        limits: Mapping[str, RateLimit] | None = None,
+        backend: RateLimitBackend | None = None,
+        max_wait: float | None = None,
+        min_factor: float = 0.1,
+        recovery_time: float = 60.0,
+        default_pause: float = 1.0,
+    ) -> None:
+        self._default = default
+        self._limits = dict(limits or {})
+        self._backend = backend if backend is not None else MemoryRateLimitBackend()
+        self._max_wait = max_wait
+        self._min_factor = min_factor
+        self._recovery = (1.0 - min_factor) / recovery_time if recovery_time > 0 else float("inf")
+        self._default_pause = default_pause
+
+    def limit_for(self, key: str) -> RateLimit | None:
+        return self._limits.get(key, self._default)
+
+    def acquire(self, key: str, priority: str | None = None) -> float:
+        """Block until a request to ``key`` may be sent; return the seconds waited."""
+        limit = self.limit_for(key)
+        if limit is None:
+            return 0.0
+
+        lane = priority or _priority.get()
+        reserve = limit.batch_reserve * limit.burst if lane == BATCH else 0.0
+        waited = 0.0
+        while True:
+            delay = self._backend.take(key, limit, reserve, self._recovery)
+            if delay <= 0:
+                return waited
+            if self._max_wait is not None and waited + delay > self._max_wait:
+                raise RateLimitError(f"Rate limit for {key} would delay this call by more than {self._max_wait}s")
+            time.sleep(delay)
+            waited += delay
+
+    def observe(self, key: str, status_code: int, headers: Any = None) -> None:
+        """Slow ``key`` down after a 429 response."""
+        if status_code != 429:
+            return
+        limit = self.limit_for(key)
+        if limit is None:
+            return
+        pause = _parse_retry_after(headers)
+        self._backend.slow_down(key, limit, self._default_pause if pause is None else pause, self._min_factor)
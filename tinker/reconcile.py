@@ -0,0 +1,238 @@
+"""Streaming totals for reconciling payments, invoices and settlements.
+
+``ReconciliationAggregator`` sums event amounts by source, currency, status
+and day. Each event is mapped to a small integer group id. With NumPy
+installed, ids and amounts are appended to fixed-size ``array`` columns and
+folded into the group totals a batch at a time with ``bincount``; without it,
+each event is added to its group directly. Either way memory stays
+proportional to the number of groups, not the number of events.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, Union
+
+from .webhook import InvoiceEventData, PaymentEventData, SettlementEventData, WebhookEvent
+
+ReconcilableEvent = Union[WebhookEvent, PaymentEventData, InvoiceEventData, SettlementEventData]
+
+_SOURCES = {PaymentEventData: "payment", InvoiceEventData: "invoice", SettlementEventData: "settlement"}
+_NAN = math.nan
+
+
+@dataclass(frozen=True)
+class ReconciliationGroup:
+    """Totals for one (source, currency, status, day) group.
+
+    ``fees`` is ``amount - net_amount`` summed over the ``net_count`` events
+    that carried a ``net_amount``; only settlements do.
+    """
+
+    source: str
+    currency: str
+    status: str
+    day: str
+    count: int
+    amount: float
+    net_amount: float
+    net_count: int
+    fees: float
+
+
+class ReconciliationAggregator:
+    """Grouped totals over a stream of payment, invoice and settlement events.
+
+    Feed it ``WebhookEvent``s (read from their raw data, without building the
+    typed objects), the typed event data, or raw ``data`` dicts with their
+    ``source``. Subscription events carry no amount and are skipped.
+    ``use_numpy`` defaults to using NumPy when it is importable.
+    """
+
+    def __init__(self, batch_size: int = 65536, use_numpy: bool | None = None) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._numpy = _load_numpy() if use_numpy is None or use_numpy else None
+        if use_numpy and self._numpy is None:
+            raise ModuleNotFoundError("use_numpy=True requires numpy")
+        self._group_ids: dict[tuple[str, str, str, str], int] = {}
+        self._counts: list[int] = []
+        self._amounts: list[float] = []
+        self._net_amounts: list[float] = []
+        self._net_counts: list[int] = []
+        self._fees: list[float] = []
+        self._pending_ids = array("q")
+        self._pending_amounts = array("d")
+        self._pending_nets = array("d")
+
+    def __len__(self) -> int:
+        """Number of events added so far."""
+        return sum(self._counts) + len(self._pending_ids)
+
+    def add(self, event: ReconcilableEvent | dict[str, Any], source: str | None = None) -> None:
+        if isinstance(event, WebhookEvent):
+            self._add_raw(event.source, event.raw_data)
+        elif isinstance(event, dict):
+            if source is None:
+                raise ValueError("source is required for raw event data")
+            self._add_raw(source, event)
+        else:
+            source = _SOURCES.get(type(event))
+            if source is None:
+                return
+            # Same fallback as _add_raw, so typed and raw settlements share a day bucket.
+            day_field = (event.settlement_date or event.created_at) if source == "settlement" else event.created_at
+            net_amount = event.net_amount if source == "settlement" else None
+            self._append(source, event.currency, event.status, day_field, event.amount, net_amount)
+
+    def add_many(self, events: Iterable[ReconcilableEvent | dict[str, Any]], source: str | None = None) -> None:
+        add = self.add
+        for event in events:
+            add(event, source)
+
+    def groups(self) -> list[ReconciliationGroup]:
+        """Totals per group, sorted by source, currency, status and day."""
+        self._flush()
+        groups = [
+            ReconciliationGroup(
+                source=key[0],
+                currency=key[1],
+                status=key[2],
+                day=key[3],
+                count=self._counts[index],
+                amount=self._amounts[index],
+                net_amount=self._net_amounts[index],
+                net_count=self._net_counts[index],
+                fees=self._fees[index],
+            )
+            for key, index in self._group_ids.items()
+        ]
+        groups.sort(key=lambda group: (group.source, group.currency, group.status, group.day))
+        return groups
+
+    def totals(self, by: Iterable[str] = ("currency",)) -> dict[tuple[str, ...], ReconciliationGroup]:
+        """Roll groups up to the ``by`` fields, e.g. ``("currency", "status")``.
+
+        The returned groups keep the ``by`` fields and blank out the others.
+        """
+        fields = tuple(by)
+        unknown = set(fields) - {"source", "currency", "status", "day"}
+        if unknown:
+            raise ValueError(f"Unknown grouping fields: {', '.join(sorted(unknown))}")
+
+        rolled: dict[tuple[str, ...], list[Any]] = {}
+        for group in self.groups():
+            key = tuple(getattr(group, name) for name in fields)
+            sums = rolled.setdefault(key, [0, 0.0, 0.0, 0, 0.0])
+            sums[0] += group.count
+            sums[1] += group.amount
+            sums[2] += group.net_amount
+            sums[3] += group.net_count
+            sums[4] += group.fees
+        return {
+            key: ReconciliationGroup(
+                source=key[fields.index("source")] if "source" in fields else "",
+                currency=key[fields.index("currency")] if "currency" in fields else "",
+                status=key[fields.index("status")] if "status" in fields else "",
+                day=key[fields.index("day")] if "day" in fields else "",
+                count=sums[0],
+                amount=sums[1],
+                net_amount=sums[2],
+                net_count=sums[3],
+                fees=sums[4],
+            )
+            for key, sums in rolled.items()
+        }
+
+    def _add_raw(self, source: str, data: dict[str, Any]) -> None:
+        if source not in ("payment", "invoice", "settlement"):
+            return
+        if source == "settlement":
+            day_field = data.get("settlement_date") or data.get("created_at")
+            net_amount = data.get("net_amount")
+        else:
+            day_field = data.get("created_at")
+            net_amount = None
+        self._append(
+            source,
+            str(data.get("currency", "")),
+            str(data.get("status", "")),
+            day_field,
+            float(data.get("amount", 0)),
+            float(net_amount) if net_amount is not None else None,
+        )
+
+    def _append(
+        self,
+        source: str,
+        currency: str,
+        status: str,
+        day_field: str | None,
+        amount: float,
+        net_amount: float | None,
+    ) -> None:
+        key = (source, currency, status, str(day_field or "")[:10])
+        group_id = self._group_ids.get(key)
+        if group_id is None:
+            group_id = self._group_ids[key] = len(self._counts)
+            self._counts.append(0)
+            self._amounts.append(0.0)
+            self._net_amounts.append(0.0)
+            self._net_counts.append(0)
+            self._fees.append(0.0)
+
+        if self._numpy is None:
+            # Without NumPy, folding each event straight into its group is cheaper than buffering.
+            self._counts[group_id] += 1
+            self._amounts[group_id] += amount
+            if net_amount is not None:
+                self._net_counts[group_id] += 1
+                self._net_amounts[group_id] += net_amount
+                self._fees[group_id] += amount - net_amount
+            return
+
+        self._pending_ids.append(group_id)
+        self._pending_amounts.append(amount)
+        self._pending_nets.append(_NAN if net_amount is None else net_amount)
+        if len(self._pending_ids) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending_ids:
+            return
+        self._fold_numpy()
+        self._pending_ids = array("q")
+        self._pending_amounts = array("d")
+        self._pending_nets = array("d")
+
+    def _fold_numpy(self) -> None:
+        np = self._numpy
+        size = len(self._counts)
+        ids = np.frombuffer(self._pending_ids, dtype=np.int64)
+        amounts = np.frombuffer(self._pending_amounts, dtype=np.float64)
+        nets = np.frombuffer(self._pending_nets, dtype=np.float64)
+        has_net = ~np.isnan(nets)
+        net_ids = ids[has_net]
+
+        counts = np.bincount(ids, minlength=size)
+        amount_sums = np.bincount(ids, weights=amounts, minlength=size)
+        net_counts = np.bincount(net_ids, minlength=size)
+        net_sums = np.bincount(net_ids, weights=nets[has_net], minlength=size)
+        fee_sums = np.bincount(net_ids, weights=amounts[has_net] - nets[has_net], minlength=size)
+        for index in np.flatnonzero(counts).tolist():
+            self._counts[index] += int(counts[index])
+            self._amounts[index] += float(amount_sums[index])
+            self._net_counts[index] += int(net_counts[index])
+            self._net_amounts[index] += float(net_sums[index])
+            self._fees[index] += float(fee_sums[index])
+
+
+def _load_numpy() -> Any:
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        return None
+    return numpy
@@ -0,0 +1,80 @@
+"""Retry policy for API requests."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How ``BaseManager`` retries transient failures.
+
+    Only retryable calls are retried: GET requests, payment queries and payment
+    initiation (which always carries an ``Idempotency-Key``). Delays follow
+    ``backoff_base * 2 ** (retry - 1)`` capped at ``backoff_max``, with full
+    jitter so clients that failed together do not retry together. A
+    ``Retry-After`` header on a retryable response takes precedence, capped at
+    ``max_retry_after``.
+    """
+
+    max_attempts: int = 3
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: tuple[type[BaseException], ...] = (OSError,)
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def should_retry_status(self, status_code: int, attempt: int) -> bool:
+        return attempt < self.max_attempts and status_code in self.retry_statuses
+
+    def should_retry_exception(self, exc: BaseException, attempt: int) -> bool:
+        return attempt < self.max_attempts and isinstance(exc, self.retry_exceptions)
+
+    def compute_delay(self, attempt: int, response: Any | None = None) -> float:
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(getattr(response, "headers", None))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    attempts: int = 1
+    retry_time: float = 0.0
+
+    @property
+    def retries(self) -> int:
+        return self.attempts - 1
+
+
+def _parse_retry_after(headers: Any) -> float | None:
+    if not headers:
+        return None
+
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,53 @@
+"""HTTP session construction."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .configuration import PoolConfig, Timeouts
+from .exceptions import NetworkError
+
+
+def create_session(pool: PoolConfig | None = None) -> Any:
+    # requests is imported on first use so processes that never call the API
+    # (e.g. webhook receivers) don't pay for it.
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ModuleNotFoundError as exc:  # pragma: no cover
+        raise NetworkError("requests is required unless a custom session is provided") from exc
+
+    pool = pool or PoolConfig()
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool.connections,
+        pool_maxsize=pool.maxsize,
+        pool_block=pool.block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not pool.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def create_async_session(pool: PoolConfig | None = None, timeouts: Timeouts | None = None) -> Any:
+    try:
+        import httpx
+    except ModuleNotFoundError as exc:  # pragma: no cover
+        raise RuntimeError("httpx is required unless a custom async session is provided") from exc
+
+    pool = pool or PoolConfig()
+    timeouts = timeouts or Timeouts()
+    # httpx always waits for a free connection once max_connections is reached, so a
+    # non-blocking pool is modelled as unbounded connections with maxsize kept alive.
+    limits = httpx.Limits(
+        max_connections=pool.maxsize if pool.block else None,
+        max_keepalive_connections=pool.maxsize if pool.keep_alive else 0,
+    )
+    headers = {} if pool.keep_alive else {"Connection": "close"}
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=httpx.Timeout(timeouts.read, connect=timeouts.connect),
+        headers=headers,
+    )
@@ -0,0 +1,176 @@
+"""Shareable auth token stores.
+
+An ``AuthenticationManager`` given a token store reads tokens from it before
+authenticating and writes freshly fetched tokens back, so every client using
+the same store shares one token. ``lock`` serialises refreshes: the first
+worker to find the token expired fetches it while the others wait and then
+pick up the stored result.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import ContextManager, Iterator
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenStore:
+    """Base class for token stores keyed by credential."""
+
+    def get(self, key: str) -> tuple[str, int] | None:
+        raise NotImplementedError
+
+    def set(self, key: str, token: str, expires_at: int) -> None:
+        raise NotImplementedError
+
+    def lock(self, key: str) -> ContextManager[None]:
+        raise NotImplementedError
+
+
+class MemoryTokenStore(TokenStore):
+    """Shares a token between clients in the same process."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[str, int] | None:
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: str, expires_at: int) -> None:
+        self._tokens[key] = (token, expires_at)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """Shares a token between processes on one host through a JSON file.
+
+    Writes go through an atomic rename so readers never see a partial file, and
+    refreshes are serialised with an advisory ``flock`` on ``<path>.lock``. Where
+    ``fcntl`` is unavailable the lock only covers threads of this process; use
+    ``SQLiteTokenStore`` there instead.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock_path = f"{path}.lock"
+        self._thread_lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[str, int] | None:
+        entry = self._read().get(key)
+        if not isinstance(entry, dict) or "token" not in entry or "expires_at" not in entry:
+            return None
+        return str(entry["token"]), int(entry["expires_at"])
+
+    def set(self, key: str, token: str, expires_at: int) -> None:
+        tokens = self._read()
+        tokens[key] = {"token": token, "expires_at": expires_at}
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tinker-token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(tokens, handle)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._thread_lock:
+            if fcntl is None:  # pragma: no cover
+                yield
+                return
+
+            with open(self._lock_path, "a+") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        try:
+            with open(self._path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+class SQLiteTokenStore(TokenStore):
+    """Shares a token between processes through a SQLite database.
+
+    ``lock`` holds a ``BEGIN IMMEDIATE`` transaction, which SQLite serialises
+    across processes; reads and writes made while holding it reuse that
+    transaction's connection.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tinker_tokens ("
+                "key TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at INTEGER NOT NULL)"
+            )
+
+    def get(self, key: str) -> tuple[str, int] | None:
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT token, expires_at FROM tinker_tokens WHERE key = ?", (key,)
+            ).fetchone()
+        return (str(row[0]), int(row[1])) if row else None
+
+    def set(self, key: str, token: str, expires_at: int) -> None:
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tinker_tokens (key, token, expires_at) VALUES (?, ?, ?)",
+                (key, token, expires_at),
+            )
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            self._local.connection = connection
+            try:
+                yield
+            finally:
+                self._local.connection = None
+                connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            yield connection
+            return
+
+        connection = self._connect()
+        try:
+            yield connection
+        finally:
+            connection.close()
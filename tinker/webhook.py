@@ -5,11 +5,20 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import threading
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Union
 
-from .exceptions import InvalidPayloadError
-from .models import Transaction
+from .codec import JsonCodec, default_codec
+from .dedup import DedupStats, DedupStore
+from .exceptions import DuplicateEventError, InvalidPayloadError, InvalidSignatureError
+from .models import Transaction, _Slotted
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .ledger import TransactionLedger
 
 
 @dataclass(frozen=True)
@@ -26,7 +35,9 @@ class WebhookMeta:
 
 
 @dataclass(frozen=True)
-class PaymentEventData:
+class PaymentEventData(_Slotted):
+    __slots__ = ("id", "status", "reference", "amount", "currency", "channel", "created_at", "paid_at")
+
     id: str
     status: str
     reference: str
@@ -51,7 +62,20 @@ class PaymentEventData:
 
 
 @dataclass(frozen=True)
-class SubscriptionEventData:
+class SubscriptionEventData(_Slotted):
+    __slots__ = (
+        "id",
+        "status",
+        "plan_id",
+        "account_id",
+        "current_period_start",
+        "current_period_end",
+        "created_at",
+        "cancelled_at",
+        "paused_at",
+        "reactivated_at",
+    )
+
     id: str
     status: str
     plan_id: str
@@ -83,7 +107,9 @@ class SubscriptionEventData:
 
 
 @dataclass(frozen=True)
-class InvoiceEventData:
+class InvoiceEventData(_Slotted):
+    __slots__ = ("id", "status", "invoice_number", "amount", "currency", "subscription_id", "created_at", "paid_at")
+
     id: str
     status: str
     invoice_number: str
@@ -108,7 +134,9 @@ class InvoiceEventData:
 
 
 @dataclass(frozen=True)
-class SettlementEventData:
+class SettlementEventData(_Slotted):
+    __slots__ = ("id", "status", "amount", "net_amount", "currency", "settlement_date", "created_at", "processed_at")
+
     id: str
     status: str
     amount: float
@@ -132,8 +160,37 @@ class SettlementEventData:
         )
 
 
-@dataclass(frozen=True)
-class WebhookEvent:
+_EVENT_DATA_TYPES: dict[str, Any] = {
+    "payment": PaymentEventData,
+    "subscription": SubscriptionEventData,
+    "invoice": InvoiceEventData,
+    "settlement": SettlementEventData,
+}
+
+
+@dataclass(init=False, repr=False, eq=False, frozen=True)
+class WebhookEvent(_Slotted):
+    """A webhook event whose ``data``, ``meta`` and ``security`` decode lazily.
+
+    Only the envelope fields and the raw ``data``/``meta`` dicts are stored up
+    front; the typed objects are built from them on first access and cached.
+    It is still a frozen dataclass with the original fields, so
+    ``dataclasses.asdict`` and ``dataclasses.replace`` work as before.
+    """
+
+    __slots__ = (
+        "id",
+        "type",
+        "source",
+        "timestamp",
+        "raw_data",
+        "raw_meta",
+        "_raw_security",
+        "_data",
+        "_meta",
+        "_security",
+    )
+
     id: str
     type: str
     source: str
@@ -144,42 +201,108 @@ class WebhookEvent:
     raw_data: dict[str, Any]
     raw_meta: dict[str, Any]
 
-    @classmethod
-    def from_dict(cls, payload: dict[str, Any]) -> "WebhookEvent":
-        source = str(payload.get("source", ""))
-        raw_data = payload.get("data") if isinstance(payload.get("data"), dict) else {}
-        raw_meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
-
-        if source == "payment":
-            event_data = PaymentEventData.from_dict(raw_data)
-        elif source == "subscription":
-            event_data = SubscriptionEventData.from_dict(raw_data)
-        elif source == "invoice":
-            event_data = InvoiceEventData.from_dict(raw_data)
-        elif source == "settlement":
-            event_data = SettlementEventData.from_dict(raw_data)
-        else:
+    def __init__(
+        self,
+        id: str,
+        type: str,
+        source: str,
+        timestamp: str,
+        data: PaymentEventData | SubscriptionEventData | InvoiceEventData | SettlementEventData | None = None,
+        meta: WebhookMeta | None = None,
+        security: WebhookSecurity | None = None,
+        raw_data: dict[str, Any] | None = None,
+        raw_meta: dict[str, Any] | None = None,
+        raw_security: dict[str, Any] | None = None,
+    ) -> None:
+        if data is None and source not in _EVENT_DATA_TYPES:
             raise InvalidPayloadError(f"Unknown webhook source: {source}")
 
-        security_input = payload.get("security") if isinstance(payload.get("security"), dict) else {}
+        set_attribute = object.__setattr__
+        set_attribute(self, "id", id)
+        set_attribute(self, "type", type)
+        set_attribute(self, "source", source)
+        set_attribute(self, "timestamp", timestamp)
+        set_attribute(self, "raw_data", raw_data if raw_data is not None else {})
+        set_attribute(self, "raw_meta", raw_meta if raw_meta is not None else {})
+        set_attribute(self, "_raw_security", raw_security if raw_security is not None else {})
+        set_attribute(self, "_data", data)
+        set_attribute(self, "_meta", meta)
+        set_attribute(self, "_security", security)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "WebhookEvent":
+        raw_data = payload.get("data")
+        raw_meta = payload.get("meta")
+        raw_security = payload.get("security")
 
         return cls(
             id=str(payload.get("id", "")),
             type=str(payload.get("type", "")),
-            source=source,
+            source=str(payload.get("source", "")),
             timestamp=str(payload.get("timestamp", "")),
-            data=event_data,
-            meta=WebhookMeta(
+            raw_data=raw_data if isinstance(raw_data, dict) else {},
+            raw_meta=raw_meta if isinstance(raw_meta, dict) else {},
+            raw_security=raw_security if isinstance(raw_security, dict) else {},
+        )
+
+    @property
+    def data(self) -> PaymentEventData | SubscriptionEventData | InvoiceEventData | SettlementEventData:
+        data = self._data
+        if data is None:
+            data = _EVENT_DATA_TYPES[self.source].from_dict(self.raw_data)
+            object.__setattr__(self, "_data", data)
+        return data
+
+    @property
+    def meta(self) -> WebhookMeta:
+        meta = self._meta
+        if meta is None:
+            raw_meta = self.raw_meta
+            meta = WebhookMeta(
                 version=str(raw_meta.get("version", "1.0")),
                 app_id=str(raw_meta.get("app_id", "")),
                 gateway=str(raw_meta["gateway"]) if raw_meta.get("gateway") is not None else None,
-            ),
-            security=WebhookSecurity(
-                signature=str(security_input.get("signature", "")),
-                algorithm=str(security_input.get("algorithm", "HMAC-SHA256")),
-            ),
-            raw_data=raw_data,
-            raw_meta=raw_meta,
+            )
+            object.__setattr__(self, "_meta", meta)
+        return meta
+
+    @property
+    def security(self) -> WebhookSecurity:
+        security = self._security
+        if security is None:
+            raw_security = self._raw_security
+            security = WebhookSecurity(
+                signature=str(raw_security.get("signature", "")),
+                algorithm=str(raw_security.get("algorithm", "HMAC-SHA256")),
+            )
+            object.__setattr__(self, "_security", security)
+        return security
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.type, self.source, self.timestamp))
+
+    def __repr__(self) -> str:
+        return (
+            f"WebhookEvent(id={self.id!r}, type={self.type!r}, source={self.source!r}, "
+            f"timestamp={self.timestamp!r}, data={self.data!r}, meta={self.meta!r}, security={self.security!r})"
+        )
+
+    def _key(self) -> tuple[Any, ...]:
+        return (
+            self.id,
+            self.type,
+            self.source,
+            self.timestamp,
+            self.data,
+            self.meta,
+            self.security,
+            self.raw_data,
+            self.raw_meta,
         )
 
     def to_transaction(self) -> Transaction | None:
@@ -200,52 +323,373 @@ class WebhookEvent:
         )
 
 
-class WebhookHandler:
-    def handle(self, payload: str | dict[str, Any]) -> WebhookEvent:
-        if isinstance(payload, str):
+WebhookPayload = Union[WebhookEvent, bytes, str, dict]
+EventCallback = Callable[[WebhookEvent], Any]
+
+_MAX_DISPATCH_KEYS = 1024
+
+
+class WebhookVerifier:
+    """Verifies webhook signatures against an ordered keyring of secrets.
+
+    The first secret is the active one; any others are previous secrets still
+    accepted during a rotation. Keyed HMAC state is computed once per secret and
+    copied for each verification, and the signing input is built once no matter
+    how many secrets are checked.
+    """
+
+    def __init__(self, secrets: str | Iterable[str], codec: JsonCodec | None = None) -> None:
+        if isinstance(secrets, str):
+            secrets = [secrets]
+        self._codec = codec or default_codec()
+        self._secrets = tuple(secret for secret in secrets if secret)
+        self._keys = tuple(hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256) for secret in self._secrets)
+
+    @property
+    def secrets(self) -> tuple[str, ...]:
+        return self._secrets
+
+    def match(self, payload: WebhookPayload) -> int | None:
+        """Return the keyring index of the secret that signed ``payload``, if any."""
+        if not isinstance(payload, WebhookEvent):
+            payload = _decode_payload(payload, self._codec)
+        signed = _signed_input(payload, self._codec)
+        return self._match(*signed) if signed is not None else None
+
+    def verify(self, payload: WebhookPayload) -> bool:
+        return self.match(payload) is not None
+
+    def verify_many(self, payloads: Iterable[WebhookPayload]) -> list[bool]:
+        """Verify a batch of payloads; malformed items verify as ``False``."""
+        results = []
+        for payload in payloads:
             try:
-                data = json.loads(payload)
-            except json.JSONDecodeError as exc:
-                raise InvalidPayloadError(f"Invalid JSON payload: {exc}") from exc
-        else:
-            data = payload
+                results.append(self.match(payload) is not None)
+            except InvalidPayloadError:
+                results.append(False)
+        return results
+
+    def handle(self, body: bytes | str | dict[str, Any]) -> WebhookEvent:
+        return WebhookEvent.from_dict(self.verify_decoded(_decode_payload(body, self._codec)))
+
+    def verify_decoded(self, data: dict[str, Any]) -> dict[str, Any]:
+        signed = _signed_input(data, self._codec)
+        if signed is None or self._match(*signed) is None:
+            raise InvalidSignatureError("Webhook signature verification failed")
+        return data
+
+    def _match(self, signature: str, signing_input: bytes) -> int | None:
+        try:
+            expected = bytes.fromhex(signature[7:])
+        except ValueError:
+            return None
 
-        if not isinstance(data, dict):
-            raise InvalidPayloadError("Webhook payload must be an object")
+        for index, key in enumerate(self._keys):
+            mac = key.copy()
+            mac.update(signing_input)
+            if hmac.compare_digest(mac.digest(), expected):
+                return index
+        return None
 
-        return WebhookEvent.from_dict(data)
 
-    def handle_as_transaction(self, payload: str | dict[str, Any]) -> Transaction | None:
+class WebhookHandler:
+    """Parses, verifies and routes webhook deliveries.
+
+    Callbacks registered with ``on`` are run by ``dispatch`` and ``route``.
+    ``max_parallel_handlers`` bounds the thread pool used when several
+    callbacks subscribe to one event and ``parallel=True`` is passed.
+    """
+
+    def __init__(
+        self,
+        dedup_store: DedupStore | None = None,
+        codec: JsonCodec | None = None,
+        ledger: TransactionLedger | None = None,
+        max_parallel_handlers: int = 4,
+    ) -> None:
+        self._dedup_store = dedup_store
+        self._codec = codec
+        self._ledger = ledger
+        self._dedup_lock = threading.Lock()
+        self._dedup_hits = 0
+        self._dedup_misses = 0
+        self._routes: list[tuple[str | None, str | None, EventCallback]] = []
+        # (type, source) -> callbacks, filled on first use and cleared when a route is added.
+        self._dispatch_table: dict[tuple[str, str], tuple[EventCallback, ...]] = {}
+        self._routes_lock = threading.Lock()
+        self._max_parallel_handlers = max_parallel_handlers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def handle(self, payload: bytes | str | dict[str, Any]) -> WebhookEvent:
+        return self._build_event(_decode_payload(payload, self._codec))
+
+    def handle_as_transaction(self, payload: bytes | str | dict[str, Any]) -> Transaction | None:
         event = self.handle(payload)
         return event.to_transaction()
 
+    def handle_verified(self, body: bytes | str, webhook_secret: str | WebhookVerifier) -> WebhookEvent:
+        """Verify ``body`` and only then build the typed ``WebhookEvent``.
+
+        The body is decoded once; forged payloads are rejected before any of the
+        typed event data is constructed.
+        """
+        verifier = _verifier(webhook_secret, self._codec)
+        return self._build_event(verifier.verify_decoded(_decode_payload(body, self._codec)), verified=True)
+
+    def verify_raw(self, body: bytes | str, webhook_secret: str | WebhookVerifier) -> bool:
+        if not webhook_secret:
+            return False
+
+        # Unsigned bodies can be rejected without decoding them at all.
+        marker = b'"sha256=' if isinstance(body, bytes) else '"sha256='
+        if marker not in body:
+            return False
+
+        return _verifier(webhook_secret, self._codec).verify(body)
+
     def verify_signature(
         self,
-        payload: WebhookEvent | str | dict[str, Any],
-        webhook_secret: str,
+        payload: WebhookEvent | bytes | str | dict[str, Any],
+        webhook_secret: str | WebhookVerifier,
     ) -> bool:
         if not webhook_secret:
             return False
 
-        event = payload if isinstance(payload, WebhookEvent) else self.handle(payload)
-        signature = event.security.signature
+        return _verifier(webhook_secret, self._codec).verify(payload)
+
+    def forget(self, event_id: str) -> None:
+        """Allow ``event_id`` to be handled again, e.g. after its side effects failed."""
+        if self._dedup_store is not None:
+            self._dedup_store.discard(event_id)
+
+    def dedup_stats(self) -> DedupStats:
+        return DedupStats(hits=self._dedup_hits, misses=self._dedup_misses)
+
+    def on(self, event_type: str | None = None, source: str | None = None) -> Callable[[EventCallback], EventCallback]:
+        """Decorator subscribing a callback to an event ``type``, a ``source``, or both.
+
+        With neither, the callback receives every event. Callbacks run in
+        registration order within each group: exact type first, then source,
+        then catch-all.
+        """
+
+        def register(callback: EventCallback) -> EventCallback:
+            self.add_route(callback, event_type, source)
+            return callback
+
+        return register
+
+    def add_route(self, callback: EventCallback, event_type: str | None = None, source: str | None = None) -> None:
+        with self._routes_lock:
+            self._routes.append((event_type, source, callback))
+            self._dispatch_table = {}
+
+    def dispatch(
+        self,
+        payload: bytes | str | dict[str, Any],
+        webhook_secret: str | WebhookVerifier | None = None,
+        parallel: bool = False,
+    ) -> WebhookEvent | None:
+        """Route a delivery to its subscribed callbacks.
+
+        Deliveries nobody subscribed to return ``None`` right after decoding:
+        they are not verified, deduplicated or turned into a ``WebhookEvent``.
+        Otherwise the body is verified when ``webhook_secret`` is given, the
+        event is built and passed to ``route``, and the event is returned.
+        """
+        data = _decode_payload(payload, self._codec)
+        if not self._callbacks_for(str(data.get("type", "")), str(data.get("source", ""))):
+            return None
+        if webhook_secret is not None:
+            data = _verifier(webhook_secret, self._codec).verify_decoded(data)
+        event = self._build_event(data, verified=webhook_secret is not None)
+        self.route(event, parallel)
+        return event
+
+    def route(self, event: WebhookEvent, parallel: bool = False) -> int:
+        """Run the callbacks subscribed to ``event`` and return how many ran.
+
+        With ``parallel=True`` independent callbacks run concurrently on the
+        handler's thread pool. If any callback raises, the event id is
+        forgotten by the dedup store so a redelivery is handled again, and the
+        first error is re-raised once every callback has finished.
+        """
+        callbacks = self._callbacks_for(event.type, event.source)
+        try:
+            if parallel and len(callbacks) > 1:
+                self._run_parallel(callbacks, event)
+            else:
+                for callback in callbacks:
+                    callback(event)
+        except Exception:
+            if event.id:
+                self.forget(event.id)
+            raise
+        return len(callbacks)
+
+    def close(self) -> None:
+        """Shut down the thread pool used for parallel callbacks."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _callbacks_for(self, event_type: str, source: str) -> tuple[EventCallback, ...]:
+        key = (event_type, source)
+        callbacks = self._dispatch_table.get(key)
+        if callbacks is None:
+            by_type: list[EventCallback] = []
+            by_source: list[EventCallback] = []
+            catch_all: list[EventCallback] = []
+            with self._routes_lock:
+                for route_type, route_source, callback in self._routes:
+                    if route_source is not None and route_source != source:
+                        continue
+                    if route_type == event_type:
+                        by_type.append(callback)
+                    elif route_type is None:
+                        (catch_all if route_source is None else by_source).append(callback)
+                callbacks = tuple(by_type + by_source + catch_all)
+                # Types come from unverified bodies, so keep the table from growing without bound.
+                if len(self._dispatch_table) >= _MAX_DISPATCH_KEYS:
+                    self._dispatch_table = {}
+                self._dispatch_table[key] = callbacks
+        return callbacks
+
+    def _run_parallel(self, callbacks: tuple[EventCallback, ...], event: WebhookEvent) -> None:
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with self._routes_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_parallel_handlers, thread_name_prefix="tinker-webhook-route"
+                    )
+        # The first callback runs on the calling thread while the pool runs the rest.
+        futures = [self._executor.submit(callback, event) for callback in callbacks[1:]]
+        error: BaseException | None = None
+        try:
+            callbacks[0](event)
+        except Exception as exc:  # noqa: BLE001
+            error = exc
+        for future in futures:
+            exc = future.exception()
+            if error is None and exc is not None:
+                error = exc
+        if error is not None:
+            raise error
+
+    def _build_event(self, data: dict[str, Any], verified: bool = False) -> WebhookEvent:
+        # Only verified deliveries claim their id: an unsigned body reusing a real
+        # event's id must not get the genuine delivery rejected as a duplicate.
+        event_id = str(data.get("id") or "")
+        if not verified:
+            return WebhookEvent.from_dict(data)
+        if self._dedup_store is None or not event_id:
+            return self._record(WebhookEvent.from_dict(data))
+
+        # Duplicates are dropped before any typed event data is built.
+
+        is_new = self._dedup_store.add(event_id)
+        with self._dedup_lock:
+            if is_new:
+                self._dedup_misses += 1
+            else:
+                self._dedup_hits += 1
+        if not is_new:
+            raise DuplicateEventError(f"Webhook event {event_id} was already handled")
+
+        try:
+            event = WebhookEvent.from_dict(data)
+        except Exception:
+            self._dedup_store.discard(event_id)
+            raise
+        return self._record(event)
+
+    def _record(self, event: WebhookEvent) -> WebhookEvent:
+        # Only verified events reach the ledger: a forged terminal status could never be undone.
+        if self._ledger is not None:
+            self._ledger.record_event(event)
+        return event
+
+
+def _decode_payload(payload: bytes | str | dict[str, Any], codec: JsonCodec | None = None) -> dict[str, Any]:
+    if isinstance(payload, (bytes, str)):
+        try:
+            data = (codec or default_codec()).loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise InvalidPayloadError(f"Invalid JSON payload: {exc}") from exc
+    else:
+        data = payload
+
+    if not isinstance(data, dict):
+        raise InvalidPayloadError("Webhook payload must be an object")
+
+    return data
+
+
+def _signed_input(payload: WebhookEvent | dict[str, Any], codec: JsonCodec) -> tuple[str, bytes] | None:
+    if isinstance(payload, WebhookEvent):
+        signature = payload.security.signature
         if not signature.startswith("sha256="):
-            return False
+            return None
+        return signature, _signing_input(
+            payload.id,
+            payload.type,
+            payload.source,
+            payload.timestamp,
+            payload.raw_data,
+            payload.raw_meta,
+            codec,
+        )
 
-        payload_without_security = {
-            "id": event.id,
-            "type": event.type,
-            "source": event.source,
-            "timestamp": event.timestamp,
-            "data": event.raw_data,
-            "meta": event.raw_meta,
-        }
-
-        encoded = json.dumps(payload_without_security, separators=(",", ":"), ensure_ascii=False)
-        computed = "sha256=" + hmac.new(
-            webhook_secret.encode("utf-8"),
-            encoded.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-
-        return hmac.compare_digest(signature, computed)
+    security = payload.get("security")
+    signature = str(security.get("signature", "")) if isinstance(security, dict) else ""
+    if not signature.startswith("sha256="):
+        return None
+
+    raw_data = payload.get("data")
+    raw_meta = payload.get("meta")
+    return signature, _signing_input(
+        str(payload.get("id", "")),
+        str(payload.get("type", "")),
+        str(payload.get("source", "")),
+        str(payload.get("timestamp", "")),
+        raw_data if isinstance(raw_data, dict) else {},
+        raw_meta if isinstance(raw_meta, dict) else {},
+        codec,
+    )
+
+
+def _signing_input(
+    event_id: str,
+    event_type: str,
+    source: str,
+    timestamp: str,
+    raw_data: dict[str, Any],
+    raw_meta: dict[str, Any],
+    codec: JsonCodec,
+) -> bytes:
+    payload_without_security = {
+        "id": event_id,
+        "type": event_type,
+        "source": source,
+        "timestamp": timestamp,
+        "data": raw_data,
+        "meta": raw_meta,
+    }
+    try:
+        return codec.canonical(payload_without_security)
+    except UnicodeEncodeError as exc:
+        # Lone surrogates decode from JSON escapes but have no UTF-8 form, so nothing can have signed them.
+        raise InvalidPayloadError(f"Webhook payload is not valid UTF-8: {exc}") from exc
+
+
+def _verifier(webhook_secret: str | WebhookVerifier, codec: JsonCodec | None = None) -> WebhookVerifier:
+    if isinstance(webhook_secret, WebhookVerifier):
+        return webhook_secret
+    return _cached_verifier(webhook_secret, codec)
+
+
+@lru_cache(maxsize=32)
+def _cached_verifier(webhook_secret: str, codec: JsonCodec | None = None) -> WebhookVerifier:
+    return WebhookVerifier(webhook_secret, codec)
@@ -0,0 +1,416 @@
+"""Fast-acknowledging webhook endpoints.
+
+``WebhookReceiver`` (WSGI, thread workers) and ``AsyncWebhookReceiver``
+(ASGI, asyncio workers) verify each delivery, put the ``WebhookEvent`` on a
+bounded queue and answer 200 straight away; workers then run the
+application's handler off the request path. When the queue is full the
+receiver answers 503 with ``Retry-After`` so Tinker redelivers later, and the
+event's id is released from the dedup store so the redelivery is accepted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import inspect
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+from .exceptions import DuplicateEventError, InvalidPayloadError, InvalidSignatureError
+from .instrumentation import LATENCY_BUCKETS, bucket_percentile
+from .webhook import WebhookEvent, WebhookHandler, WebhookVerifier
+
+ErrorCallback = Callable[[WebhookEvent, BaseException], None]
+
+_JSON_HEADERS = [("Content-Type", "application/json")]
+
+
+@dataclass(frozen=True)
+class ReceiverStats:
+    """Counters and processing-time histogram of a webhook receiver.
+
+    ``queue_wait`` and ``processing_time`` are totals in seconds over the
+    ``processed + failed`` events that reached a worker; ``buckets`` is their
+    processing-time histogram over ``LATENCY_BUCKETS``.
+    """
+
+    queue_depth: int
+    max_queue_depth: int
+    accepted: int
+    rejected: int
+    duplicates: int
+    shed: int
+    processed: int
+    failed: int
+    queue_wait: float
+    processing_time: float
+    max_processing_time: float
+    buckets: tuple[int, ...]
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the ``fraction`` processing-time quantile."""
+        return bucket_percentile(self.buckets, self.processed + self.failed, self.max_processing_time, fraction)
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(0.50)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(0.99)
+
+
+class _ReceiverBase:
+    def __init__(
+        self,
+        handler: Callable[[WebhookEvent], Any],
+        webhook_secret: str | Iterable[str] | WebhookVerifier,
+        webhook_handler: WebhookHandler | None = None,
+        max_queue: int = 1000,
+        workers: int = 4,
+        retry_after: int = 5,
+        max_body_size: int = 1024 * 1024,
+        on_error: ErrorCallback | None = None,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._handler = handler
+        if not isinstance(webhook_secret, WebhookVerifier):
+            webhook_secret = WebhookVerifier(webhook_secret)
+        self._verifier = webhook_secret
+        self._webhooks = webhook_handler if webhook_handler is not None else WebhookHandler()
+        self._max_queue = max_queue
+        self._workers = workers
+        self._retry_after = retry_after
+        self._max_body_size = max_body_size
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._max_depth = 0
+        self._accepted = 0
+        self._rejected = 0
+        self._duplicates = 0
+        self._shed = 0
+        self._processed = 0
+        self._failed = 0
+        self._queue_wait = 0.0
+        self._processing_time = 0.0
+        self._max_processing_time = 0.0
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        # Created by start(): a queue.Queue and threads, or an asyncio.Queue and tasks.
+        self._queue: Any = None
+        self._running: list[Any] = []
+
+    def stats(self) -> ReceiverStats:
+        with self._lock:
+            return ReceiverStats(
+                queue_depth=self._depth,
+                max_queue_depth=self._max_depth,
+                accepted=self._accepted,
+                rejected=self._rejected,
+                duplicates=self._duplicates,
+                shed=self._shed,
+                processed=self._processed,
+                failed=self._failed,
+                queue_wait=self._queue_wait,
+                processing_time=self._processing_time,
+                max_processing_time=self._max_processing_time,
+                buckets=tuple(self._buckets),
+            )
+
+    def _verify(self, body: bytes) -> tuple[int, WebhookEvent | None]:
+        """Verify and build the event; return the status to answer when it must not be queued."""
+        if len(body) > self._max_body_size:
+            self._count("_rejected")
+            return 413, None
+        try:
+            event = self._webhooks.handle_verified(body, self._verifier)
+        except InvalidSignatureError:
+            self._count("_rejected")
+            return 401, None
+        except InvalidPayloadError:
+            self._count("_rejected")
+            return 400, None
+        except DuplicateEventError:
+            self._count("_duplicates")
+            return 200, None
+
+        # Typed data decodes lazily; decode it now so a 200 means the event is usable.
+        try:
+            event.data
+        except (ValueError, TypeError):
+            self._webhooks.forget(event.id)
+            self._count("_rejected")
+            return 400, None
+        return 200, event
+
+    def _response(self, status: int) -> tuple[int, list[tuple[str, str]], bytes]:
+        headers = list(_JSON_HEADERS)
+        if status == 503:
+            headers.append(("Retry-After", str(self._retry_after)))
+        body = json.dumps({"received": status == 200}).encode("utf-8")
+        return status, headers, body
+
+    def _enqueued(self) -> None:
+        with self._lock:
+            self._accepted += 1
+            self._depth += 1
+            self._max_depth = max(self._max_depth, self._depth)
+
+    def _shed_event(self, event: WebhookEvent) -> None:
+        # Release the id so Tinker's redelivery isn't rejected as a duplicate.
+        self._webhooks.forget(event.id)
+        self._count("_shed")
+
+    def _dequeued(self, enqueued_at: float) -> float:
+        now = time.perf_counter()
+        with self._lock:
+            self._depth -= 1
+            self._queue_wait += now - enqueued_at
+        return now
+
+    def _finished(self, event: WebhookEvent, started: float, error: BaseException | None) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if error is None:
+                self._processed += 1
+            else:
+                self._failed += 1
+            self._processing_time += elapsed
+            self._max_processing_time = max(self._max_processing_time, elapsed)
+            self._buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        if error is not None and self._on_error is not None:
+            self._on_error(event, error)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class WebhookReceiver(_ReceiverBase):
+    """WSGI webhook endpoint drained by ``workers`` threads.
+
+    Mount the instance as a WSGI app, or call ``receive(body)`` from an
+    existing view and return its status, headers and body. ``handler`` is
+    called with each verified ``WebhookEvent`` on a worker thread; failures
+    are counted and passed to ``on_error(event, exc)``. Workers start with
+    the first delivery; ``close()`` drains the queue and stops them.
+    """
+
+    def __enter__(self) -> WebhookReceiver:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable[..., Any]) -> list[bytes]:
+        if environ.get("REQUEST_METHOD") != "POST":
+            start_response("405 Method Not Allowed", [("Allow", "POST")])
+            return [b""]
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length > self._max_body_size:
+            status, headers, body = self._response(413)
+            self._count("_rejected")
+        else:
+            status, headers, body = self.receive(environ["wsgi.input"].read(length) if length else b"")
+        start_response(f"{status} {_REASONS[status]}", headers)
+        return [body]
+
+    def receive(self, body: bytes) -> tuple[int, list[tuple[str, str]], bytes]:
+        """Verify and enqueue one delivery; return the response status, headers and body."""
+        status, event = self._verify(body)
+        if event is None:
+            return self._response(status)
+
+        if not self._running:
+            self.start()
+        try:
+            self._queue.put_nowait((event, time.perf_counter()))
+        except queue.Full:
+            self._shed_event(event)
+            return self._response(503)
+        self._enqueued()
+        return self._response(200)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=self._max_queue)
+            self._running = [
+                threading.Thread(target=self._work, name=f"tinker-webhook-worker-{index}", daemon=True)
+                for index in range(self._workers)
+            ]
+            for thread in self._running:
+                thread.start()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Process the queued events, then stop the workers."""
+        with self._lock:
+            threads, self._running = self._running, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            event, enqueued_at = item
+            started = self._dequeued(enqueued_at)
+            try:
+                self._handler(event)
+            except Exception as exc:  # noqa: BLE001
+                self._finished(event, started, exc)
+            else:
+                self._finished(event, started, None)
+
+
+class AsyncWebhookReceiver(_ReceiverBase):
+    """ASGI webhook endpoint drained by ``workers`` asyncio tasks.
+
+    ``handler`` may be a coroutine function, or a plain function, which then
+    runs in the loop's default executor. Verification, which may write to a
+    SQLite dedup store or event ledger, runs in that executor too, so it
+    never blocks the event loop. Workers start on the ASGI lifespan
+    ``startup`` event, or with the first delivery; ``close()`` (also run on
+    lifespan ``shutdown``) drains the queue and stops them.
+    """
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope.get("method") != "POST":
+            await _send_response(send, 405, [("Allow", "POST")], b"")
+            return
+
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self._max_body_size:
+                self._count("_rejected")
+                await _send_response(send, *self._response(413))
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        await _send_response(send, *(await self.receive(b"".join(chunks))))
+
+    async def receive(self, body: bytes) -> tuple[int, list[tuple[str, str]], bytes]:
+        """Verify and enqueue one delivery; return the response status, headers and body."""
+        loop = asyncio.get_running_loop()
+        status, event = await loop.run_in_executor(None, self._verify, body)
+        if event is None:
+            return self._response(status)
+
+        if not self._running:
+            self.start()
+        try:
+            self._queue.put_nowait((event, time.perf_counter()))
+        except asyncio.QueueFull:
+            await loop.run_in_executor(None, self._shed_event, event)
+            return self._response(503)
+        self._enqueued()
+        return self._response(200)
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if self._running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+        self._running = [asyncio.ensure_future(self._work()) for _ in range(self._workers)]
+
+    async def close(self) -> None:
+        """Process the queued events, then stop the workers."""
+        tasks, self._running = self._running, []
+        if self._queue is None:
+            return
+        for _ in tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*tasks)
+
+    async def _lifespan(
+        self,
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        is_async = inspect.iscoroutinefunction(self._handler)
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            event, enqueued_at = item
+            started = self._dequeued(enqueued_at)
+            try:
+                if is_async:
+                    await self._handler(event)
+                else:
+                    await loop.run_in_executor(None, self._handler, event)
+            except Exception as exc:  # noqa: BLE001
+                self._finished(event, started, exc)
+            else:
+                self._finished(event, started, None)
+
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+async def _send_response(
+    send: Callable[[dict[str, Any]], Awaitable[None]],
+    status: int,
+    headers: list[tuple[str, str]],
+    body: bytes,
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})